@@ -25,14 +25,10 @@ import hashlib
 import os
 
 from nuitka import Options
+from nuitka.importing.DirectoryIndex import getIndexedFilenames
 from nuitka.importing.Importing import getPackageSearchPath, isPackageDir
 from nuitka.utils.AppDirs import getCacheDir
-from nuitka.utils.FileOperations import (
-    getFileContents,
-    listDir,
-    makePath,
-    openTextFile,
-)
+from nuitka.utils.FileOperations import getFileContents, makePath, openTextFile
 from nuitka.utils.Importing import getAllModuleSuffixes
 from nuitka.utils.ModuleNames import ModuleName
 
@@ -108,11 +104,10 @@ def getModuleImportableFilesHash(full_name):
     result_hash = hashlib.md5()
 
     for count, path in enumerate(paths):
-        if not os.path.isdir(path):
-            continue
-
-        for fullname, filename in listDir(path):
-            if isPackageDir(fullname) or filename.endswith(all_suffixes):
+        for filename in getIndexedFilenames(path):
+            if filename.endswith(all_suffixes) or isPackageDir(
+                os.path.join(path, filename)
+            ):
                 entry = "%s:%s" % (count, filename)
 
                 if str is not bytes:
@@ -35,7 +35,7 @@ from nuitka.freezer.IncludedEntryPoints import (
     getStandaloneEntryPoints,
     setMainEntryPoint,
 )
-from nuitka.freezer.Standalone import copyDataFiles
+from nuitka.freezer.Standalone import copyDataFiles, getEmbeddedDataFiles
 from nuitka.importing import Importing, Recursion
 from nuitka.Options import hasPythonFlagNoAsserts, hasPythonFlagNoWarnings
 from nuitka.plugins.Plugins import Plugins
@@ -678,7 +678,16 @@ def compileTree():
 
     general.info("Running data composer tool for optimal constant value handling.")
 
-    blob_filename = runDataComposer(source_dir)
+    if Options.getShallEmbedDataFilePatterns():
+        embedded_data_files = getEmbeddedDataFiles(
+            dist_dir=OutputDirectories.getStandaloneDirectoryPath()
+        )
+    else:
+        embedded_data_files = ()
+
+    blob_filename = runDataComposer(
+        source_dir=source_dir, embedded_data_files=embedded_data_files
+    )
     Plugins.onDataComposerResult(blob_filename)
 
     for filename, source_code in Plugins.getExtraCodeFiles().items():
@@ -29,7 +29,6 @@ import os
 
 from nuitka.containers.oset import OrderedSet
 from nuitka.PythonVersions import python_version
-from nuitka.utils.FileOperations import areSamePaths
 
 # One or more root modules, i.e. entry points that must be there.
 root_modules = OrderedSet()
@@ -43,6 +42,24 @@ done_modules = set()
 # Uncompiled modules
 uncompiled_modules = set()
 
+# Uncompiled modules by name, and then normalized filename, for fast lookups.
+uncompiled_modules_index = {}
+
+# Modules not changed by the last pass, and not using changed modules, that
+# need not be optimized again.
+unchanged_modules = set()
+
+# Modules, and functions of other modules, used by modules when they were last
+# optimized, so they can be used again without optimizing.
+module_uses = {}
+
+# Modules, and functions of other modules, used by earlier optimizations of
+# modules in the current pass.
+earlier_module_uses = {}
+
+# Module currently being optimized.
+current_module = None
+
 
 def addRootModule(module):
     root_modules.add(module)
@@ -83,6 +100,10 @@ def replaceRootModule(old, new):
 def addUncompiledModule(module):
     uncompiled_modules.add(module)
 
+    uncompiled_modules_index.setdefault(module.getFullName(), {})[
+        _getModuleFilenameKey(module.filename)
+    ] = module
+
 
 def getUncompiledModules():
     return sorted(uncompiled_modules, key=lambda module: module.getFullName())
@@ -118,21 +139,37 @@ def _normalizeModuleFilename(filename):
     return filename
 
 
+def _getModuleFilenameKey(filename):
+    # Same normalization as "areSamePaths" does, making it a mere string
+    # compare.
+    filename = _normalizeModuleFilename(filename)
+
+    return os.path.normcase(os.path.abspath(os.path.normpath(filename)))
+
+
 def getUncompiledModule(module_name, module_filename):
-    for uncompiled_module in uncompiled_modules:
-        if module_name == uncompiled_module.getFullName():
-            if areSamePaths(
-                _normalizeModuleFilename(module_filename),
-                _normalizeModuleFilename(uncompiled_module.filename),
-            ):
-                return uncompiled_module
+    by_filename = uncompiled_modules_index.get(module_name)
 
-    return None
+    if by_filename is None:
+        return None
+
+    return by_filename.get(_getModuleFilenameKey(module_filename))
 
 
 def removeUncompiledModule(module):
     uncompiled_modules.remove(module)
 
+    by_filename = uncompiled_modules_index.get(module.getFullName(), {})
+    key = _getModuleFilenameKey(module.filename)
+
+    # Another module of the same name and filename may have replaced it in the
+    # index, which then stays.
+    if by_filename.get(key) is module:
+        del by_filename[key]
+
+        if not by_filename:
+            del uncompiled_modules_index[module.getFullName()]
+
 
 def startTraversal():
     # Using global here, as this is really a singleton, in the form of a module,
@@ -143,14 +180,88 @@ def startTraversal():
     done_modules = set()
 
     for active_module in active_modules:
-        active_module.startTraversal()
+        if active_module not in unchanged_modules:
+            active_module.startTraversal()
 
 
-def addUsedModule(module):
+def _addUsedModule(module):
     if module not in done_modules and module not in active_modules:
         active_modules.add(module)
 
-        module.startTraversal()
+        # Unchanged modules keep what they used last time.
+        if module not in unchanged_modules:
+            module.startTraversal()
+
+
+def addUsedModule(module):
+    if current_module is not None:
+        module_uses[current_module][0].add(module)
+
+    _addUsedModule(module)
+
+
+def addUsedFunction(function_body):
+    """Use a function, and the module owning it."""
+
+    owning_module = function_body.getParentModule()
+
+    if current_module is not None and owning_module is not current_module:
+        module_uses[current_module][1].add(function_body)
+
+    _addUsedModule(owning_module)
+
+
+def startModuleUses(module, repeated):
+    """Start recording what a module uses, while it is being optimized.
+
+    Args:
+        module: the module to be optimized
+        repeated: if it was optimized before in this pass already
+    """
+
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global current_module
+    current_module = module
+
+    if repeated:
+        for earlier_uses, uses in zip(earlier_module_uses[module], module_uses[module]):
+            earlier_uses.update(uses)
+    else:
+        earlier_module_uses[module] = set(), set()
+
+    module_uses[module] = OrderedSet(), OrderedSet()
+
+
+def endModuleUses():
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global current_module
+    current_module = None
+
+
+def hasDroppedModuleUses(module):
+    """Did earlier optimizations of a module in this pass use more."""
+
+    for earlier_uses, uses in zip(earlier_module_uses[module], module_uses[module]):
+        if not earlier_uses.issubset(uses):
+            return True
+
+    return False
+
+
+def repeatModuleUses(module):
+    """Use again what an unchanged module used when last optimized."""
+
+    used_modules, used_functions = module_uses[module]
+
+    for used_module in used_modules:
+        addUsedModule(used_module)
+
+    for function_body in used_functions:
+        _addUsedModule(function_body.getParentModule())
+
+        function_body.getParentModule().addUsedFunction(function_body)
 
 
 def nextModule():
@@ -207,8 +318,61 @@ def getModuleByName(module_name):
         if module.getFullName() == module_name:
             return module
 
-    for module in uncompiled_modules:
-        if module.getFullName() == module_name:
-            return module
+    by_filename = uncompiled_modules_index.get(module_name)
+
+    if by_filename:
+        return next(iter(by_filename.values()))
 
     return None
+
+
+def isUnchangedModule(module):
+    return module in unchanged_modules
+
+
+def _getModulesNeedingOptimization(changed_modules):
+    needed_modules = set(changed_modules)
+
+    # Changed modules may not use functions of other modules anymore, which
+    # the owning modules only notice when optimized.
+    for module in changed_modules:
+        if module in module_uses:
+            needed_modules.update(
+                function_body.getParentModule()
+                for function_body in module_uses[module][1]
+            )
+
+    for module in done_modules:
+        if module in module_uses and module not in needed_modules:
+            if any(
+                used_module in changed_modules for used_module in module_uses[module][0]
+            ):
+                needed_modules.add(module)
+
+    return needed_modules
+
+
+def updateUnchangedModules(changed_modules):
+    """Decide the modules to not optimize again after a pass.
+
+    Args:
+        changed_modules: modules not known to be at a fixed point after the
+            pass, or None to optimize all modules again
+    """
+
+    unchanged_modules.clear()
+
+    if changed_modules is None:
+        return
+
+    needed_modules = _getModulesNeedingOptimization(changed_modules)
+
+    for module in done_modules:
+        if module in module_uses and module not in needed_modules:
+            unchanged_modules.add(module)
+
+
+def markModuleChanged(module):
+    """Make a module changed after a pass, and its users, optimized again."""
+
+    unchanged_modules.difference_update(_getModulesNeedingOptimization((module,)))
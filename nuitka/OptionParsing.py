@@ -407,6 +407,21 @@ for plain copy, of the whole directory. All files are copied, if you want to
 exclude files you need to remove them beforehand. Default empty.""",
 )
 
+data_group.add_option(
+    "--embed-data-files",
+    action="append",
+    dest="embed_data_files",
+    metavar="PATTERN",
+    default=[],
+    help="""\
+Embed included data files, whose target path in the distribution matches the
+given pattern, into the binary rather than copying them. These are served by
+the loader "get_data" and "importlib.resources" without file access, but code
+that opens them by filename will not find them. An example would be
+'--embed-data-files=certifi/*.pem'. Can be given multiple times. Default
+empty.""",
+)
+
 data_files_tags = [("inhibit", "do not include the file")]
 
 # TODO: Expose this when finished, pylint: disable=using-constant-test
@@ -515,6 +530,61 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is.""",
 )
 
+codegen_group.add_option(
+    "--remove-unused-definitions",
+    action="store_true",
+    dest="remove_unused_definitions",
+    default=False,
+    help="""\
+Remove functions and classes defined on module level, that are not referenced
+by name anywhere in the program, before generating code for them. Access by
+names computed at run time, e.g. with "getattr", from extension modules, or
+by unpickling, is not seen, use "--keep-definition" for these. Modules of
+the standard library are not changed. Defaults to off.""",
+)
+
+codegen_group.add_option(
+    "--keep-definition",
+    action="append",
+    dest="keep_definitions",
+    metavar="PATTERN",
+    default=[],
+    help="""\
+Keep module level definitions matching the pattern, given as module name and
+definition name, e.g. "some_package.some_module.some_function", or all
+definitions of modules matching it, when removing unused definitions. Can be
+given multiple times. Default empty.""",
+)
+
+codegen_group.add_option(
+    "--cross-module-optimization",
+    action="store_true",
+    dest="cross_module_optimization",
+    default=False,
+    help="""\
+Use module variables, that the whole program assigns only once, on the top
+level of their module, as their value in other modules and in functions, e.g.
+constants imported with "from module import name", and the result types of
+such functions. Changes of module attributes with names computed at run time,
+e.g. with "setattr", from extension modules, or through the "__dict__" of the
+module, are not seen. Defaults to off.""",
+)
+
+codegen_group.add_option(
+    "--trust-type-annotations",
+    action="store_true",
+    dest="trust_type_annotations",
+    default=False,
+    help="""\
+Trust annotations of function parameters with built-in types, e.g. "int",
+"str", or "list[int]", and optimize a second copy of the function body for
+them. That copy is used when the parameters have exactly these types, which
+is checked once when the function is called, other values, e.g. instances
+of sub-classes, use the unchanged code. Annotations "float" and "complex",
+which allow "int" values too, and names the module binds to other values
+are not trusted. Defaults to off.""",
+)
+
 parser.add_option_group(codegen_group)
 
 output_group = OptionGroup(parser, "Output choices")
@@ -360,6 +360,11 @@ standalone where there is a sane default used inside the dist folder."""
             "Error, data files are only included in standalone or onefile mode."
         )
 
+    if options.embed_data_files and not isStandaloneMode():
+        Tracing.options_logger.sysexit(
+            "Error, data files can only be embedded in standalone or onefile mode."
+        )
+
     for pattern in getShallFollowExtraFilePatterns():
         if os.path.isdir(pattern):
             Tracing.options_logger.sysexit(
@@ -657,6 +662,11 @@ def getShallIncludeDataDirs():
         yield src, dest
 
 
+def getShallEmbedDataFilePatterns():
+    """*list*, items of "--embed-data-files=" """
+    return sum([_splitShellPattern(x) for x in options.embed_data_files], [])
+
+
 def shallWarnImplicitRaises():
     """*bool* = "--warn-implicit-exceptions" """
     return options.warn_implicit_exceptions
@@ -1296,3 +1306,23 @@ def shallPersistModifications():
 def isLowMemory():
     """*bool* low memory usage requested"""
     return options.low_memory
+
+
+def shallRemoveUnusedDefinitions():
+    """*bool* = "--remove-unused-definitions" """
+    return options.remove_unused_definitions
+
+
+def getKeptDefinitionPatterns():
+    """*list*, items of "--keep-definition=" """
+    return sum([_splitShellPattern(x) for x in options.keep_definitions], [])
+
+
+def shallOptimizeCrossModule():
+    """*bool* = "--cross-module-optimization" """
+    return options.cross_module_optimization
+
+
+def shallTrustTypeAnnotations():
+    """*bool* = "--trust-type-annotations" """
+    return options.trust_type_annotations
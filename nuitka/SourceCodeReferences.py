@@ -19,6 +19,9 @@
 
 All the information to lookup line and file of a code location, together with
 the future flags in use there.
+
+Source code references are immutable, and there are one or more per node, so
+equal ones are shared, and so are their filenames.
 """
 
 from nuitka.__past__ import total_ordering
@@ -28,6 +31,12 @@ from nuitka.utils.InstanceCounters import (
     isCountingInstances,
 )
 
+# Shared source code references, by class, filename, line, and column.
+_source_refs = {}
+
+# Shared filenames, such that only one copy of each is kept.
+_filenames = {}
+
 
 @total_ordering
 class SourceCodeReference(object):
@@ -35,21 +44,28 @@ class SourceCodeReference(object):
 
     @classmethod
     def fromFilenameAndLine(cls, filename, line):
-        result = cls()
+        return cls._fromFilenameAndLineAndColumn(filename, line, None)
 
-        result.filename = filename
-        result.line = line
+    @classmethod
+    def _fromFilenameAndLineAndColumn(cls, filename, line, column):
+        key = cls, filename, line, column
 
-        return result
+        try:
+            return _source_refs[key]
+        except KeyError:
+            filename = _filenames.setdefault(filename, filename)
+
+            result = _source_refs[key] = cls(filename, line, column)
+            return result
 
     if isCountingInstances():
         __del__ = counted_del()
 
     @counted_init
-    def __init__(self):
-        self.filename = None
-        self.line = None
-        self.column = None
+    def __init__(self, filename, line, column):
+        self.filename = filename
+        self.line = line
+        self.column = column
 
     def __repr__(self):
         return "<%s to %s:%s>" % (self.__class__.__name__, self.filename, self.line)
@@ -108,6 +124,12 @@ class SourceCodeReference(object):
         """Make a copy it itself."""
         return self.fromFilenameAndLine(filename=self.filename, line=line)
 
+    def _cloneWithColumn(self, column):
+        """Make a copy of itself with a column."""
+        return self._fromFilenameAndLineAndColumn(
+            filename=self.filename, line=self.line, column=column
+        )
+
     def atInternal(self):
         """Make a copy it itself but mark as internal code.
 
@@ -139,9 +161,7 @@ class SourceCodeReference(object):
         assert type(column) is int, column
 
         if self.column != column:
-            result = self._clone(self.line)
-            result.column = column
-            return result
+            return self._cloneWithColumn(column)
         else:
             return self
 
@@ -18,6 +18,7 @@
 """ Interface to data composer
 
 """
+import json
 import os
 import subprocess
 import sys
@@ -26,7 +27,7 @@ from nuitka.Options import isExperimental
 from nuitka.utils.Execution import withEnvironmentVarsOverriden
 
 
-def runDataComposer(source_dir):
+def runDataComposer(source_dir, embedded_data_files):
     data_composer_path = os.path.normpath(
         os.path.join(os.path.dirname(__file__), "..", "tools", "data_composer")
     )
@@ -42,6 +43,11 @@ def runDataComposer(source_dir):
 
     blob_filename = getConstantBlobFilename(source_dir)
 
+    embedded_data_files_filename = getEmbeddedDataFilesIndexFilename(source_dir)
+
+    with open(embedded_data_files_filename, "w") as index_file:
+        json.dump(list(embedded_data_files), index_file)
+
     with withEnvironmentVarsOverriden(mapping):
         subprocess.check_call(
             [
@@ -49,6 +55,7 @@ def runDataComposer(source_dir):
                 data_composer_path,
                 source_dir,
                 blob_filename,
+                embedded_data_files_filename,
             ],
             shell=False,
         )
@@ -60,6 +67,10 @@ def getConstantBlobFilename(source_dir):
     return os.path.join(source_dir, "__constants.bin")
 
 
+def getEmbeddedDataFilesIndexFilename(source_dir):
+    return os.path.join(source_dir, "__embedded_data_files.json")
+
+
 def deriveModuleConstantsBlobName(filename):
     assert filename.endswith(".const")
 
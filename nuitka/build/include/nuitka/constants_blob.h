@@ -31,4 +31,12 @@
 
 extern void loadConstantsBlob(PyObject **, char const *name);
 
+/** Embedded data files, stored after the checked part of the blob.
+ *
+ * This is a count, followed by entries of a zero terminated name, a size,
+ * and the data itself, sorted by name. The name is the path relative to
+ * the binary directory, with "/" as separator.
+ */
+extern unsigned char const *getEmbeddedDataFilesSection(void);
+
 #endif
@@ -53,4 +53,30 @@ NUITKA_MAY_BE_UNUSED static bool SEQUENCE_SETITEM(PyObject *sequence, Py_ssize_t
     }
 }
 
+// Check for an element in items, the same as "in" with a list or tuple made of
+// them, but without creating the container.
+NUITKA_MAY_BE_UNUSED static int SEQUENCE_CONTAINS_ITEMS(PyObject *element, PyObject **items, Py_ssize_t size) {
+    CHECK_OBJECT(element);
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        PyObject *item = items[i];
+        CHECK_OBJECT(item);
+
+        // The comparison may run code, keep the item alive for it.
+        Py_INCREF(item);
+#if PYTHON_VERSION >= 0x390
+        int res = PyObject_RichCompareBool(item, element, Py_EQ);
+#else
+        int res = PyObject_RichCompareBool(element, item, Py_EQ);
+#endif
+        Py_DECREF(item);
+
+        if (res != 0) {
+            return res;
+        }
+    }
+
+    return 0;
+}
+
 #endif
@@ -317,6 +317,16 @@ extern Py_hash_t HASH_VALUE_WITH_ERROR(PyObject *value);
 extern PyObject *BUILTIN_SUM1(PyObject *sequence);
 extern PyObject *BUILTIN_SUM2(PyObject *sequence, PyObject *start);
 
+// For built-in sorted() functionality.
+extern PyObject *BUILTIN_SORTED1(PyObject *iterable);
+extern PyObject *BUILTIN_SORTED3(PyObject *iterable, PyObject *key, PyObject *reverse);
+
+// For built-in min() and max() functionality, without "key" and "default".
+extern PyObject *BUILTIN_MIN1(PyObject *iterable);
+extern PyObject *BUILTIN_MIN2(PyObject *value1, PyObject *value2);
+extern PyObject *BUILTIN_MAX1(PyObject *iterable);
+extern PyObject *BUILTIN_MAX2(PyObject *value1, PyObject *value2);
+
 // For built-in built-in abs() functionality.
 extern PyObject *BUILTIN_ABS(PyObject *o);
 
@@ -565,6 +565,144 @@ PyObject *BUILTIN_ITER2(PyObject *callable, PyObject *sentinel) {
     return (PyObject *)result;
 }
 
+/** The "sorted" built-in.
+ *
+ * The result is a new list, sorted in place, which is what the built-in
+ * does too, but without the argument parsing.
+ **/
+
+PyObject *BUILTIN_SORTED1(PyObject *iterable) {
+    PyObject *result = PySequence_List(iterable);
+
+    if (unlikely(result == NULL)) {
+        return NULL;
+    }
+
+    if (unlikely(PyList_Sort(result) == -1)) {
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    return result;
+}
+
+PyObject *BUILTIN_SORTED3(PyObject *iterable, PyObject *key, PyObject *reverse) {
+    PyObject *result = PySequence_List(iterable);
+
+    if (unlikely(result == NULL)) {
+        return NULL;
+    }
+
+    PyObject *sort_method = PyObject_GetAttrString(result, "sort");
+
+    if (unlikely(sort_method == NULL)) {
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    // Only keyword arguments, these are optional.
+    PyObject *args[] = {NULL, key, reverse};
+    char const *arg_names[] = {NULL, "key", "reverse"};
+
+    PyObject *sort_result = CALL_BUILTIN_KW_ARGS(sort_method, args, arg_names, 3);
+
+    Py_DECREF(sort_method);
+
+    if (unlikely(sort_result == NULL)) {
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    Py_DECREF(sort_result);
+
+    return result;
+}
+
+/** The "min" and "max" built-ins.
+ *
+ * Without "key" and "default" arguments, these either iterate a single
+ * argument, or compare two values, for more values the code generation
+ * chains the two value variant, which gives the same comparison order.
+ **/
+
+static PyObject *_BUILTIN_MIN_MAX1(PyObject *iterable, int op, char const *name) {
+    PyObject *iterator = PyObject_GetIter(iterable);
+
+    if (unlikely(iterator == NULL)) {
+        return NULL;
+    }
+
+    PyObject *result = NULL;
+
+    for (;;) {
+        PyObject *item = PyIter_Next(iterator);
+
+        if (item == NULL) {
+            break;
+        }
+
+        if (result == NULL) {
+            result = item;
+            continue;
+        }
+
+        int res = PyObject_RichCompareBool(item, result, op);
+
+        if (unlikely(res < 0)) {
+            Py_DECREF(item);
+            Py_DECREF(result);
+            Py_DECREF(iterator);
+
+            return NULL;
+        }
+
+        if (res > 0) {
+            Py_DECREF(result);
+            result = item;
+        } else {
+            Py_DECREF(item);
+        }
+    }
+
+    Py_DECREF(iterator);
+
+    if (unlikely(ERROR_OCCURRED())) {
+        Py_XDECREF(result);
+        return NULL;
+    }
+
+    if (unlikely(result == NULL)) {
+        SET_CURRENT_EXCEPTION_TYPE0_FORMAT1(PyExc_ValueError, "%s() arg is an empty sequence", name);
+        return NULL;
+    }
+
+    return result;
+}
+
+static PyObject *_BUILTIN_MIN_MAX2(PyObject *value1, PyObject *value2, int op) {
+    CHECK_OBJECT(value1);
+    CHECK_OBJECT(value2);
+
+    int res = PyObject_RichCompareBool(value2, value1, op);
+
+    if (unlikely(res < 0)) {
+        return NULL;
+    }
+
+    PyObject *result = res > 0 ? value2 : value1;
+    Py_INCREF(result);
+
+    return result;
+}
+
+PyObject *BUILTIN_MIN1(PyObject *iterable) { return _BUILTIN_MIN_MAX1(iterable, Py_LT, "min"); }
+
+PyObject *BUILTIN_MIN2(PyObject *value1, PyObject *value2) { return _BUILTIN_MIN_MAX2(value1, value2, Py_LT); }
+
+PyObject *BUILTIN_MAX1(PyObject *iterable) { return _BUILTIN_MIN_MAX1(iterable, Py_GT, "max"); }
+
+PyObject *BUILTIN_MAX2(PyObject *value1, PyObject *value2) { return _BUILTIN_MIN_MAX2(value1, value2, Py_GT); }
+
 /** The "type" built-in.
  *
  * This comes in two flavors, one being the detection of a values type,
@@ -1116,7 +1116,11 @@ static void unpackBlobConstants(PyObject **output, unsigned char const *data) {
     _unpackBlobConstants(output, data, count);
 }
 
-void loadConstantsBlob(PyObject **output, char const *name) {
+// Size of the checked part of the constants blob, what follows are embedded
+// data files.
+static uint32_t constant_bin_size = 0;
+
+static void initConstantsBlob(void) {
     static bool init_done = false;
 
     if (init_done == false) {
@@ -1153,8 +1157,20 @@ void loadConstantsBlob(PyObject **output, char const *name) {
         PRINT_FORMAT("Checked CRC32 to match hash %u size %u\n", hash, size);
 #endif
 
+        constant_bin_size = size;
+
         init_done = true;
     }
+}
+
+unsigned char const *getEmbeddedDataFilesSection(void) {
+    initConstantsBlob();
+
+    return constant_bin + constant_bin_size;
+}
+
+void loadConstantsBlob(PyObject **output, char const *name) {
+    initConstantsBlob();
 
 #ifdef _NUITKA_EXPERIMENTAL_DEBUG_CONSTANTS
     PRINT_FORMAT("Loading blob named '%s' with %d values\n", name, count);
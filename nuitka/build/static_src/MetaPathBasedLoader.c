@@ -539,6 +539,137 @@ static PyObject *_path_unfreezer_find_module(PyObject *self, PyObject *args, PyO
     return Py_None;
 }
 
+#if defined(_NUITKA_STANDALONE)
+// Data files embedded into the binary, see "getEmbeddedDataFilesSection" for
+// the layout. They are served from the binary image without any copies other
+// than the one made for the result objects.
+struct Nuitka_EmbeddedDataFile {
+    char const *name;
+    unsigned char const *data;
+    uint32_t size;
+};
+
+static struct Nuitka_EmbeddedDataFile *embedded_data_files = NULL;
+static uint32_t embedded_data_files_count = 0;
+
+static void initEmbeddedDataFiles(void) {
+    static bool init_done = false;
+
+    if (init_done) {
+        return;
+    }
+
+    init_done = true;
+
+    unsigned char const *w = getEmbeddedDataFilesSection();
+
+    memcpy(&embedded_data_files_count, w, sizeof(uint32_t));
+    w += sizeof(uint32_t);
+
+    if (embedded_data_files_count == 0) {
+        return;
+    }
+
+    embedded_data_files =
+        (struct Nuitka_EmbeddedDataFile *)malloc(sizeof(struct Nuitka_EmbeddedDataFile) * embedded_data_files_count);
+
+    for (uint32_t i = 0; i < embedded_data_files_count; i++) {
+        embedded_data_files[i].name = (char const *)w;
+        w += strlen((char const *)w) + 1;
+
+        memcpy(&embedded_data_files[i].size, w, sizeof(uint32_t));
+        w += sizeof(uint32_t);
+
+        embedded_data_files[i].data = w;
+        w += embedded_data_files[i].size;
+    }
+}
+
+// Index of the first embedded data file, with a name not sorting before the
+// given one, they are sorted by name.
+static uint32_t findEmbeddedDataFileIndex(char const *name) {
+    uint32_t low = 0;
+    uint32_t high = embedded_data_files_count;
+
+    while (low < high) {
+        uint32_t middle = low + (high - low) / 2;
+
+        if (strcmp(embedded_data_files[middle].name, name) < 0) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+
+    return low;
+}
+
+static struct Nuitka_EmbeddedDataFile const *findEmbeddedDataFile(char const *name) {
+    initEmbeddedDataFiles();
+
+    uint32_t index = findEmbeddedDataFileIndex(name);
+
+    if (index < embedded_data_files_count && strcmp(embedded_data_files[index].name, name) == 0) {
+        return &embedded_data_files[index];
+    }
+
+    return NULL;
+}
+
+static struct Nuitka_EmbeddedDataFile const *findEmbeddedDataFileByFilename(PyObject *filename) {
+    initEmbeddedDataFiles();
+
+    if (embedded_data_files_count == 0 || !Nuitka_String_Check(filename)) {
+        return NULL;
+    }
+
+    static char const *prefix = NULL;
+    static size_t prefix_length = 0;
+
+    if (prefix == NULL) {
+        PyObject *prefix_object = MAKE_RELATIVE_PATH(const_str_empty);
+
+        prefix = strdup(Nuitka_String_AsString(prefix_object));
+        prefix_length = strlen(prefix);
+
+        Py_DECREF(prefix_object);
+    }
+
+    char const *filename_str = Nuitka_String_AsString(filename);
+
+    if (unlikely(filename_str == NULL)) {
+        CLEAR_ERROR_OCCURRED();
+        return NULL;
+    }
+
+    if (strncmp(filename_str, prefix, prefix_length) != 0) {
+        return NULL;
+    }
+
+    char name[MAXPATHLEN + 1];
+
+    if (strlen(filename_str + prefix_length) >= sizeof(name)) {
+        return NULL;
+    }
+
+    copyStringSafe(name, filename_str + prefix_length, sizeof(name));
+
+#ifdef _WIN32
+    for (char *c = name; *c != 0; c++) {
+        if (*c == SEP) {
+            *c = '/';
+        }
+    }
+#endif
+
+    return findEmbeddedDataFile(name);
+}
+
+static PyObject *makeEmbeddedDataFileBytes(struct Nuitka_EmbeddedDataFile const *embedded_data_file) {
+    return PyBytes_FromStringAndSize((char const *)embedded_data_file->data, embedded_data_file->size);
+}
+#endif
+
 static char const *_kwlist_get_data[] = {"filename", NULL};
 
 static PyObject *_path_unfreezer_get_data(PyObject *self, PyObject *args, PyObject *kwds) {
@@ -550,6 +681,14 @@ static PyObject *_path_unfreezer_get_data(PyObject *self, PyObject *args, PyObje
         return NULL;
     }
 
+#if defined(_NUITKA_STANDALONE)
+    struct Nuitka_EmbeddedDataFile const *embedded_data_file = findEmbeddedDataFileByFilename(filename);
+
+    if (embedded_data_file != NULL) {
+        return makeEmbeddedDataFileBytes(embedded_data_file);
+    }
+#endif
+
 #if PYTHON_VERSION < 0x300
     PyObject *data_file = BUILTIN_OPEN(filename, const_str_plain_rb, NULL);
 #else
@@ -1492,6 +1631,827 @@ static PyObject *_path_unfreezer_find_distributions(PyObject *self, PyObject *ar
 
 #endif
 
+#if defined(_NUITKA_STANDALONE) && PYTHON_VERSION >= 0x370
+
+static char const *_kwlist_open_resource[] = {"resource", NULL};
+static char const *_kwlist_is_resource[] = {"name", NULL};
+static char const *_kwlist_read_text[] = {"encoding", NULL};
+
+// Name of a resource of a package relative to the binary directory, with "/"
+// as separator, for an empty resource name that of the package directory. The
+// prefix of names of contained resources is made with "add_slash".
+static bool getResourceName(struct Nuitka_MetaPathBasedLoaderEntry const *entry, char const *resource, bool add_slash,
+                            char *buffer, size_t buffer_size) {
+    copyStringSafe(buffer, entry->name, buffer_size);
+
+    for (char *c = buffer; *c != 0; c++) {
+        if (*c == '.') {
+            *c = '/';
+        }
+    }
+
+    if (strlen(buffer) + strlen(resource) + 2 >= buffer_size) {
+        return false;
+    }
+
+    if (*resource != 0) {
+        appendCharSafe(buffer, '/', buffer_size);
+        appendStringSafe(buffer, resource, buffer_size);
+    }
+
+    if (add_slash) {
+        appendCharSafe(buffer, '/', buffer_size);
+    }
+
+    return true;
+}
+
+static char const *getResourceString(PyObject *resource) {
+    char const *resource_str = Nuitka_String_AsString(resource);
+
+    if (unlikely(resource_str == NULL)) {
+        CLEAR_ERROR_OCCURRED();
+    }
+
+    return resource_str;
+}
+
+static struct Nuitka_EmbeddedDataFile const *
+findResourceEmbeddedDataFile(struct Nuitka_MetaPathBasedLoaderEntry const *entry, PyObject *resource) {
+    char const *resource_str = getResourceString(resource);
+
+    if (unlikely(resource_str == NULL)) {
+        return NULL;
+    }
+
+    char name[MAXPATHLEN + 1];
+
+    if (!getResourceName(entry, resource_str, false, name, sizeof(name))) {
+        return NULL;
+    }
+
+    return findEmbeddedDataFile(name);
+}
+
+static bool isResourceEmbeddedDirectory(struct Nuitka_MetaPathBasedLoaderEntry const *entry, PyObject *resource) {
+    char const *resource_str = getResourceString(resource);
+
+    if (unlikely(resource_str == NULL)) {
+        return false;
+    }
+
+    char prefix[MAXPATHLEN + 1];
+
+    if (!getResourceName(entry, resource_str, true, prefix, sizeof(prefix))) {
+        return false;
+    }
+
+    initEmbeddedDataFiles();
+
+    uint32_t index = findEmbeddedDataFileIndex(prefix);
+
+    return index < embedded_data_files_count && strncmp(embedded_data_files[index].name, prefix, strlen(prefix)) == 0;
+}
+
+static PyObject *getResourceDirectory(struct Nuitka_MetaPathBasedLoaderEntry const *entry) {
+    char buffer[MAXPATHLEN + 1] = {0};
+    appendModulenameAsPath(buffer, entry->name, sizeof(buffer));
+
+    PyObject *package_directory_base = Nuitka_String_FromString(buffer);
+    PyObject *result = MAKE_RELATIVE_PATH(package_directory_base);
+    Py_DECREF(package_directory_base);
+
+    return result;
+}
+
+static PyObject *getResourceFilename(struct Nuitka_MetaPathBasedLoaderEntry const *entry, PyObject *resource) {
+    PyObject *package_directory = getResourceDirectory(entry);
+    PyObject *result = JOIN_PATH2(package_directory, resource);
+    Py_DECREF(package_directory);
+
+    return result;
+}
+
+// Call a function of "os.path" on a filename, returning -1 on error.
+static int checkResourceReaderPath(char const *function_name, PyObject *filename) {
+    PyObject *os_path = PyObject_GetAttrString(IMPORT_HARD_OS(), "path");
+
+    if (unlikely(os_path == NULL)) {
+        return -1;
+    }
+
+    PyObject *check_function = PyObject_GetAttrString(os_path, function_name);
+    Py_DECREF(os_path);
+
+    if (unlikely(check_function == NULL)) {
+        return -1;
+    }
+
+    PyObject *result = CALL_FUNCTION_WITH_SINGLE_ARG(check_function, filename);
+    Py_DECREF(check_function);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = CHECK_IF_TRUE(result);
+    Py_DECREF(result);
+
+    return res;
+}
+
+// Check a resource with a function of "os.path", returning -1 on error.
+static int checkResourcePath(struct Nuitka_MetaPathBasedLoaderEntry const *entry, char const *function_name,
+                             PyObject *resource) {
+    PyObject *filename = getResourceFilename(entry, resource);
+    int res = checkResourceReaderPath(function_name, filename);
+    Py_DECREF(filename);
+
+    return res;
+}
+
+static PyObject *getResourceIoModuleAttribute(char const *attribute_name) {
+    static PyObject *io_module = NULL;
+
+    if (io_module == NULL) {
+        io_module = PyImport_ImportModule("io");
+
+        if (unlikely(io_module == NULL)) {
+            return NULL;
+        }
+    }
+
+    return PyObject_GetAttrString(io_module, attribute_name);
+}
+
+// Open a resource, like "open" does with a mode and further arguments, but
+// for embedded data files, text is only decoded.
+static PyObject *openResource(struct Nuitka_MetaPathBasedLoaderEntry const *entry, PyObject *resource, PyObject *mode,
+                              PyObject *args, PyObject *kwds) {
+    char const *mode_str = Nuitka_String_AsString(mode);
+
+    if (unlikely(mode_str == NULL)) {
+        return NULL;
+    }
+
+    struct Nuitka_EmbeddedDataFile const *embedded_data_file = findResourceEmbeddedDataFile(entry, resource);
+    PyObject *result;
+
+    if (embedded_data_file != NULL) {
+        PyObject *bytes_io_class = getResourceIoModuleAttribute("BytesIO");
+
+        if (unlikely(bytes_io_class == NULL)) {
+            return NULL;
+        }
+
+        PyObject *data = makeEmbeddedDataFileBytes(embedded_data_file);
+        result = CALL_FUNCTION_WITH_SINGLE_ARG(bytes_io_class, data);
+        Py_DECREF(data);
+        Py_DECREF(bytes_io_class);
+
+        if (result == NULL || strchr(mode_str, 'b') != NULL) {
+            return result;
+        }
+
+        PyObject *text_io_class = getResourceIoModuleAttribute("TextIOWrapper");
+
+        if (unlikely(text_io_class == NULL)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+
+        PyObject *wrapper_args = PyTuple_New(1);
+        PyTuple_SET_ITEM(wrapper_args, 0, result);
+
+        if (args != NULL) {
+            PyObject *all_args = PySequence_Concat(wrapper_args, args);
+            Py_DECREF(wrapper_args);
+            wrapper_args = all_args;
+        }
+
+        result = wrapper_args != NULL ? PyObject_Call(text_io_class, wrapper_args, kwds) : NULL;
+        Py_XDECREF(wrapper_args);
+        Py_DECREF(text_io_class);
+
+        return result;
+    }
+
+    PyObject *open_function = getResourceIoModuleAttribute("open");
+
+    if (unlikely(open_function == NULL)) {
+        return NULL;
+    }
+
+    PyObject *open_args = PyTuple_New(2);
+    PyTuple_SET_ITEM(open_args, 0, getResourceFilename(entry, resource));
+    Py_INCREF(mode);
+    PyTuple_SET_ITEM(open_args, 1, mode);
+
+    if (args != NULL) {
+        PyObject *all_args = PySequence_Concat(open_args, args);
+        Py_DECREF(open_args);
+        open_args = all_args;
+    }
+
+    result = open_args != NULL ? PyObject_Call(open_function, open_args, kwds) : NULL;
+    Py_XDECREF(open_args);
+    Py_DECREF(open_function);
+
+    return result;
+}
+
+// Read the contents of an opened file, and close it.
+static PyObject *readResourceFile(PyObject *file) {
+    if (unlikely(file == NULL)) {
+        return NULL;
+    }
+
+    PyObject *result = PyObject_CallMethod(file, (char *)"read", NULL);
+
+    if (result != NULL) {
+        PyObject *close_result = PyObject_CallMethod(file, (char *)"close", NULL);
+
+        if (unlikely(close_result == NULL)) {
+            Py_DECREF(result);
+            result = NULL;
+        } else {
+            Py_DECREF(close_result);
+        }
+    }
+
+    Py_DECREF(file);
+
+    return result;
+}
+
+// Names of the embedded data files and directories containing them, and of
+// the files in the directory, of a resource directory.
+static PyObject *getResourceContents(struct Nuitka_MetaPathBasedLoaderEntry const *entry, PyObject *resource) {
+    char const *resource_str = Nuitka_String_AsString(resource);
+
+    if (unlikely(resource_str == NULL)) {
+        return NULL;
+    }
+
+    PyObject *names = PySet_New(NULL);
+
+    if (unlikely(names == NULL)) {
+        return NULL;
+    }
+
+    char prefix[MAXPATHLEN + 1];
+
+    if (getResourceName(entry, resource_str, true, prefix, sizeof(prefix))) {
+        size_t prefix_length = strlen(prefix);
+
+        initEmbeddedDataFiles();
+
+        for (uint32_t i = findEmbeddedDataFileIndex(prefix); i < embedded_data_files_count; i++) {
+            char const *name = embedded_data_files[i].name;
+
+            if (strncmp(name, prefix, prefix_length) != 0) {
+                break;
+            }
+
+            name += prefix_length;
+
+            char const *slash = strchr(name, '/');
+
+            PyObject *item =
+                slash != NULL ? PyUnicode_FromStringAndSize(name, slash - name) : PyUnicode_FromString(name);
+
+            if (unlikely(item == NULL)) {
+                Py_DECREF(names);
+                return NULL;
+            }
+
+            int res = PySet_Add(names, item);
+            Py_DECREF(item);
+
+            if (unlikely(res == -1)) {
+                Py_DECREF(names);
+                return NULL;
+            }
+        }
+    }
+
+    PyObject *directory = getResourceFilename(entry, resource);
+
+    int res = checkResourceReaderPath("isdir", directory);
+
+    if (res == 1) {
+        PyObject *listdir_function = PyObject_GetAttrString(IMPORT_HARD_OS(), "listdir");
+        PyObject *filenames = NULL;
+
+        if (likely(listdir_function != NULL)) {
+            filenames = CALL_FUNCTION_WITH_SINGLE_ARG(listdir_function, directory);
+            Py_DECREF(listdir_function);
+        }
+
+        if (unlikely(filenames == NULL)) {
+            res = -1;
+        } else {
+            res = _PySet_Update(names, filenames);
+            Py_DECREF(filenames);
+        }
+    }
+
+    Py_DECREF(directory);
+
+    if (unlikely(res == -1)) {
+        Py_DECREF(names);
+        return NULL;
+    }
+
+    PyObject *result = PySequence_List(names);
+    Py_DECREF(names);
+
+    if (likely(result != NULL)) {
+        PyList_Sort(result);
+    }
+
+    return result;
+}
+
+// Traversable for "importlib.resources.files", of embedded data files of a
+// package, and otherwise files from the package directory.
+struct Nuitka_ResourceReaderFilesObject {
+    /* Python object folklore: */
+    PyObject_HEAD;
+
+    /* The loader entry, to know the package this is about. */
+    struct Nuitka_MetaPathBasedLoaderEntry const *m_loader_entry;
+
+    /* Path relative to the package directory, with "/" as separator, and
+       empty for the package directory itself. */
+    PyObject *m_path;
+};
+
+static PyTypeObject Nuitka_ResourceReaderFiles_Type;
+
+static PyObject *Nuitka_ResourceReaderFiles_New(struct Nuitka_MetaPathBasedLoaderEntry const *entry, PyObject *path) {
+    struct Nuitka_ResourceReaderFilesObject *result;
+
+    result = PyObject_New(struct Nuitka_ResourceReaderFilesObject, &Nuitka_ResourceReaderFiles_Type);
+
+    result->m_loader_entry = entry;
+
+    Py_INCREF(path);
+    result->m_path = path;
+
+    return (PyObject *)result;
+}
+
+static void Nuitka_ResourceReaderFiles_tp_dealloc(struct Nuitka_ResourceReaderFilesObject *files) {
+    Py_DECREF(files->m_path);
+
+    PyObject_Del(files);
+}
+
+static PyObject *Nuitka_ResourceReaderFiles_tp_repr(struct Nuitka_ResourceReaderFilesObject *files) {
+    return PyUnicode_FromFormat("<nuitka_resource_reader_files for '%s' path '%U'>", files->m_loader_entry->name,
+                                files->m_path);
+}
+
+static PyObject *getResourceReaderFilesChild(struct Nuitka_ResourceReaderFilesObject *files, PyObject *name) {
+    if (unlikely(!PyUnicode_Check(name))) {
+        SET_CURRENT_EXCEPTION_TYPE0_STR(PyExc_TypeError, "resource names must be str");
+        return NULL;
+    }
+
+    PyObject *path;
+
+    if (PyUnicode_GET_LENGTH(files->m_path) == 0) {
+        path = name;
+        Py_INCREF(path);
+    } else {
+        path = PyUnicode_FromFormat("%U/%U", files->m_path, name);
+    }
+
+    PyObject *result = Nuitka_ResourceReaderFiles_New(files->m_loader_entry, path);
+    Py_DECREF(path);
+
+    return result;
+}
+
+static PyObject *_nuitka_resource_reader_files_joinpath(struct Nuitka_ResourceReaderFilesObject *files,
+                                                        PyObject *args) {
+    Py_INCREF(files);
+    PyObject *result = (PyObject *)files;
+
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(args); i++) {
+        PyObject *child =
+            getResourceReaderFilesChild((struct Nuitka_ResourceReaderFilesObject *)result, PyTuple_GET_ITEM(args, i));
+        Py_DECREF(result);
+
+        if (unlikely(child == NULL)) {
+            return NULL;
+        }
+
+        result = child;
+    }
+
+    return result;
+}
+
+static PyObject *Nuitka_ResourceReaderFiles_nb_true_divide(PyObject *files, PyObject *name) {
+    if (Py_TYPE(files) != &Nuitka_ResourceReaderFiles_Type) {
+        Py_INCREF(Py_NotImplemented);
+        return Py_NotImplemented;
+    }
+
+    return getResourceReaderFilesChild((struct Nuitka_ResourceReaderFilesObject *)files, name);
+}
+
+static PyObject *_nuitka_resource_reader_files_iterdir(struct Nuitka_ResourceReaderFilesObject *files) {
+    PyObject *names = getResourceContents(files->m_loader_entry, files->m_path);
+
+    if (unlikely(names == NULL)) {
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(names); i++) {
+        PyObject *child = getResourceReaderFilesChild(files, PyList_GET_ITEM(names, i));
+
+        if (unlikely(child == NULL)) {
+            Py_DECREF(names);
+            return NULL;
+        }
+
+        PyList_SetItem(names, i, child);
+    }
+
+    PyObject *result = MAKE_ITERATOR(names);
+    Py_DECREF(names);
+
+    return result;
+}
+
+static PyObject *_nuitka_resource_reader_files_is_dir(struct Nuitka_ResourceReaderFilesObject *files) {
+    if (PyUnicode_GET_LENGTH(files->m_path) == 0 || isResourceEmbeddedDirectory(files->m_loader_entry, files->m_path)) {
+        Py_INCREF(Py_True);
+        return Py_True;
+    }
+
+    int res = checkResourcePath(files->m_loader_entry, "isdir", files->m_path);
+
+    if (unlikely(res == -1)) {
+        return NULL;
+    }
+
+    PyObject *result = BOOL_FROM(res == 1);
+    Py_INCREF(result);
+    return result;
+}
+
+static PyObject *_nuitka_resource_reader_files_is_file(struct Nuitka_ResourceReaderFilesObject *files) {
+    if (findResourceEmbeddedDataFile(files->m_loader_entry, files->m_path) != NULL) {
+        Py_INCREF(Py_True);
+        return Py_True;
+    }
+
+    int res = checkResourcePath(files->m_loader_entry, "isfile", files->m_path);
+
+    if (unlikely(res == -1)) {
+        return NULL;
+    }
+
+    PyObject *result = BOOL_FROM(res == 1);
+    Py_INCREF(result);
+    return result;
+}
+
+static PyObject *_nuitka_resource_reader_files_open(struct Nuitka_ResourceReaderFilesObject *files, PyObject *args,
+                                                    PyObject *kwds) {
+    Py_ssize_t arg_count = PyTuple_GET_SIZE(args);
+
+    PyObject *mode = arg_count > 0 ? PyTuple_GET_ITEM(args, 0) : NULL;
+    PyObject *open_kwds = NULL;
+
+    // The mode may also be given as keyword argument.
+    if (kwds != NULL) {
+        open_kwds = PyDict_Copy(kwds);
+
+        if (unlikely(open_kwds == NULL)) {
+            return NULL;
+        }
+
+        PyObject *mode_kwd = PyDict_GetItemString(open_kwds, "mode");
+
+        if (mode_kwd != NULL) {
+            if (unlikely(mode != NULL)) {
+                Py_DECREF(open_kwds);
+
+                SET_CURRENT_EXCEPTION_TYPE0_STR(PyExc_TypeError, "open() got multiple values for argument 'mode'");
+                return NULL;
+            }
+
+            mode = mode_kwd;
+        }
+    }
+
+    if (mode == NULL) {
+        mode = PyUnicode_FromString("r");
+    } else {
+        Py_INCREF(mode);
+    }
+
+    if (open_kwds != NULL && PyDict_GetItemString(open_kwds, "mode") != NULL) {
+        PyDict_DelItemString(open_kwds, "mode");
+    }
+
+    PyObject *open_args = PyTuple_GetSlice(args, arg_count > 0 ? 1 : 0, arg_count);
+
+    PyObject *result = openResource(files->m_loader_entry, files->m_path, mode, open_args, open_kwds);
+
+    Py_DECREF(open_args);
+    Py_XDECREF(open_kwds);
+    Py_DECREF(mode);
+
+    return result;
+}
+
+static PyObject *_nuitka_resource_reader_files_read_bytes(struct Nuitka_ResourceReaderFilesObject *files) {
+    struct Nuitka_EmbeddedDataFile const *embedded_data_file =
+        findResourceEmbeddedDataFile(files->m_loader_entry, files->m_path);
+
+    if (embedded_data_file != NULL) {
+        return makeEmbeddedDataFileBytes(embedded_data_file);
+    }
+
+    return readResourceFile(openResource(files->m_loader_entry, files->m_path, const_str_plain_rb, NULL, NULL));
+}
+
+static PyObject *_nuitka_resource_reader_files_read_text(struct Nuitka_ResourceReaderFilesObject *files, PyObject *args,
+                                                         PyObject *kwds) {
+    PyObject *encoding = Py_None;
+
+    int res = PyArg_ParseTupleAndKeywords(args, kwds, "|O:read_text", (char **)_kwlist_read_text, &encoding);
+
+    if (unlikely(res == 0)) {
+        return NULL;
+    }
+
+    PyObject *mode = PyUnicode_FromString("r");
+    PyObject *open_kwds = PyDict_New();
+    PyDict_SetItemString(open_kwds, "encoding", encoding);
+
+    PyObject *result = readResourceFile(openResource(files->m_loader_entry, files->m_path, mode, NULL, open_kwds));
+
+    Py_DECREF(open_kwds);
+    Py_DECREF(mode);
+
+    return result;
+}
+
+static PyObject *Nuitka_ResourceReaderFiles_get_name(struct Nuitka_ResourceReaderFilesObject *files) {
+    char const *path = Nuitka_String_AsString(files->m_path);
+
+    if (unlikely(path == NULL)) {
+        return NULL;
+    }
+
+    // The package directory is named like the last part of the package name.
+    if (*path == 0) {
+        path = files->m_loader_entry->name;
+
+        char const *dot = strrchr(path, '.');
+
+        return PyUnicode_FromString(dot != NULL ? dot + 1 : path);
+    }
+
+    char const *slash = strrchr(path, '/');
+
+    return PyUnicode_FromString(slash != NULL ? slash + 1 : path);
+}
+
+static PyMethodDef Nuitka_ResourceReaderFiles_methods[] = {
+    {"iterdir", (PyCFunction)_nuitka_resource_reader_files_iterdir, METH_NOARGS, NULL},
+    {"is_dir", (PyCFunction)_nuitka_resource_reader_files_is_dir, METH_NOARGS, NULL},
+    {"is_file", (PyCFunction)_nuitka_resource_reader_files_is_file, METH_NOARGS, NULL},
+    {"joinpath", (PyCFunction)_nuitka_resource_reader_files_joinpath, METH_VARARGS, NULL},
+    {"open", (PyCFunction)_nuitka_resource_reader_files_open, METH_VARARGS | METH_KEYWORDS, NULL},
+    {"read_bytes", (PyCFunction)_nuitka_resource_reader_files_read_bytes, METH_NOARGS, NULL},
+    {"read_text", (PyCFunction)_nuitka_resource_reader_files_read_text, METH_VARARGS | METH_KEYWORDS, NULL},
+    {NULL, NULL}};
+
+static PyGetSetDef Nuitka_ResourceReaderFiles_getset[] = {
+    {(char *)"name", (getter)Nuitka_ResourceReaderFiles_get_name, NULL, NULL}, {NULL}};
+
+// Only division, as "/" is used to join paths.
+static PyNumberMethods Nuitka_ResourceReaderFiles_as_number;
+
+static PyTypeObject Nuitka_ResourceReaderFiles_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "nuitka_resource_reader_files",
+    sizeof(struct Nuitka_ResourceReaderFilesObject),   /* tp_basicsize */
+    0,                                                 /* tp_itemsize */
+    (destructor)Nuitka_ResourceReaderFiles_tp_dealloc, /* tp_dealloc */
+    0,                                                 /* tp_print */
+    0,                                                 /* tp_getattr */
+    0,                                                 /* tp_setattr */
+    0,                                                 /* tp_reserved */
+    (reprfunc)Nuitka_ResourceReaderFiles_tp_repr,      /* tp_repr */
+    &Nuitka_ResourceReaderFiles_as_number,             /* tp_as_number */
+    0,                                                 /* tp_as_sequence */
+    0,                                                 /* tp_as_mapping */
+    0,                                                 /* tp_hash */
+    0,                                                 /* tp_call */
+    0,                                                 /* tp_str */
+    PyObject_GenericGetAttr,                           /* tp_getattro */
+    0,                                                 /* tp_setattro */
+    0,                                                 /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                                /* tp_flags */
+    0,                                                 /* tp_doc */
+    0,                                                 /* tp_traverse */
+    0,                                                 /* tp_clear */
+    0,                                                 /* tp_richcompare */
+    0,                                                 /* tp_weaklistoffset */
+    0,                                                 /* tp_iter */
+    0,                                                 /* tp_iternext */
+    Nuitka_ResourceReaderFiles_methods,                /* tp_methods */
+    0,                                                 /* tp_members */
+    Nuitka_ResourceReaderFiles_getset,                 /* tp_getset */
+};
+
+// Resource reader for "importlib.resources", serving embedded data files of a
+// package, and otherwise files from the package directory. It references no
+// objects, so it need not take part in garbage collection.
+struct Nuitka_ResourceReaderObject {
+    /* Python object folklore: */
+    PyObject_HEAD;
+
+    /* The loader entry, to know the package this is about. */
+    struct Nuitka_MetaPathBasedLoaderEntry const *m_loader_entry;
+};
+
+static void Nuitka_ResourceReader_tp_dealloc(struct Nuitka_ResourceReaderObject *reader) { PyObject_Del(reader); }
+
+static PyObject *Nuitka_ResourceReader_tp_repr(struct Nuitka_ResourceReaderObject *reader) {
+    return PyUnicode_FromFormat("<nuitka_resource_reader for '%s'>", reader->m_loader_entry->name);
+}
+
+static PyObject *_nuitka_resource_reader_open_resource(struct Nuitka_ResourceReaderObject *reader, PyObject *args,
+                                                       PyObject *kwds) {
+    PyObject *resource;
+
+    int res = PyArg_ParseTupleAndKeywords(args, kwds, "O:open_resource", (char **)_kwlist_open_resource, &resource);
+
+    if (unlikely(res == 0)) {
+        return NULL;
+    }
+
+    return openResource(reader->m_loader_entry, resource, const_str_plain_rb, NULL, NULL);
+}
+
+static PyObject *_nuitka_resource_reader_resource_path(struct Nuitka_ResourceReaderObject *reader, PyObject *args,
+                                                       PyObject *kwds) {
+    PyObject *resource;
+
+    int res = PyArg_ParseTupleAndKeywords(args, kwds, "O:resource_path", (char **)_kwlist_open_resource, &resource);
+
+    if (unlikely(res == 0)) {
+        return NULL;
+    }
+
+    // Embedded data files have no file system path, the caller is expected
+    // to use "open_resource" then.
+    if (findResourceEmbeddedDataFile(reader->m_loader_entry, resource) != NULL) {
+        SET_CURRENT_EXCEPTION_TYPE0_STR(PyExc_FileNotFoundError, "embedded resource has no file system path");
+        return NULL;
+    }
+
+    PyObject *filename = getResourceFilename(reader->m_loader_entry, resource);
+
+    res = checkResourceReaderPath("isfile", filename);
+
+    if (res != 1) {
+        Py_DECREF(filename);
+
+        if (res == 0) {
+            SET_CURRENT_EXCEPTION_TYPE0_STR(PyExc_FileNotFoundError, "resource not found");
+        }
+
+        return NULL;
+    }
+
+    return filename;
+}
+
+static PyObject *_nuitka_resource_reader_is_resource(struct Nuitka_ResourceReaderObject *reader, PyObject *args,
+                                                     PyObject *kwds) {
+    PyObject *resource;
+
+    int res = PyArg_ParseTupleAndKeywords(args, kwds, "O:is_resource", (char **)_kwlist_is_resource, &resource);
+
+    if (unlikely(res == 0)) {
+        return NULL;
+    }
+
+    if (findResourceEmbeddedDataFile(reader->m_loader_entry, resource) != NULL) {
+        Py_INCREF(Py_True);
+        return Py_True;
+    }
+
+    res = checkResourcePath(reader->m_loader_entry, "isfile", resource);
+
+    if (unlikely(res == -1)) {
+        return NULL;
+    }
+
+    PyObject *result = BOOL_FROM(res == 1);
+    Py_INCREF(result);
+    return result;
+}
+
+static PyObject *_nuitka_resource_reader_contents(struct Nuitka_ResourceReaderObject *reader) {
+    return getResourceContents(reader->m_loader_entry, const_str_empty);
+}
+
+static PyObject *_nuitka_resource_reader_files(struct Nuitka_ResourceReaderObject *reader) {
+    return Nuitka_ResourceReaderFiles_New(reader->m_loader_entry, const_str_empty);
+}
+
+static PyMethodDef Nuitka_ResourceReader_methods[] = {
+    {"open_resource", (PyCFunction)_nuitka_resource_reader_open_resource, METH_VARARGS | METH_KEYWORDS, NULL},
+    {"resource_path", (PyCFunction)_nuitka_resource_reader_resource_path, METH_VARARGS | METH_KEYWORDS, NULL},
+    {"is_resource", (PyCFunction)_nuitka_resource_reader_is_resource, METH_VARARGS | METH_KEYWORDS, NULL},
+    {"contents", (PyCFunction)_nuitka_resource_reader_contents, METH_NOARGS, NULL},
+    {"files", (PyCFunction)_nuitka_resource_reader_files, METH_NOARGS, NULL},
+    {NULL, NULL}};
+
+static PyTypeObject Nuitka_ResourceReader_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "nuitka_resource_reader",
+    sizeof(struct Nuitka_ResourceReaderObject),   /* tp_basicsize */
+    0,                                            /* tp_itemsize */
+    (destructor)Nuitka_ResourceReader_tp_dealloc, /* tp_dealloc */
+    0,                                            /* tp_print */
+    0,                                            /* tp_getattr */
+    0,                                            /* tp_setattr */
+    0,                                            /* tp_reserved */
+    (reprfunc)Nuitka_ResourceReader_tp_repr,      /* tp_repr */
+    0,                                            /* tp_as_number */
+    0,                                            /* tp_as_sequence */
+    0,                                            /* tp_as_mapping */
+    0,                                            /* tp_hash */
+    0,                                            /* tp_call */
+    0,                                            /* tp_str */
+    PyObject_GenericGetAttr,                      /* tp_getattro */
+    0,                                            /* tp_setattro */
+    0,                                            /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                           /* tp_flags */
+    0,                                            /* tp_doc */
+    0,                                            /* tp_traverse */
+    0,                                            /* tp_clear */
+    0,                                            /* tp_richcompare */
+    0,                                            /* tp_weaklistoffset */
+    0,                                            /* tp_iter */
+    0,                                            /* tp_iternext */
+    Nuitka_ResourceReader_methods,                /* tp_methods */
+    0,                                            /* tp_members */
+    0,                                            /* tp_getset */
+};
+
+static PyObject *Nuitka_ResourceReader_New(struct Nuitka_MetaPathBasedLoaderEntry const *entry) {
+    struct Nuitka_ResourceReaderObject *result;
+
+    result = PyObject_New(struct Nuitka_ResourceReaderObject, &Nuitka_ResourceReader_Type);
+
+    result->m_loader_entry = entry;
+
+    return (PyObject *)result;
+}
+
+static char const *_kwlist_get_resource_reader[] = {"fullname", NULL};
+
+static PyObject *_path_unfreezer_get_resource_reader(PyObject *self, PyObject *args, PyObject *kwds) {
+    PyObject *module_name;
+
+    int res = PyArg_ParseTupleAndKeywords(args, kwds, "O:get_resource_reader", (char **)_kwlist_get_resource_reader,
+                                          &module_name);
+
+    if (unlikely(res == 0)) {
+        return NULL;
+    }
+
+    char const *name = Nuitka_String_AsString(module_name);
+
+    if (unlikely(name == NULL)) {
+        return NULL;
+    }
+
+    struct Nuitka_MetaPathBasedLoaderEntry *entry = findEntry(name);
+
+    // Only packages can have resources.
+    if (entry == NULL || (entry->flags & NUITKA_PACKAGE_FLAG) == 0) {
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+
+    return Nuitka_ResourceReader_New(entry);
+}
+
+#endif
+
 static PyMethodDef Nuitka_Loader_methods[] = {
     {"iter_modules", (PyCFunction)_path_unfreezer_iter_modules, METH_VARARGS | METH_KEYWORDS, NULL},
     {"get_data", (PyCFunction)_path_unfreezer_get_data, METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
@@ -1506,6 +2466,10 @@ static PyMethodDef Nuitka_Loader_methods[] = {
     {"create_module", (PyCFunction)_path_unfreezer_create_module, METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
     {"exec_module", (PyCFunction)_path_unfreezer_exec_module, METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
 #endif
+#if defined(_NUITKA_STANDALONE) && PYTHON_VERSION >= 0x370
+    {"get_resource_reader", (PyCFunction)_path_unfreezer_get_resource_reader,
+     METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
+#endif
 #if _NUITKA_EXPERIMENTAL_METADATA
     {"find_distributions", (PyCFunction)_path_unfreezer_find_distributions, METH_STATIC | METH_VARARGS | METH_KEYWORDS,
      NULL},
@@ -1642,6 +2606,13 @@ void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loa
     PyType_Ready(&Nuitka_Distribution_Type);
 #endif
 
+#if defined(_NUITKA_STANDALONE) && PYTHON_VERSION >= 0x370
+    PyType_Ready(&Nuitka_ResourceReader_Type);
+
+    Nuitka_ResourceReaderFiles_as_number.nb_true_divide = Nuitka_ResourceReaderFiles_nb_true_divide;
+    PyType_Ready(&Nuitka_ResourceReaderFiles_Type);
+#endif
+
     // Register it as a meta path loader.
     int res = PyList_Insert(Nuitka_SysGetObject("meta_path"),
 #if PYTHON_VERSION < 0x300
@@ -26,6 +26,7 @@ from nuitka.PythonVersions import python_version
 from .CodeHelpers import (
     decideConversionCheckNeeded,
     generateChildExpressionsCode,
+    generateExpressionCode,
     withObjectCodeTemporaryAssignment,
 )
 from .ErrorCodes import (
@@ -33,7 +34,7 @@ from .ErrorCodes import (
     getErrorExitBoolCode,
     getErrorExitCode,
 )
-from .PythonAPICodes import generateCAPIObjectCode
+from .PythonAPICodes import generateCAPIObjectCode, getCAPIObjectCode
 
 
 def generateBuiltinAbsCode(to_name, expression, emit, context):
@@ -435,3 +436,197 @@ def generateBuiltinClassmethodCode(to_name, expression, emit, context):
         emit=emit,
         context=context,
     )
+
+
+def _generateBuiltinTypeCallCode(
+    to_name, type_name, arg_expressions, expression, emit, context
+):
+    # Calling the built-in type directly, avoiding the built-in name lookup.
+    from .CallCodes import getCallCodeNoArgs, getCallCodePosArgsQuick
+
+    arg_names = []
+
+    for arg_expression in arg_expressions:
+        arg_name = context.allocateTempName("%s_arg" % type_name)
+
+        generateExpressionCode(
+            to_name=arg_name, expression=arg_expression, emit=emit, context=context
+        )
+
+        arg_names.append(arg_name)
+
+    with withObjectCodeTemporaryAssignment(
+        to_name, "%s_result" % type_name, expression, emit, context
+    ) as value_name:
+        called_name = "(PyObject *)&Py%s_Type" % type_name.title()
+
+        if arg_names:
+            getCallCodePosArgsQuick(
+                to_name=value_name,
+                called_name=called_name,
+                expression=expression,
+                arg_names=arg_names,
+                needs_check=expression.mayRaiseException(BaseException),
+                emit=emit,
+                context=context,
+            )
+        else:
+            getCallCodeNoArgs(
+                to_name=value_name,
+                called_name=called_name,
+                expression=expression,
+                needs_check=expression.mayRaiseException(BaseException),
+                emit=emit,
+                context=context,
+            )
+
+
+def generateBuiltinEnumerateCode(to_name, expression, emit, context):
+    _generateBuiltinTypeCallCode(
+        to_name=to_name,
+        type_name="enum",
+        arg_expressions=expression.getVisitableNodes(),
+        expression=expression,
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinZipCode(to_name, expression, emit, context):
+    _generateBuiltinTypeCallCode(
+        to_name=to_name,
+        type_name="zip",
+        arg_expressions=expression.subnode_iterables,
+        expression=expression,
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinMapCode(to_name, expression, emit, context):
+    _generateBuiltinTypeCallCode(
+        to_name=to_name,
+        type_name="map",
+        arg_expressions=expression.getVisitableNodes(),
+        expression=expression,
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinFilterCode(to_name, expression, emit, context):
+    _generateBuiltinTypeCallCode(
+        to_name=to_name,
+        type_name="filter",
+        arg_expressions=expression.getVisitableNodes(),
+        expression=expression,
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinSortedCode(to_name, expression, emit, context):
+    if expression.subnode_key is None and expression.subnode_reverse is None:
+        generateCAPIObjectCode(
+            to_name=to_name,
+            capi="BUILTIN_SORTED1",
+            arg_desc=(("sorted_iterable", expression.subnode_iterable),),
+            may_raise=expression.mayRaiseException(BaseException),
+            conversion_check=decideConversionCheckNeeded(to_name, expression),
+            source_ref=expression.getCompatibleSourceReference(),
+            emit=emit,
+            context=context,
+        )
+    else:
+        generateCAPIObjectCode(
+            to_name=to_name,
+            capi="BUILTIN_SORTED3",
+            arg_desc=(
+                ("sorted_iterable", expression.subnode_iterable),
+                ("sorted_key", expression.subnode_key),
+                ("sorted_reverse", expression.subnode_reverse),
+            ),
+            may_raise=expression.mayRaiseException(BaseException),
+            conversion_check=decideConversionCheckNeeded(to_name, expression),
+            none_null=True,
+            source_ref=expression.getCompatibleSourceReference(),
+            emit=emit,
+            context=context,
+        )
+
+
+def _generateBuiltinMinMaxCode(to_name, builtin_name, expression, emit, context):
+    values = expression.subnode_values
+    capi = "BUILTIN_" + builtin_name.upper()
+
+    if len(values) == 1:
+        generateCAPIObjectCode(
+            to_name=to_name,
+            capi=capi + "1",
+            arg_desc=((builtin_name + "_iterable", values[0]),),
+            may_raise=expression.mayRaiseException(BaseException),
+            conversion_check=decideConversionCheckNeeded(to_name, expression),
+            source_ref=expression.getCompatibleSourceReference(),
+            emit=emit,
+            context=context,
+        )
+
+        return
+
+    # All arguments are evaluated before any comparison is done, and then
+    # they are compared in order, keeping the current result.
+    value_names = []
+
+    for value in values:
+        value_name = context.allocateTempName(builtin_name + "_arg")
+
+        generateExpressionCode(
+            to_name=value_name, expression=value, emit=emit, context=context
+        )
+
+        value_names.append(value_name)
+
+    context.setCurrentSourceCodeReference(expression.getCompatibleSourceReference())
+
+    current_name = value_names[0]
+
+    for count, value_name in enumerate(value_names[1:]):
+        if count == len(value_names) - 2:
+            result_name = to_name
+            conversion_check = decideConversionCheckNeeded(to_name, expression)
+        else:
+            result_name = context.allocateTempName(builtin_name + "_partial")
+            conversion_check = False
+
+        getCAPIObjectCode(
+            to_name=result_name,
+            capi=capi + "2",
+            arg_names=(current_name, value_name),
+            may_raise=True,
+            conversion_check=conversion_check,
+            ref_count=1,
+            emit=emit,
+            context=context,
+        )
+
+        current_name = result_name
+
+
+def generateBuiltinMinCode(to_name, expression, emit, context):
+    _generateBuiltinMinMaxCode(
+        to_name=to_name,
+        builtin_name="min",
+        expression=expression,
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinMaxCode(to_name, expression, emit, context):
+    _generateBuiltinMinMaxCode(
+        to_name=to_name,
+        builtin_name="max",
+        expression=expression,
+        emit=emit,
+        context=context,
+    )
@@ -60,14 +60,20 @@ from .BuiltinCodes import (
     generateBuiltinClassmethodCode,
     generateBuiltinComplex1Code,
     generateBuiltinComplex2Code,
+    generateBuiltinEnumerateCode,
+    generateBuiltinFilterCode,
     generateBuiltinFloatCode,
     generateBuiltinHexCode,
+    generateBuiltinMapCode,
+    generateBuiltinMaxCode,
+    generateBuiltinMinCode,
     generateBuiltinOctCode,
     generateBuiltinOpenCode,
     generateBuiltinRange1Code,
     generateBuiltinRange2Code,
     generateBuiltinRange3Code,
     generateBuiltinRefCode,
+    generateBuiltinSortedCode,
     generateBuiltinStaticmethodCode,
     generateBuiltinSum1Code,
     generateBuiltinSum2Code,
@@ -76,6 +82,7 @@ from .BuiltinCodes import (
     generateBuiltinXrange1Code,
     generateBuiltinXrange2Code,
     generateBuiltinXrange3Code,
+    generateBuiltinZipCode,
 )
 from .CallCodes import generateCallCode, getCallsCode
 from .ClassCodes import generateBuiltinSuperCode, generateSelectMetaclassCode
@@ -160,6 +167,7 @@ from .FunctionCodes import (
     generateFunctionCreationCode,
     generateFunctionErrorStrCode,
     generateFunctionOutlineCode,
+    generateParameterTypeExactCode,
     getExportScopeCode,
     getFunctionCode,
     getFunctionDirectDecl,
@@ -535,6 +543,14 @@ addExpressionDispatchDict(
         "EXPRESSION_BUILTIN_NEXT2": generateBuiltinNext2Code,
         "EXPRESSION_BUILTIN_SUM1": generateBuiltinSum1Code,
         "EXPRESSION_BUILTIN_SUM2": generateBuiltinSum2Code,
+        "EXPRESSION_BUILTIN_ENUMERATE1": generateBuiltinEnumerateCode,
+        "EXPRESSION_BUILTIN_ENUMERATE2": generateBuiltinEnumerateCode,
+        "EXPRESSION_BUILTIN_ZIP": generateBuiltinZipCode,
+        "EXPRESSION_BUILTIN_MAP": generateBuiltinMapCode,
+        "EXPRESSION_BUILTIN_FILTER": generateBuiltinFilterCode,
+        "EXPRESSION_BUILTIN_SORTED": generateBuiltinSortedCode,
+        "EXPRESSION_BUILTIN_MIN": generateBuiltinMinCode,
+        "EXPRESSION_BUILTIN_MAX": generateBuiltinMaxCode,
         "EXPRESSION_BUILTIN_TYPE1": generateBuiltinType1Code,
         "EXPRESSION_BUILTIN_TYPE3": generateBuiltinType3Code,
         "EXPRESSION_BUILTIN_IMPORT": generateBuiltinImportCode,
@@ -676,6 +692,7 @@ addExpressionDispatchDict(
         "EXPRESSION_FUNCTION_CREATION": generateFunctionCreationCode,
         "EXPRESSION_FUNCTION_CALL": generateFunctionCallCode,
         "EXPRESSION_FUNCTION_ERROR_STR": generateFunctionErrorStrCode,
+        "EXPRESSION_PARAMETER_TYPE_EXACT": generateParameterTypeExactCode,
         "EXPRESSION_IMPORT_MODULE_FIXED": generateImportModuleFixedCode,
         "EXPRESSION_IMPORT_MODULE_HARD": generateImportModuleHardCode,
         "EXPRESSION_IMPORT_MODULE_NAME_HARD": generateImportModuleNameHardCode,
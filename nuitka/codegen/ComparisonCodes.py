@@ -102,12 +102,78 @@ specialized_cmp_helpers_set = OrderedSet(
 )
 
 
+def _generateContainsItemsCode(to_name, expression, emit, context):
+    left = expression.subnode_left
+    right = expression.subnode_right
+
+    left_name = context.allocateTempName("compexpr_left")
+
+    generateExpressionCode(
+        to_name=left_name, expression=left, emit=emit, context=context
+    )
+
+    item_names = []
+
+    for element in right.subnode_elements:
+        item_name = context.allocateTempName("contains_item")
+
+        generateExpressionCode(
+            to_name=item_name, expression=element, emit=emit, context=context
+        )
+
+        item_names.append(item_name)
+
+    needs_check = right.mayRaiseExceptionIn(BaseException, left)
+
+    res_name = context.getIntResName()
+
+    emit(
+        """\
+{
+    PyObject *contains_items[] = {%s};
+    %s = SEQUENCE_CONTAINS_ITEMS(%s, contains_items, %d);
+}"""
+        % (
+            ", ".join(str(item_name) for item_name in item_names),
+            res_name,
+            left_name,
+            len(item_names),
+        )
+    )
+
+    getErrorExitBoolCode(
+        condition="%s == -1" % res_name,
+        release_names=[left_name] + item_names,
+        needs_check=needs_check,
+        emit=emit,
+        context=context,
+    )
+
+    to_name.getCType().emitAssignmentCodeFromBoolCondition(
+        to_name=to_name,
+        condition="%s == %d"
+        % (res_name, 1 if expression.getComparator() == "In" else 0),
+        emit=emit,
+    )
+
+
 def generateComparisonExpressionCode(to_name, expression, emit, context):
     left = expression.subnode_left
     right = expression.subnode_right
 
     comparator = expression.getComparator()
 
+    # Lists and tuples made only to check for an element, need not be created,
+    # their items can be compared directly.
+    if comparator in OperatorCodes.containing_comparison_codes and (
+        right.isExpressionMakeTuple() or right.isExpressionMakeList()
+    ):
+        _generateContainsItemsCode(
+            to_name=to_name, expression=expression, emit=emit, context=context
+        )
+
+        return
+
     type_name = "PyObject *"
     if comparator in ("Is", "IsNot"):
         if left.getTypeShape() is tshape_bool and right.getTypeShape() is tshape_bool:
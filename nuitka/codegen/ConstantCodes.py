@@ -31,6 +31,7 @@ import os
 import sys
 
 from nuitka import Options
+from nuitka.Constants import isMutable
 from nuitka.constants.Serialization import ConstantAccessor
 from nuitka.PythonVersions import python_version
 from nuitka.Version import getNuitkaVersion
@@ -43,14 +44,39 @@ from .templates.CodeTemplatesConstants import template_constants_reading
 from .templates.CodeTemplatesModules import template_header_guard
 
 
+def _mayConstantValueEscape(expression, constant):
+    """Decide if a mutable constant value needs to be copied for its user.
+
+    When the user only looks at the value, the constant itself can be used,
+    but that extends to the elements only if they are not mutable, as these
+    may be given to other code, e.g. as the result of a lookup.
+    """
+
+    if not expression.parent.isChildValueReadOnly(expression):
+        return True
+
+    constant_type = type(constant)
+
+    if constant_type is dict:
+        values = constant.values()
+    elif constant_type in (list, set, tuple, bytearray):
+        values = constant
+    else:
+        return True
+
+    return any(isMutable(value) for value in values)
+
+
 def generateConstantReferenceCode(to_name, expression, emit, context):
     """Assign the constant behind the expression to to_name."""
 
+    constant = expression.getCompileTimeConstant()
+
     to_name.getCType().emitAssignmentCodeFromConstant(
         to_name=to_name,
-        constant=expression.getCompileTimeConstant(),
-        # Derive this from context.
-        may_escape=True,
+        constant=constant,
+        may_escape=isMutable(constant)
+        and _mayConstantValueEscape(expression, constant),
         emit=emit,
         context=context,
     )
@@ -597,12 +597,18 @@ class FrameDeclarationsMixin(object):
         # Currently active frame stack inside the context.
         self.frame_stack = [None]
 
+        # Frames that only get created when an exception leaves them.
+        self.frame_lazy_stack = [False]
+
         self.locals_dict_names = None
 
     def getFrameHandle(self):
         return self.frame_stack[-1]
 
-    def pushFrameHandle(self, code_identifier, is_light):
+    def isFrameHandleLazy(self):
+        return self.frame_lazy_stack[-1]
+
+    def pushFrameHandle(self, code_identifier, is_light, is_lazy):
         self.frames_used += 1
 
         if is_light:
@@ -630,11 +636,13 @@ class FrameDeclarationsMixin(object):
         )
 
         self.frame_stack.append(frame_identifier)
+        self.frame_lazy_stack.append(is_lazy)
         return frame_identifier
 
     def popFrameHandle(self):
         result = self.frame_stack[-1]
         del self.frame_stack[-1]
+        del self.frame_lazy_stack[-1]
 
         return result
 
@@ -1043,8 +1051,11 @@ class PythonFunctionOutlineContext(
     def getFrameHandle(self):
         return self.parent.getFrameHandle()
 
-    def pushFrameHandle(self, code_identifier, is_light):
-        return self.parent.pushFrameHandle(code_identifier, is_light)
+    def isFrameHandleLazy(self):
+        return self.parent.isFrameHandleLazy()
+
+    def pushFrameHandle(self, code_identifier, is_light, is_lazy):
+        return self.parent.pushFrameHandle(code_identifier, is_light, is_lazy)
 
     def popFrameHandle(self):
         return self.parent.popFrameHandle()
@@ -38,6 +38,9 @@ from .templates.CodeTemplatesFrames import (
     template_frame_guard_generator,
     template_frame_guard_generator_exception_handler,
     template_frame_guard_generator_return_handler,
+    template_frame_guard_lazy_block,
+    template_frame_guard_lazy_exception_handler,
+    template_frame_guard_lazy_return_handler,
     template_frame_guard_once_block,
     template_frame_guard_once_exception_handler,
 )
@@ -94,8 +97,12 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
         real_parent_exception_exit = parent_exception_exit
         parent_exception_exit = context.allocateLabel("nested_frame_exit")
 
+    is_lazy = statement_sequence.isFrameObjectLazy()
+
     # Allow stacking of frame handles.
-    context.pushFrameHandle(code_identifier, statement_sequence.hasStructureMember())
+    context.pushFrameHandle(
+        code_identifier, statement_sequence.hasStructureMember(), is_lazy
+    )
 
     context.setExceptionEscape(context.allocateLabel("frame_exception_exit"))
 
@@ -155,6 +162,18 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
             emit=emit,
             context=context,
         )
+    elif is_lazy:
+        getFrameGuardLazyCode(
+            code_identifier=code_identifier,
+            type_descriptions=type_descriptions,
+            parent_exception_exit=parent_exception_exit,
+            parent_return_exit=parent_return_exit,
+            frame_exception_exit=frame_exception_exit,
+            frame_return_exit=frame_return_exit,
+            codes=local_emit.codes,
+            emit=emit,
+            context=context,
+        )
     elif guard_mode == "full":
         getFrameGuardHeavyCode(
             code_identifier=code_identifier,
@@ -311,6 +330,69 @@ def getFrameGuardHeavyCode(
     getLabelCode(no_exception_exit, emit)
 
 
+def getFrameGuardLazyCode(
+    code_identifier,
+    codes,
+    type_descriptions,
+    parent_exception_exit,
+    parent_return_exit,
+    frame_exception_exit,
+    frame_return_exit,
+    emit,
+    context,
+):
+    # We really need this many parameters here.
+    no_exception_exit = context.allocateLabel("frame_no_exception")
+
+    emit(
+        template_frame_guard_lazy_block
+        % {"codes": indented(codes, 0), "no_exception_exit": no_exception_exit}
+    )
+
+    if frame_return_exit is not None:
+        emit(
+            template_frame_guard_lazy_return_handler
+            % {
+                "return_exit": parent_return_exit,
+                "frame_return_exit": frame_return_exit,
+            }
+        )
+
+    if frame_exception_exit is not None:
+        frame_identifier = context.getFrameHandle()
+        frame_cache_identifier = context.variable_storage.addFrameCacheDeclaration(
+            frame_identifier.code_name
+        )
+
+        (
+            _exception_type,
+            _exception_value,
+            exception_tb,
+            exception_lineno,
+        ) = context.variable_storage.getExceptionVariableDescriptions()
+
+        emit(
+            template_frame_guard_lazy_exception_handler
+            % {
+                "frame_identifier": frame_identifier,
+                "frame_cache_identifier": frame_cache_identifier,
+                "code_identifier": code_identifier,
+                "locals_size": getFrameLocalsStorageSize(type_descriptions),
+                "module_identifier": getModuleAccessCode(context),
+                "tb_making": getTracebackMakingIdentifier(
+                    context=context, lineno_name=exception_lineno
+                ),
+                "parent_exception_exit": parent_exception_exit,
+                "frame_exception_exit": frame_exception_exit,
+                "attach_locals": getFrameAttachLocalsCode(context, frame_identifier),
+                "exception_tb": exception_tb,
+                "exception_lineno": exception_lineno,
+            }
+        )
+
+    getLabelCode(no_exception_exit, emit)
+
+
 def getFrameGuardOnceCode(
     code_identifier,
     codes,
@@ -842,3 +842,13 @@ def generateFunctionErrorStrCode(to_name, expression, emit, context):
         emit=emit,
         context=context,
     )
+
+
+def generateParameterTypeExactCode(to_name, expression, emit, context):
+    # The type was checked already, this is only the value.
+    generateExpressionCode(
+        to_name=to_name,
+        expression=expression.subnode_value,
+        emit=emit,
+        context=context,
+    )
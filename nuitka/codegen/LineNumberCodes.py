@@ -35,6 +35,11 @@ def getCurrentLineNumberCode(context):
 
 
 def getLineNumberUpdateCode(context):
+    # Lazy frames do not exist yet, the exception line number is all that
+    # is needed for them.
+    if context.isFrameHandleLazy():
+        return ""
+
     lineno_value = getCurrentLineNumberCode(context)
 
     if lineno_value:
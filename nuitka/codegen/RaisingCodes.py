@@ -230,15 +230,17 @@ if (unlikely(%(bool_res_name)s == false)) {
         frame_handle = context.getFrameHandle()
 
         if frame_handle:
-            emit(
-                """\
+            # Lazy frames cannot be in the traceback of a published exception.
+            if not context.isFrameHandleLazy():
+                emit(
+                    """\
 if (%(exception_tb)s && %(exception_tb)s->tb_frame == &%(frame_identifier)s->m_frame) \
 %(frame_identifier)s->m_frame.f_lineno = %(exception_tb)s->tb_lineno;"""
-                % {
-                    "exception_tb": exception_tb,
-                    "frame_identifier": context.getFrameHandle(),
-                }
-            )
+                    % {
+                        "exception_tb": exception_tb,
+                        "frame_identifier": context.getFrameHandle(),
+                    }
+                )
 
             emit(getFrameVariableTypeDescriptionCode(context))
     else:
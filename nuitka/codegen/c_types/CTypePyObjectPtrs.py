@@ -47,6 +47,120 @@ from nuitka.Constants import isMutable
 
 from .CTypeBases import CTypeBase
 
+# Mutable constants with more parts than this, are copied with the generic
+# deep copy, rather than code specialized to their structure.
+_max_constant_clone_parts = 16
+
+
+def _getMutableValues(constant):
+    if type(constant) is dict:
+        return [value for value in constant.values() if isMutable(value)]
+    elif type(constant) in (list, tuple):
+        return [value for value in constant if isMutable(value)]
+    else:
+        return ()
+
+
+def _getConstantClonePartCount(constant):
+    return 1 + sum(
+        _getConstantClonePartCount(value) for value in _getMutableValues(constant)
+    )
+
+
+def _getConstantShallowCopyCode(constant, source_code):
+    """Get code for a copy of a constant, whose values are not mutable."""
+
+    constant_type = type(constant)
+
+    if constant_type is list:
+        return "LIST_COPY(%s)" % source_code if constant else "PyList_New(0)"
+    elif constant_type is dict:
+        return "PyDict_Copy(%s)" % source_code if constant else "PyDict_New()"
+    elif constant_type is set:
+        return "PySet_New(%s)" % source_code
+    elif constant_type is bytearray:
+        return "BYTEARRAY_COPY(%s)" % source_code
+    else:
+        return "DEEP_COPY(%s)" % source_code
+
+
+def _emitConstantCloneCode(to_name, constant, source_code, level, emit, context):
+    """Emit code to copy a constant, following its known structure.
+
+    Only the mutable parts are copied, and which ones these are, is known at
+    compile time, so there is no need to check types at run time like the
+    generic deep copy has to.
+    """
+
+    constant_type = type(constant)
+
+    if constant_type is list:
+        emit("%s = LIST_COPY(%s);" % (to_name, source_code))
+
+        parts = [
+            (count, "PyList_GET_ITEM(%s, %d)" % (source_code, count), value)
+            for count, value in enumerate(constant)
+            if isMutable(value)
+        ]
+        set_template = "PyList_SET_ITEM(%(to_name)s, %(key)s, %(value)s);"
+    elif constant_type is tuple:
+        emit(
+            "%s = MAKE_TUPLE(&PyTuple_GET_ITEM(%s, 0), %d);"
+            % (to_name, source_code, len(constant))
+        )
+
+        parts = [
+            (count, "PyTuple_GET_ITEM(%s, %d)" % (source_code, count), value)
+            for count, value in enumerate(constant)
+            if isMutable(value)
+        ]
+        set_template = "PyTuple_SET_ITEM(%(to_name)s, %(key)s, %(value)s);"
+    elif constant_type is dict:
+        emit("%s = PyDict_Copy(%s);" % (to_name, source_code))
+
+        parts = []
+        for key, value in iterItems(constant):
+            if isMutable(value):
+                key_code = context.getConstantCode(key)
+
+                parts.append(
+                    (
+                        key_code,
+                        "DICT_GET_ITEM0(%s, %s)" % (source_code, key_code),
+                        value,
+                    )
+                )
+        set_template = """\
+PyDict_SetItem(%(to_name)s, %(key)s, %(value)s);
+Py_DECREF(%(value)s);"""
+    else:
+        emit("%s = %s;" % (to_name, _getConstantShallowCopyCode(constant, source_code)))
+        return
+
+    clone_name = "constant_clone_%d" % level
+
+    for key_code, value_code, value in parts:
+        emit("{")
+        emit("PyObject *%s;" % clone_name)
+
+        _emitConstantCloneCode(
+            to_name=clone_name,
+            constant=value,
+            source_code=value_code,
+            level=level + 1,
+            emit=emit,
+            context=context,
+        )
+
+        # The list and tuple copies have a reference to the shared value,
+        # that we are replacing, for dictionaries it is released when
+        # setting the item.
+        if constant_type is not dict:
+            emit("Py_DECREF(%s);" % value_code)
+
+        emit(set_template % {"to_name": to_name, "key": key_code, "value": clone_name})
+        emit("}")
+
 
 class CPythonPyObjectPtrBase(CTypeBase):
     @classmethod
@@ -156,7 +270,13 @@ class CPythonPyObjectPtrBase(CTypeBase):
                 else:
                     needs_deep = False
 
-                if needs_deep:
+                if needs_deep and (
+                    _getConstantClonePartCount(constant) <= _max_constant_clone_parts
+                ):
+                    # Copied with code specific to the structure.
+                    code = None
+                    ref_count = 1
+                elif needs_deep:
                     code = "DEEP_COPY_DICT(%s)" % context.getConstantCode(
                         constant, deep_check=False
                     )
@@ -191,7 +311,13 @@ class CPythonPyObjectPtrBase(CTypeBase):
                 else:
                     needs_deep = False
 
-                if needs_deep:
+                if needs_deep and (
+                    _getConstantClonePartCount(constant) <= _max_constant_clone_parts
+                ):
+                    # Copied with code specific to the structure.
+                    code = None
+                    ref_count = 1
+                elif needs_deep:
                     code = "DEEP_COPY_LIST(%s)" % context.getConstantCode(
                         constant, deep_check=False
                     )
@@ -212,7 +338,13 @@ class CPythonPyObjectPtrBase(CTypeBase):
                     if isMutable(value):
                         needs_deep = True
                         break
-            if needs_deep:
+            if needs_deep and (
+                _getConstantClonePartCount(constant) <= _max_constant_clone_parts
+            ):
+                # Copied with code specific to the structure.
+                code = None
+                ref_count = 1
+            elif needs_deep:
                 code = "DEEP_COPY_TUPLE(%s)" % context.getConstantCode(
                     constant, deep_check=False
                 )
@@ -236,7 +368,17 @@ class CPythonPyObjectPtrBase(CTypeBase):
         else:
             value_name = context.allocateTempName("constant_value")
 
-        emit("%s = %s;" % (value_name, code))
+        if code is None:
+            _emitConstantCloneCode(
+                to_name=value_name,
+                constant=constant,
+                source_code=context.getConstantCode(constant, deep_check=False),
+                level=1,
+                emit=emit,
+                context=context,
+            )
+        else:
+            emit("%s = %s;" % (value_name, code))
 
         if to_name is not value_name:
             cls.emitAssignConversionCode(
@@ -115,6 +115,70 @@ popFrameStack();
 goto %(parent_exception_exit)s;
 """
 
+# Frame in a function, where nothing can observe the frame object, so it is
+# only created when an exception leaves it.
+template_frame_guard_lazy_block = """\
+// Framed code, frame object is created only for exceptions:
+%(codes)s
+
+goto %(no_exception_exit)s;
+"""
+
+template_frame_guard_lazy_return_handler = """\
+%(frame_return_exit)s:;
+
+goto %(return_exit)s;
+"""
+
+template_frame_guard_lazy_exception_handler = """\
+%(frame_exception_exit)s:;
+
+// Create the frame object now, it's needed for the traceback.
+if (isFrameUnusable(%(frame_cache_identifier)s)) {
+    Py_XDECREF(%(frame_cache_identifier)s);
+
+#if _DEBUG_REFCOUNTS
+    if (%(frame_cache_identifier)s == NULL) {
+        count_active_frame_cache_instances += 1;
+    } else {
+        count_released_frame_cache_instances += 1;
+    }
+    count_allocated_frame_cache_instances += 1;
+#endif
+    %(frame_cache_identifier)s = MAKE_FUNCTION_FRAME(%(code_identifier)s, %(module_identifier)s, %(locals_size)s);
+#if _DEBUG_REFCOUNTS
+} else {
+    count_hit_frame_cache_instances += 1;
+#endif
+}
+assert(%(frame_cache_identifier)s->m_type_description == NULL);
+%(frame_identifier)s = %(frame_cache_identifier)s;
+%(frame_identifier)s->m_frame.f_lineno = %(exception_lineno)s;
+
+if (%(exception_tb)s == NULL) {
+    %(exception_tb)s = %(tb_making)s;
+} else if (%(exception_tb)s->tb_frame != &%(frame_identifier)s->m_frame) {
+    %(exception_tb)s = ADD_TRACEBACK(%(exception_tb)s, %(frame_identifier)s, %(exception_lineno)s);
+}
+
+// Attaches locals to frame if any.
+%(attach_locals)s
+
+// Release cached frame, it's used for the exception.
+#if _DEBUG_REFCOUNTS
+count_active_frame_cache_instances -= 1;
+count_released_frame_cache_instances += 1;
+#endif
+
+Py_DECREF(%(frame_cache_identifier)s);
+%(frame_cache_identifier)s = NULL;
+
+assertFrameObject(%(frame_identifier)s);
+
+// Return the error.
+goto %(parent_exception_exit)s;
+"""
+
 # Frame for a module. TODO: Use it for functions called only once.
 # TODO: The once guard need not take a reference count in its frame class.
 template_frame_guard_once_block = """\
@@ -0,0 +1,228 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Dictionary with cheap snapshots, sharing unchanged values.
+
+Trace collections copy the active variable versions for every branch, and
+for every place an exception may be raised, and then merge the copies again,
+which made it quadratic for functions with many variables.
+
+Here the values set since the last snapshot are kept in a plain dictionary,
+on top of a chain of layers, which are frozen dictionaries of earlier values
+shared with the snapshots. Taking a snapshot freezes the current values into
+a new layer, and keys that differ between dictionaries are only found in the
+layers above the latest one they have in common.
+"""
+
+# Flatten the chain of layers, when it gets deeper than this, such that
+# lookups, which need to go through the chain, stay fast.
+_max_layer_depth = 16
+
+
+class _Layer(object):
+    __slots__ = ("values", "base", "depth")
+
+    def __init__(self, values, base):
+        if base is not None and base.depth >= _max_layer_depth:
+            flat_values = {}
+
+            layers = []
+            while base is not None:
+                layers.append(base)
+                base = base.base
+
+            for layer in reversed(layers):
+                flat_values.update(layer.values)
+
+            flat_values.update(values)
+            values = flat_values
+
+        self.values = values
+        self.base = base
+        self.depth = 1 if base is None else base.depth + 1
+
+
+def _getLayers(layered_dict):
+    result = []
+
+    layer = layered_dict.base
+    while layer is not None:
+        result.append(layer)
+        layer = layer.base
+
+    return result
+
+
+class LayeredDict(object):
+    """Dictionary with cheap snapshots, only insertions are supported."""
+
+    __slots__ = ("values", "base", "cache", "cache_complete")
+
+    def __init__(self, base=None):
+        # Values set since the last snapshot, which are not shared.
+        self.values = {}
+
+        # Frozen values, shared with others.
+        self.base = base
+
+        # Values found in the frozen layers, to not search them again.
+        self.cache = {}
+        self.cache_complete = base is None
+
+    def __getitem__(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            pass
+
+        try:
+            return self.cache[key]
+        except KeyError:
+            layer = self.base
+
+            while layer is not None:
+                if key in layer.values:
+                    value = self.cache[key] = layer.values[key]
+                    return value
+
+                layer = layer.base
+
+            raise
+
+    def __setitem__(self, key, value):
+        self.values[key] = value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        else:
+            return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        """Get all items, as a list, as the dictionary may change."""
+
+        if not self.cache_complete:
+            for layer in _getLayers(self):
+                for key, value in layer.values.items():
+                    if key not in self.cache:
+                        self.cache[key] = value
+
+            self.cache_complete = True
+
+        result = dict(self.cache)
+        result.update(self.values)
+
+        return list(result.items())
+
+    def keys(self):
+        """Get all keys, as a list, as the dictionary may change."""
+
+        return [key for key, _value in self.items()]
+
+    def clear(self):
+        self.values = {}
+        self.base = None
+        self.cache = {}
+        self.cache_complete = True
+
+    def snapshot(self):
+        """Make a copy, that shares all current values with this one."""
+
+        if self.values:
+            self.base = _Layer(self.values, self.base)
+            self.cache.update(self.values)
+            self.values = {}
+
+        return LayeredDict(self.base)
+
+    def update(self, other):
+        """Update with the values of another layered dictionary."""
+
+        _common, _keys, (_values, other_values) = getDivergedValues((self, other))
+
+        self.values.update(other_values)
+
+
+def getDivergedValues(layered_dicts):
+    """Get the values of keys, that may differ between layered dictionaries.
+
+    Args:
+        layered_dicts: the dictionaries to compare
+
+    Returns:
+        Tuple of the latest layer shared by all, or None if there is none,
+        a list of the keys set after it in any of the dictionaries, and
+        dictionaries with the values of these keys for each of them.
+    """
+
+    all_layers = [_getLayers(layered_dict) for layered_dict in layered_dicts]
+
+    other_layer_sets = [set(layers) for layers in all_layers[1:]]
+
+    common = None
+    for layer in all_layers[0]:
+        if all(layer in layer_set for layer_set in other_layer_sets):
+            common = layer
+            break
+
+    all_values = []
+
+    # Dictionary for a stable order of keys, unlike a set.
+    keys = {}
+
+    for layered_dict, layers in zip(layered_dicts, all_layers):
+        if common is not None:
+            layers = layers[: layers.index(common)]
+
+        values = {}
+
+        for layer in reversed(layers):
+            values.update(layer.values)
+
+        values.update(layered_dict.values)
+
+        keys.update(dict.fromkeys(values))
+        all_values.append(values)
+
+    keys = list(keys)
+
+    # Keys not set in a dictionary after the shared layer, have the value
+    # from there.
+    for key in keys:
+        layer = common
+
+        while layer is not None:
+            if key in layer.values:
+                value = layer.values[key]
+
+                for values in all_values:
+                    if key not in values:
+                        values[key] = value
+
+                break
+
+            layer = layer.base
+
+    return common, keys, all_values
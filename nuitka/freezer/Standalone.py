@@ -22,11 +22,11 @@ macOS, Windows, and Linux. Patches for other platforms are
 very welcome.
 """
 
+import fnmatch
 import hashlib
 import marshal
 import os
 import pkgutil
-import shutil
 import sys
 
 from nuitka import Options, SourceCodeReferences
@@ -49,11 +49,11 @@ from nuitka.Tracing import general, inclusion_logger, printError
 from nuitka.tree.SourceReading import readSourceCodeFromFilename
 from nuitka.utils import Utils
 from nuitka.utils.AppDirs import getCacheDir
-from nuitka.utils.Execution import executeProcess, withEnvironmentPathAdded
+from nuitka.utils.Execution import executeProcess, getEnvironmentWithPathAdded
 from nuitka.utils.FileOperations import (
     areSamePaths,
+    copyFile,
     copyFileWithPermissions,
-    copyTree,
     getDirectoryRealPath,
     getFileContentByLine,
     getFileContents,
@@ -62,6 +62,7 @@ from nuitka.utils.FileOperations import (
     haveSameFileContents,
     listDir,
     makePath,
+    putFileContentsAtomic,
     putTextFileContents,
     relpath,
     resolveShellPatternToFilenames,
@@ -78,7 +79,11 @@ from nuitka.utils.SharedLibraries import (
     removeSxsFromDLL,
 )
 from nuitka.utils.Signing import removeMacOSCodeSignature
-from nuitka.utils.ThreadedExecutor import ThreadPoolExecutor, waitWorkers
+from nuitka.utils.ThreadedExecutor import (
+    RLock,
+    ThreadPoolExecutor,
+    waitWorkers,
+)
 from nuitka.utils.Timing import TimerReport
 
 from .DependsExe import detectDLLsWithDependencyWalker
@@ -218,33 +223,62 @@ def _detectedShlibFile(filename, module_name):
     module_names.add(module_name)
 
 
-def _detectImports(command, user_provided, technical):
-    # This is pretty complicated stuff, with variants to deal with.
-    # pylint: disable=too-many-branches,too-many-locals,too-many-statements
+def _getStandardLibraryStamp():
+    """Get a value that changes when the standard library installation does.
 
-    # Print statements for stuff to show, the modules loaded.
-    if python_version >= 0x300:
-        command += """
-print("\\n".join(sorted(
-    "import %s # sourcefile %s" % (module.__name__, module.__file__)
-    for module in sys.modules.values()
-    if getattr(module, "__file__", None) not in (None, "<frozen>"
-))), file = sys.stderr)"""
+    This is the modification times of the standard library directories and
+    their immediate sub-directories, which are updated when modules are
+    added, removed, or replaced by installing over them.
+    """
 
-    reduced_path = [
-        path_element
-        for path_element in sys.path
-        if not areSamePaths(path_element, ".")
-        if not areSamePaths(
-            path_element, os.path.dirname(sys.modules["__main__"].__file__)
-        )
-    ]
+    # Using the function object to cache its result, avoiding global variable
+    # usage.
+    if not hasattr(_getStandardLibraryStamp, "result"):
+        stamp = []
 
-    # Make sure the right import path (the one Nuitka binary is running with)
-    # is used.
-    command = (
-        "import sys; sys.path = %s; sys.real_prefix = sys.prefix;" % repr(reduced_path)
-    ) + command
+        for stdlib_dir in sorted(getStandardLibraryPaths()):
+            if not os.path.isdir(stdlib_dir):
+                continue
+
+            stamp.append((stdlib_dir, os.path.getmtime(stdlib_dir)))
+
+            for sub_dir, _dirname in listDir(stdlib_dir):
+                if os.path.isdir(sub_dir):
+                    stamp.append((sub_dir, os.path.getmtime(sub_dir)))
+
+        _getStandardLibraryStamp.result = repr(stamp)
+
+    return _getStandardLibraryStamp.result
+
+
+def _getEarlyImportsCacheFilename(kind, hashed_value):
+    # Only valid for the same Python installation, with unchanged standard
+    # library.
+    hashed_value += sys.version + sys.executable + _getStandardLibraryStamp()
+
+    if str is not bytes:
+        hashed_value = hashed_value.encode("utf8")
+
+    cache_dir = os.path.join(getCacheDir(), "early_imports", kind)
+
+    makePath(cache_dir)
+
+    return os.path.join(cache_dir, hashlib.md5(hashed_value).hexdigest())
+
+
+def _executeImportDetection(command):
+    """Run the import detection command, giving the verbose output of CPython.
+
+    The output only depends on the Python installation, so it is cached, and
+    only computed once for a given command.
+    """
+
+    cache_filename = _getEarlyImportsCacheFilename(
+        kind="detections", hashed_value=command
+    )
+
+    if os.path.exists(cache_filename):
+        return getFileContents(cache_filename, "rb")
 
     import tempfile
 
@@ -271,6 +305,41 @@ print("\\n".join(sorted(
             printError(line)
         general.sysexit("Error, please report the issue with above output.")
 
+    putFileContentsAtomic(cache_filename, stderr, mode="wb")
+
+    return stderr
+
+
+def _detectImports(command, user_provided, technical):
+    # This is pretty complicated stuff, with variants to deal with.
+    # pylint: disable=too-many-branches,too-many-locals,too-many-statements
+
+    # Print statements for stuff to show, the modules loaded.
+    if python_version >= 0x300:
+        command += """
+print("\\n".join(sorted(
+    "import %s # sourcefile %s" % (module.__name__, module.__file__)
+    for module in sys.modules.values()
+    if getattr(module, "__file__", None) not in (None, "<frozen>"
+))), file = sys.stderr)"""
+
+    reduced_path = [
+        path_element
+        for path_element in sys.path
+        if not areSamePaths(path_element, ".")
+        if not areSamePaths(
+            path_element, os.path.dirname(sys.modules["__main__"].__file__)
+        )
+    ]
+
+    # Make sure the right import path (the one Nuitka binary is running with)
+    # is used.
+    command = (
+        "import sys; sys.path = %s; sys.real_prefix = sys.prefix;" % repr(reduced_path)
+    ) + command
+
+    stderr = _executeImportDetection(command)
+
     result = []
 
     detections = []
@@ -475,6 +544,26 @@ def scanStandardLibraryPath(stdlib_dir):
                 yield import_path + "." + dirname
 
 
+def _scanStandardLibraryPathCached(stdlib_dir):
+    cache_filename = _getEarlyImportsCacheFilename(
+        kind="stdlib_scan", hashed_value=stdlib_dir
+    )
+
+    if os.path.exists(cache_filename):
+        return getFileContents(cache_filename).split()
+
+    result = list(scanStandardLibraryPath(stdlib_dir))
+
+    contents = "\n".join(result)
+
+    if str is not bytes:
+        contents = contents.encode("utf8")
+
+    _putCacheContents(cache_filename, contents)
+
+    return result
+
+
 def _detectEarlyImports():
     encoding_names = [
         m[1] for m in pkgutil.iter_modules(sys.modules["encodings"].__path__)
@@ -505,8 +594,7 @@ def _detectEarlyImports():
 
         # Scan the standard library paths (multiple in case of virtualenv.
         for stdlib_dir in getStandardLibraryPaths():
-            for module_name in scanStandardLibraryPath(stdlib_dir):
-                stdlib_modules.add(module_name)
+            stdlib_modules.update(_scanStandardLibraryPathCached(stdlib_dir))
 
         # Put here ones that should be imported first.
         first_ones = ("Tkinter",)
@@ -587,7 +675,11 @@ def detectEarlyImports():
 
 _detected_python_rpath = None
 
+# Scanning is done in threads, which share the results, and wait for each
+# other, should they need the same DLL, with a lock per DLL.
 ldd_result_cache = {}
+_ldd_result_locks = {}
+_ldd_result_locks_lock = RLock()
 
 _linux_dll_ignore_list = (
     # Do not include kernel / glibc specific libraries. This list has been
@@ -652,39 +744,86 @@ def _getLdLibraryPath(package_name, python_rpath, original_dir):
     return ld_library_path
 
 
-def _detectBinaryPathDLLsPosix(dll_filename, package_name, original_dir):
-    # This is complex, as it also includes the caching mechanism
-    # pylint: disable=too-many-branches
-
-    if ldd_result_cache.get(dll_filename):
-        return ldd_result_cache[dll_filename]
-
-    # Ask "ldd" about the libraries being used by the created binary, these
-    # are the ones that interest us.
-
+def _getDetectedPythonRpath():
     # This is the rpath of the Python binary, which will be effective when
     # loading the other DLLs too. This happens at least for Python installs
     # on Travis. pylint: disable=global-statement
     global _detected_python_rpath
-    if _detected_python_rpath is None and not Utils.isPosixWindows():
-        _detected_python_rpath = getSharedLibraryRPATH(sys.executable) or False
 
-        if _detected_python_rpath:
-            _detected_python_rpath = _detected_python_rpath.replace(
-                "$ORIGIN", os.path.dirname(sys.executable)
+    with _ldd_result_locks_lock:
+        if _detected_python_rpath is None and not Utils.isPosixWindows():
+            _detected_python_rpath = getSharedLibraryRPATH(sys.executable) or False
+
+            if _detected_python_rpath:
+                _detected_python_rpath = _detected_python_rpath.replace(
+                    "$ORIGIN", os.path.dirname(sys.executable)
+                )
+
+    return _detected_python_rpath
+
+
+def _getLddResultLock(dll_filename):
+    with _ldd_result_locks_lock:
+        if dll_filename not in _ldd_result_locks:
+            _ldd_result_locks[dll_filename] = RLock()
+
+        return _ldd_result_locks[dll_filename]
+
+
+def _getCachedBinaryPathDLLsPosix(dll_filename, package_name, original_dir):
+    with _getLddResultLock(dll_filename):
+        if dll_filename not in ldd_result_cache:
+            ldd_result_cache[dll_filename] = _getBinaryPathDLLsPosix(
+                dll_filename=dll_filename,
+                package_name=package_name,
+                original_dir=original_dir,
             )
 
-    # TODO: Actually would be better to pass it as env to the created process instead.
-    with withEnvironmentPathAdded(
-        "LD_LIBRARY_PATH",
-        *_getLdLibraryPath(
+        return ldd_result_cache[dll_filename]
+
+
+def _detectBinaryPathDLLsPosix(dll_filename, package_name, original_dir):
+    # Not holding a lock while following the used DLLs, as that could dead lock
+    # with other threads on DLLs that use one another. Every DLL is asked only
+    # once, so cycles and DLLs used from many others are cheap.
+    result = set()
+
+    visited = set([dll_filename])
+    pending = [dll_filename]
+
+    while pending:
+        for sub_dll_filename in _getCachedBinaryPathDLLsPosix(
+            dll_filename=pending.pop(),
             package_name=package_name,
-            python_rpath=_detected_python_rpath,
             original_dir=original_dir,
-        )
-    ):
-        # TODO: Check exit code, should never fail.
-        stdout, stderr, _exit_code = executeProcess(command=("ldd", dll_filename))
+        ):
+            result.add(sub_dll_filename)
+
+            if sub_dll_filename not in visited:
+                visited.add(sub_dll_filename)
+                pending.append(sub_dll_filename)
+
+    return result
+
+
+def _getBinaryPathDLLsPosix(dll_filename, package_name, original_dir):
+    # Many details to handle in the output, pylint: disable=too-many-branches
+
+    # Ask "ldd" about the libraries being used by the created binary, these
+    # are the ones that interest us.
+
+    # TODO: Check exit code, should never fail.
+    stdout, stderr, _exit_code = executeProcess(
+        command=("ldd", dll_filename),
+        env=getEnvironmentWithPathAdded(
+            "LD_LIBRARY_PATH",
+            *_getLdLibraryPath(
+                package_name=package_name,
+                python_rpath=_getDetectedPythonRpath(),
+                original_dir=original_dir,
+            )
+        ),
+    )
 
     stderr = b"\n".join(
         line
@@ -731,36 +870,22 @@ def _detectBinaryPathDLLsPosix(dll_filename, package_name, original_dir):
 
         result.add(filename)
 
-    ldd_result_cache[dll_filename] = result
-
-    sub_result = set(result)
-
-    for sub_dll_filename in result:
-        sub_result = sub_result.union(
-            _detectBinaryPathDLLsPosix(
-                dll_filename=sub_dll_filename,
-                package_name=package_name,
-                original_dir=original_dir,
-            )
-        )
-
-    return sub_result
+    return result
 
 
 def _detectBinaryPathDLLsMacOS(
     original_dir, binary_filename, package_name, keep_unresolved
 ):
-    # TODO: Actually would be better to pass it as env to the created process instead.
-    with withEnvironmentPathAdded(
-        "DYLD_LIBRARY_PATH",
-        *_getLdLibraryPath(
-            package_name=package_name, python_rpath=None, original_dir=original_dir
-        )
-    ):
-        # TODO: Check exit code, should never fail.
-        stdout, _stderr, _exit_code = executeProcess(
-            command=("otool", "-L", binary_filename)
-        )
+    # TODO: Check exit code, should never fail.
+    stdout, _stderr, _exit_code = executeProcess(
+        command=("otool", "-L", binary_filename),
+        env=getEnvironmentWithPathAdded(
+            "DYLD_LIBRARY_PATH",
+            *_getLdLibraryPath(
+                package_name=package_name, python_rpath=None, original_dir=original_dir
+            )
+        ),
+    )
     system_paths = (
         "/usr/lib/",
         "/System/Library/Frameworks/",
@@ -874,6 +999,7 @@ def _getCacheFilename(
 
 
 _scan_dir_cache = {}
+_scan_dir_cache_lock = RLock()
 
 
 def getPackageSpecificDLLDirectories(package_name):
@@ -896,13 +1022,20 @@ def getPackageSpecificDLLDirectories(package_name):
 
 
 def getScanDirectories(package_name, original_dir):
-    # Many cases, pylint: disable=too-many-branches
-
     cache_key = package_name, original_dir
 
-    if cache_key in _scan_dir_cache:
+    with _scan_dir_cache_lock:
+        if cache_key not in _scan_dir_cache:
+            _scan_dir_cache[cache_key] = _getScanDirectories(
+                package_name=package_name, original_dir=original_dir
+            )
+
         return _scan_dir_cache[cache_key]
 
+
+def _getScanDirectories(package_name, original_dir):
+    # Many cases, pylint: disable=too-many-branches
+
     scan_dirs = [sys.prefix]
 
     if package_name is not None:
@@ -959,7 +1092,6 @@ def getScanDirectories(package_name, original_dir):
 
         result.append(os.path.realpath(scan_dir))
 
-    _scan_dir_cache[cache_key] = result
     return result
 
 
@@ -1269,13 +1401,14 @@ different from
             removed_dlls.add(dll_filename2)
 
     dll_map = []
+    dll_copies = OrderedDict()
 
     for dll_filename, sources in iterItems(used_dlls):
         dll_name = os.path.basename(dll_filename)
 
         target_path = os.path.join(dist_dir, dll_name)
 
-        shutil.copyfile(dll_filename, target_path)
+        dll_copies[target_path] = dll_filename
 
         dll_map.append((dll_filename, dll_name))
 
@@ -1285,6 +1418,10 @@ different from
                 % (dll_filename, ", ".join(sources))
             )
 
+    # The DLLs get modified in place after copying, so they cannot be shared
+    # with anything.
+    _copyFiles(copies=dll_copies, with_permissions=False, share_identical=False)
+
     if Utils.isMacOS():
         # For macOS, the binary and the DLLs needs to be changed to reflect
         # the relative DLL location in the ".dist" folder.
@@ -1336,8 +1473,125 @@ different from
                 removeSxsFromDLL(os.path.join(dist_dir, dll_filename))
 
 
-def _handleDataFile(dist_dir, tracer, included_datafile):
-    """Handle a data file."""
+def _getFileContentsHash(filename):
+    result = hashlib.md5()
+
+    with open(filename, "rb") as input_file:
+        while True:
+            chunk = input_file.read(1024 * 1024)
+
+            if not chunk:
+                break
+
+            result.update(chunk)
+
+    return result.hexdigest()
+
+
+def _getIdenticalFileGroups(copies):
+    """Group copies by identical source contents and permissions.
+
+    Only files of the same size and mode have their contents compared, which
+    typically leaves few of them to read.
+    """
+
+    by_size = OrderedDict()
+
+    for dest_path, source_path in iterItems(copies):
+        source_stat = os.stat(source_path)
+
+        by_size.setdefault((source_stat.st_size, source_stat.st_mode), []).append(
+            dest_path
+        )
+
+    result = []
+
+    for dest_paths in by_size.values():
+        if len(dest_paths) == 1:
+            result.append(dest_paths)
+            continue
+
+        by_hash = OrderedDict()
+
+        for dest_path in dest_paths:
+            by_hash.setdefault(_getFileContentsHash(copies[dest_path]), []).append(
+                dest_path
+            )
+
+        result.extend(by_hash.values())
+
+    return result
+
+
+def _copyFileGroup(copies, dest_paths, with_permissions):
+    first_dest_path = dest_paths[0]
+
+    if with_permissions:
+        copyFileWithPermissions(
+            source_path=copies[first_dest_path], dest_path=first_dest_path
+        )
+    else:
+        copyFile(source_path=copies[first_dest_path], dest_path=first_dest_path)
+
+    for dest_path in dest_paths[1:]:
+        try:
+            os.link(first_dest_path, dest_path)
+        except (OSError, AttributeError):
+            # No hard links possible, e.g. not supported by file system.
+            if with_permissions:
+                copyFileWithPermissions(
+                    source_path=first_dest_path, dest_path=dest_path
+                )
+            else:
+                copyFile(source_path=first_dest_path, dest_path=dest_path)
+
+
+def _copyFiles(copies, with_permissions, share_identical):
+    """Copy files to the dist folder, in parallel.
+
+    Args:
+        copies: dict of target path to source path
+        with_permissions: copy permissions and times too
+        share_identical: files with identical contents become hard links
+            of one another in the dist folder
+
+    Notes:
+        Copies are made as clones where the file system supports it, so
+        they do not duplicate the data.
+    """
+
+    if share_identical:
+        file_groups = _getIdenticalFileGroups(copies)
+    else:
+        file_groups = [[dest_path] for dest_path in copies]
+
+    with ThreadPoolExecutor(max_workers=Utils.getCoreCount() * 2) as worker_pool:
+        workers = []
+
+        for dest_paths in file_groups:
+            for dest_path in dest_paths:
+                if os.path.exists(dest_path):
+                    os.unlink(dest_path)
+
+            workers.append(
+                worker_pool.submit(
+                    _copyFileGroup,
+                    copies,
+                    dest_paths,
+                    with_permissions,
+                )
+            )
+
+        for _result in waitWorkers(workers):
+            pass
+
+
+def _handleDataFile(dist_dir, tracer, included_datafile, data_file_copies):
+    """Handle a data file.
+
+    Files to copy are only recorded in "data_file_copies", such that copying
+    can be done in parallel later.
+    """
     if not isinstance(included_datafile, IncludedDataFile):
         tracer.sysexit(
             "Error, cannot only include 'IncludedDataFile' objects in plugins."
@@ -1356,9 +1610,10 @@ def _handleDataFile(dist_dir, tracer, included_datafile):
             created_dir = os.path.join(dist_dir, sub_dir)
 
             makePath(created_dir)
-            putTextFileContents(
-                filename=os.path.join(created_dir, ".keep_dir.txt"), contents=""
-            )
+
+            keep_filename = os.path.join(created_dir, ".keep_dir.txt")
+            data_file_copies.pop(keep_filename, None)
+            putTextFileContents(filename=keep_filename, contents="")
 
     elif included_datafile.kind == "data_file":
         dest_path = os.path.join(dist_dir, included_datafile.dest_path)
@@ -1372,14 +1627,28 @@ def _handleDataFile(dist_dir, tracer, included_datafile):
         )
 
         makePath(os.path.dirname(dest_path))
-        copyFileWithPermissions(
-            source_path=included_datafile.source_path, dest_path=dest_path
-        )
+
+        # Replacing an earlier one, we want to keep the order of copies.
+        data_file_copies.pop(dest_path, None)
+        data_file_copies[dest_path] = included_datafile.source_path
     elif included_datafile.kind == "data_dir":
         dest_path = os.path.join(dist_dir, included_datafile.dest_path)
-        makePath(os.path.dirname(dest_path))
+        makePath(dest_path)
+
+        for sub_dir in getSubDirectories(included_datafile.source_path):
+            makePath(
+                os.path.join(dest_path, relpath(sub_dir, included_datafile.source_path))
+            )
 
-        copied = copyTree(included_datafile.source_path, dest_path)
+        copied = getFileList(included_datafile.source_path)
+
+        for filename in copied:
+            target_filename = os.path.join(
+                dest_path, relpath(filename, included_datafile.source_path)
+            )
+
+            data_file_copies.pop(target_filename, None)
+            data_file_copies[target_filename] = filename
 
         tracer.info(
             "Included data dir %r with %d files due to %s."
@@ -1393,6 +1662,7 @@ def _handleDataFile(dist_dir, tracer, included_datafile):
         dest_path = os.path.join(dist_dir, included_datafile.dest_path)
         makePath(os.path.dirname(dest_path))
 
+        data_file_copies.pop(dest_path, None)
         putTextFileContents(filename=dest_path, contents=included_datafile.data)
 
         tracer.info(
@@ -1406,19 +1676,27 @@ def _handleDataFile(dist_dir, tracer, included_datafile):
         assert False, included_datafile
 
 
-def copyDataFiles(dist_dir):
-    """Copy the data files needed for standalone distribution.
+def _getDataFileCopies(dist_dir):
+    """Get the data files needed for standalone distribution.
 
     Args:
         dist_dir: The distribution folder under creation
+    Returns:
+        dict of target path to source path of files to copy.
     Notes:
-        This is for data files only, not DLLs or even extension modules,
-        those must be registered as entry points, and would not go through
-        necessary handling if provided like this.
+        This is done only once, as embedding data files needs to know
+        them before the binary is built, and copying them afterwards.
     """
 
+    # Using the function object to cache its result, avoiding global variable
+    # usage.
+    if hasattr(_getDataFileCopies, "result"):
+        return _getDataFileCopies.result
+
     # Many details to deal with, pylint: disable=too-many-branches,too-many-locals
 
+    data_file_copies = OrderedDict()
+
     for pattern, src, dest, arg in Options.getShallIncludeDataFiles():
         filenames = resolveShellPatternToFilenames(pattern)
 
@@ -1442,6 +1720,7 @@ def copyDataFiles(dist_dir):
                 dist_dir,
                 inclusion_logger,
                 makeIncludedDataFile(filename, rel_path, file_reason),
+                data_file_copies,
             )
 
     for src, dest in Options.getShallIncludeDataDirs():
@@ -1461,6 +1740,7 @@ def copyDataFiles(dist_dir):
                 dist_dir,
                 inclusion_logger,
                 makeIncludedDataFile(filename, rel_path, file_reason),
+                data_file_copies,
             )
 
     # Cyclic dependency
@@ -1469,7 +1749,10 @@ def copyDataFiles(dist_dir):
     for module in ModuleRegistry.getDoneModules():
         for plugin, included_datafile in Plugins.considerDataFiles(module):
             _handleDataFile(
-                dist_dir=dist_dir, tracer=plugin, included_datafile=included_datafile
+                dist_dir=dist_dir,
+                tracer=plugin,
+                included_datafile=included_datafile,
+                data_file_copies=data_file_copies,
             )
 
     for module in ModuleRegistry.getDoneModules():
@@ -1503,6 +1786,66 @@ def copyDataFiles(dist_dir):
                             dist_dir,
                             inclusion_logger,
                             makeIncludedDataFile(pkg_filename, rel_path, file_reason),
+                            data_file_copies,
                         )
 
                 # assert False, (module.getCompileTimeDirectory(), pkg_files)
+
+    _getDataFileCopies.result = data_file_copies
+
+    return data_file_copies
+
+
+def _getEmbeddedDataFileName(dist_dir, dest_path):
+    """Get the name of a data file inside the binary, None if not embedded."""
+
+    name = relpath(dest_path, dist_dir).replace(os.path.sep, "/")
+
+    for pattern in Options.getShallEmbedDataFilePatterns():
+        if fnmatch.fnmatch(name, pattern):
+            return name
+
+    return None
+
+
+def getEmbeddedDataFiles(dist_dir):
+    """Get the data files to embed into the binary.
+
+    Args:
+        dist_dir: The distribution folder under creation
+    Returns:
+        list of (name, source path) tuples, with the name being the path
+        relative to the distribution folder, using "/" as separator.
+    """
+
+    result = []
+
+    for dest_path, source_path in iterItems(_getDataFileCopies(dist_dir)):
+        name = _getEmbeddedDataFileName(dist_dir, dest_path)
+
+        if name is not None:
+            result.append((name, source_path))
+
+    return result
+
+
+def copyDataFiles(dist_dir):
+    """Copy the data files needed for standalone distribution.
+
+    Args:
+        dist_dir: The distribution folder under creation
+    Notes:
+        This is for data files only, not DLLs or even extension modules,
+        those must be registered as entry points, and would not go through
+        necessary handling if provided like this.
+
+        Data files embedded into the binary are not copied.
+    """
+
+    data_file_copies = OrderedDict(
+        (dest_path, source_path)
+        for dest_path, source_path in iterItems(_getDataFileCopies(dist_dir))
+        if _getEmbeddedDataFileName(dist_dir, dest_path) is None
+    )
+
+    _copyFiles(copies=data_file_copies, with_permissions=True, share_identical=True)
@@ -0,0 +1,148 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Index of directory contents for locating modules.
+
+Finding a module checks many candidate names in every search path element,
+and doing a file system check for each is slow, esp. on network file systems.
+Instead, the directory is listed once, with the kind of its entries, and then
+the candidates are looked up in that.
+
+The index lives for the compilation only, search path directories are not
+expected to change during it.
+"""
+
+import os
+
+from nuitka.utils.FileOperations import getDirectoryRealPath
+from nuitka.utils.Utils import getOS, isMacOS
+
+_directory_indexes = {}
+
+# Some platforms are case insensitive, there lookups ignore the case, like
+# "os.path.isfile" would.
+_case_sensitive = not isMacOS() and getOS() != "Windows"
+
+# Indexes by names with normalized case, for case insensitive platforms.
+_directory_lookups = {}
+
+# Kinds of directory entries, anything else, e.g. broken links, is None.
+_kind_directory = "d"
+_kind_file = "f"
+
+
+def _getEntryKind(path):
+    if os.path.isdir(path):
+        return _kind_directory
+    elif os.path.isfile(path):
+        return _kind_file
+    else:
+        return None
+
+
+def _makeDirectoryIndex(dirname):
+    if hasattr(os, "scandir"):
+        result = {}
+
+        for entry in os.scandir(dirname):
+            if entry.is_dir():
+                result[entry.name] = _kind_directory
+            elif entry.is_file():
+                result[entry.name] = _kind_file
+            else:
+                result[entry.name] = None
+    else:
+        result = dict(
+            (filename, _getEntryKind(os.path.join(dirname, filename)))
+            for filename in os.listdir(getDirectoryRealPath(dirname))
+        )
+
+    return result
+
+
+def getDirectoryIndex(dirname):
+    """Get the index of a directory.
+
+    Args:
+        dirname: directory to get the index for
+
+    Returns:
+        Dictionary of filenames to their kind, or None, if it's not a
+        directory that can be listed.
+    """
+    if dirname not in _directory_indexes:
+        try:
+            _directory_indexes[dirname] = _makeDirectoryIndex(dirname or ".")
+        except OSError:
+            _directory_indexes[dirname] = None
+
+    return _directory_indexes[dirname]
+
+
+def _getDirectoryLookup(dirname):
+    if _case_sensitive:
+        return getDirectoryIndex(dirname)
+
+    key = os.path.normcase(dirname).lower()
+
+    if key not in _directory_lookups:
+        index = getDirectoryIndex(dirname)
+
+        if index is not None:
+            index = dict((filename.lower(), kind) for filename, kind in index.items())
+
+        _directory_lookups[key] = index
+
+    return _directory_lookups[key]
+
+
+def _getIndexedKind(path):
+    dirname, filename = os.path.split(path)
+
+    # Trailing slashes, and roots, are not worth the trouble.
+    if not filename:
+        return _getEntryKind(path)
+
+    index = _getDirectoryLookup(dirname)
+
+    if index is None:
+        return None
+
+    if not _case_sensitive:
+        filename = filename.lower()
+
+    return index.get(filename)
+
+
+def isIndexedDirectory(path):
+    """Check for a directory, like "os.path.isdir" would, but using the index."""
+    return _getIndexedKind(path) == _kind_directory
+
+
+def isIndexedFile(path):
+    """Check for a file, like "os.path.isfile" would, but using the index."""
+    return _getIndexedKind(path) == _kind_file
+
+
+def getIndexedFilenames(dirname):
+    """Get the sorted filenames of a directory, empty if it's not one."""
+    index = getDirectoryIndex(dirname)
+
+    if index is None:
+        return ()
+
+    return sorted(index)
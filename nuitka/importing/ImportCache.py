@@ -33,6 +33,10 @@ from nuitka.utils.FileOperations import relpath
 imported_modules = {}
 imported_by_name = {}
 
+# Modules by their path, in order of addition, as the key only consists of
+# the path for packages, it can have multiple modules.
+imported_by_path = {}
+
 
 def addImportedModule(imported_module):
     module_filename = relpath(imported_module.getFilename())
@@ -47,6 +51,8 @@ def addImportedModule(imported_module):
     else:
         Plugins.onModuleDiscovered(imported_module)
 
+        imported_by_path.setdefault(module_filename, []).append(imported_module)
+
     imported_modules[key] = imported_module
     imported_by_name[imported_module.getFullName()] = imported_module
 
@@ -55,11 +61,7 @@ def addImportedModule(imported_module):
 
 
 def isImportedModuleByPath(module_relpath):
-    for key in imported_modules:
-        if key[0] == module_relpath:
-            return True
-
-    return False
+    return module_relpath in imported_by_path
 
 
 def isImportedModuleByName(full_name):
@@ -82,15 +84,14 @@ def getImportedModuleByNameAndPath(full_name, module_relpath):
 
 
 def getImportedModuleByPath(module_relpath, module_package):
-    for key, module in imported_modules.items():
-        if key[0] == module_relpath:
-            if (
-                module.getCompileTimeFilename().endswith("__init__.py")
-                and module.getFullName().getPackageName() != module_package
-            ):
-                continue
+    for module in imported_by_path.get(module_relpath, ()):
+        if (
+            module.getCompileTimeFilename().endswith("__init__.py")
+            and module.getFullName().getPackageName() != module_package
+        ):
+            continue
 
-            return module
+        return module
 
     raise KeyError(module_relpath)
 
@@ -106,6 +107,9 @@ def replaceImportedModule(old, new):
     for key, value in imported_modules.items():
         if value == old:
             imported_modules[key] = new
+
+            modules = imported_by_path[key[0]]
+            modules[modules.index(old)] = new
             break
     else:
         assert False
@@ -54,6 +54,7 @@ from nuitka.utils.Importing import getSharedLibrarySuffixes
 from nuitka.utils.ModuleNames import ModuleName
 from nuitka.utils.Utils import getOS, isMacOS
 
+from .DirectoryIndex import isIndexedDirectory, isIndexedFile
 from .IgnoreListing import isIgnoreListedNotExistingModule
 from .PreloadedPackages import getPreloadedPackagePath, isPreloadedPackagePath
 
@@ -90,10 +91,10 @@ def isPackageDir(dirname):
 
     return (
         "." not in os.path.basename(dirname)
-        and os.path.isdir(dirname)
+        and isIndexedDirectory(dirname)
         and (
             python_version >= 0x300
-            or os.path.isfile(os.path.join(dirname, "__init__.py"))
+            or isIndexedFile(os.path.join(dirname, "__init__.py"))
             or isPreloadedPackagePath(dirname)
         )
     )
@@ -384,7 +385,7 @@ def _findModuleInPath2(package_name, module_name, search_path):
 
         # First, check for a package with an init file, that would be the
         # first choice.
-        if os.path.isdir(package_directory):
+        if isIndexedDirectory(package_directory):
             found = False
 
             for suffix, _mode, mtype in imp.get_suffixes():
@@ -395,7 +396,7 @@ def _findModuleInPath2(package_name, module_name, search_path):
 
                 file_path = os.path.join(package_directory, package_file_name)
 
-                if os.path.isfile(file_path):
+                if isIndexedFile(file_path):
                     candidates.add(
                         ImportScanFinding(
                             found_in=entry,
@@ -425,7 +426,7 @@ def _findModuleInPath2(package_name, module_name, search_path):
 
             full_path = os.path.join(entry, module_name + suffix)
 
-            if os.path.isfile(full_path):
+            if isIndexedFile(full_path):
                 candidates.add(
                     ImportScanFinding(
                         found_in=entry,
@@ -502,9 +503,24 @@ def _unpackPathElement(path_entry):
     return path_entry
 
 
+_package_search_path_cache = {}
+
+
 def getPackageSearchPath(package_name):
     assert main_path is not None
 
+    # Plugins may extend "sys.path", so it is part of the key, and the current
+    # directory is searched first.
+    key = package_name, os.getcwd(), tuple(sys.path)
+
+    if key not in _package_search_path_cache:
+        _package_search_path_cache[key] = _getPackageSearchPath(package_name)
+
+    # Copy, as callers may extend the result.
+    return list(_package_search_path_cache[key])
+
+
+def _getPackageSearchPath(package_name):
     if package_name is None:
         return [os.getcwd(), main_path] + [
             _unpackPathElement(path_element) for path_element in sys.path
@@ -39,7 +39,15 @@ from .NodeMakingHelpers import (
     makeStatementExpressionOnlyReplacementNode,
     makeStatementsSequenceReplacementNode,
 )
-from .shapes.StandardShapes import tshape_unknown
+from .shapes.BuiltinTypeShapes import scalar_shapes
+from .shapes.StandardShapes import tshape_uninit, tshape_unknown
+
+
+def _mayReleaseRunUserCode(value_trace):
+    # Releasing values of unknown type may execute "__del__" code.
+    type_shape = value_trace.getTypeShape()
+
+    return type_shape is not tshape_uninit and type_shape not in scalar_shapes
 
 
 class StatementAssignmentVariableName(StatementChildHavingBase):
@@ -235,6 +243,11 @@ class StatementAssignmentVariable(StatementChildHavingBase):
     def mayRaiseException(self, exception_type):
         return self.subnode_source.mayRaiseException(exception_type)
 
+    def mayRunUserCode(self):
+        return self.variable_trace is None or _mayReleaseRunUserCode(
+            self.variable_trace.getPrevious()
+        )
+
     def computeStatement(self, trace_collection):
         # This is very complex stuff, pylint: disable=too-many-branches,too-many-return-statements
 
@@ -656,6 +669,11 @@ class StatementDelVariable(StatementBase):
 
             return True
 
+    def mayRunUserCode(self):
+        return self.previous_trace is None or _mayReleaseRunUserCode(
+            self.previous_trace
+        )
+
 
 class StatementReleaseVariable(StatementBase):
     """Releasing a variable.
@@ -752,3 +770,8 @@ class StatementReleaseVariable(StatementBase):
     def mayRaiseException(self, exception_type):
         # By default, __del__ is not allowed to raise an exception.
         return False
+
+    def mayRunUserCode(self):
+        return self.variable_trace is None or _mayReleaseRunUserCode(
+            self.variable_trace
+        )
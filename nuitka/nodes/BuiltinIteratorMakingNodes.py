@@ -0,0 +1,155 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Nodes for the built-ins that make iterators from other iterables.
+
+These are 'enumerate', 'zip', 'map' and 'filter', the latter three only for
+Python3, where they are iterators rather than lists. Knowing the shape of
+their result allows to remove the 'iter' call of for loops over them, and
+their creation calls the built-in type directly, rather than looking up the
+built-in by name at run time.
+"""
+
+from .ExpressionBases import (
+    ExpressionChildHavingBase,
+    ExpressionChildrenHavingBase,
+    ExpressionChildTupleHavingBase,
+)
+from .shapes.BuiltinTypeShapes import (
+    tshape_enumerate,
+    tshape_filter,
+    tshape_map,
+    tshape_zip,
+)
+
+
+class ExpressionBuiltinIteratorMakingMixin(object):
+    # Mixins are required to slots
+    __slots__ = ()
+
+    def computeExpression(self, trace_collection):
+        # Making the iterator will call "iter" on the arguments, which may
+        # execute any code and give the values to the iterator.
+        for value in self.getVisitableNodes():
+            value.onContentEscapes(trace_collection)
+
+        # Any code could be run, note that.
+        trace_collection.onControlFlowEscape(self)
+
+        # Any exception may be raised.
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        # Iteration over an iterator is that iterator.
+
+        return self, "new_builtin", "Eliminated useless iterator creation."
+
+    @staticmethod
+    def isKnownToBeIterable(count):
+        # Length is not known, but it can be iterated.
+        return count is None
+
+
+class ExpressionBuiltinEnumerate1(
+    ExpressionBuiltinIteratorMakingMixin, ExpressionChildHavingBase
+):
+    kind = "EXPRESSION_BUILTIN_ENUMERATE1"
+
+    named_child = "iterable"
+
+    def __init__(self, iterable, source_ref):
+        ExpressionChildHavingBase.__init__(self, value=iterable, source_ref=source_ref)
+
+    @staticmethod
+    def getTypeShape():
+        return tshape_enumerate
+
+
+class ExpressionBuiltinEnumerate2(
+    ExpressionBuiltinIteratorMakingMixin, ExpressionChildrenHavingBase
+):
+    kind = "EXPRESSION_BUILTIN_ENUMERATE2"
+
+    named_children = ("iterable", "start")
+
+    def __init__(self, iterable, start, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self, values={"iterable": iterable, "start": start}, source_ref=source_ref
+        )
+
+    @staticmethod
+    def getTypeShape():
+        return tshape_enumerate
+
+
+class ExpressionBuiltinZip(
+    ExpressionBuiltinIteratorMakingMixin, ExpressionChildTupleHavingBase
+):
+    kind = "EXPRESSION_BUILTIN_ZIP"
+
+    named_child = "iterables"
+
+    def __init__(self, iterables, source_ref):
+        ExpressionChildTupleHavingBase.__init__(
+            self, value=tuple(iterables), source_ref=source_ref
+        )
+
+    @staticmethod
+    def getTypeShape():
+        return tshape_zip
+
+
+class ExpressionBuiltinMap(
+    ExpressionBuiltinIteratorMakingMixin, ExpressionChildrenHavingBase
+):
+    kind = "EXPRESSION_BUILTIN_MAP"
+
+    named_children = ("function", "iterables")
+
+    def __init__(self, function, iterables, source_ref):
+        assert iterables
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values={"function": function, "iterables": tuple(iterables)},
+            source_ref=source_ref,
+        )
+
+    @staticmethod
+    def getTypeShape():
+        return tshape_map
+
+
+class ExpressionBuiltinFilter(
+    ExpressionBuiltinIteratorMakingMixin, ExpressionChildrenHavingBase
+):
+    kind = "EXPRESSION_BUILTIN_FILTER"
+
+    named_children = ("function", "iterable")
+
+    def __init__(self, function, iterable, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values={"function": function, "iterable": iterable},
+            source_ref=source_ref,
+        )
+
+    @staticmethod
+    def getTypeShape():
+        return tshape_filter
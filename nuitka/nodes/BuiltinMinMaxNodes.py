@@ -0,0 +1,98 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Nodes for the calls to the 'min' and 'max' built-ins.
+
+Only the forms without 'key' and 'default' arguments are handled here. With
+one argument, that is iterated, with more, the arguments are compared in
+turn, which for the very common two argument case needs only one rich
+comparison and no argument tuple at all.
+"""
+
+from .ExpressionBases import ExpressionChildTupleHavingBase
+from .shapes.StandardShapes import tshape_unknown
+
+
+class ExpressionBuiltinMinMaxBase(ExpressionChildTupleHavingBase):
+    named_child = "values"
+
+    # For overload, the built-in to use for compile time computation.
+    simulator = None
+
+    def __init__(self, values, source_ref):
+        assert values
+
+        ExpressionChildTupleHavingBase.__init__(
+            self, value=tuple(values), source_ref=source_ref
+        )
+
+    def computeExpression(self, trace_collection):
+        values = self.subnode_values
+
+        if all(value.isCompileTimeConstant() for value in values):
+            return trace_collection.getCompileTimeComputationResult(
+                node=self,
+                computation=lambda: self.simulator(
+                    *(value.getCompileTimeConstant() for value in values)
+                ),
+                description="Built-in call to '%s' pre-computed."
+                % self.simulator.__name__,
+            )
+
+        if len(values) == 1:
+            values[0].onContentEscapes(trace_collection)
+
+        # Any code could be run, note that.
+        trace_collection.onControlFlowEscape(self)
+
+        # Any exception may be raised.
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def isChildValueReadOnly(self, child):
+        # A single argument is only iterated, otherwise values are returned.
+        values = self.subnode_values
+
+        return len(values) == 1 and child is values[0]
+
+    def getTypeShape(self):
+        values = self.subnode_values
+
+        # For a single argument, the elements of it would have to be known.
+        if len(values) == 1:
+            return tshape_unknown
+
+        result = values[0].getTypeShape()
+
+        for value in values[1:]:
+            if value.getTypeShape() is not result:
+                return tshape_unknown
+
+        return result
+
+
+class ExpressionBuiltinMin(ExpressionBuiltinMinMaxBase):
+    kind = "EXPRESSION_BUILTIN_MIN"
+
+    simulator = min
+
+
+class ExpressionBuiltinMax(ExpressionBuiltinMinMaxBase):
+    kind = "EXPRESSION_BUILTIN_MAX"
+
+    simulator = max
@@ -0,0 +1,78 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Node for the calls to the 'sorted' built-in.
+
+The result is always a new list, which is type knowledge that following
+operations on it can use.
+"""
+
+from .ExpressionBases import ExpressionChildrenHavingBase
+from .shapes.BuiltinTypeShapes import tshape_list
+
+
+class ExpressionBuiltinSorted(ExpressionChildrenHavingBase):
+    kind = "EXPRESSION_BUILTIN_SORTED"
+
+    named_children = ("iterable", "key", "reverse")
+
+    def __init__(self, iterable, key, reverse, source_ref):
+        assert iterable is not None
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values={"iterable": iterable, "key": key, "reverse": reverse},
+            source_ref=source_ref,
+        )
+
+    def isChildValueReadOnly(self, child):
+        # The iterable is only read to create a new list.
+        return child is self.subnode_iterable
+
+    def computeExpression(self, trace_collection):
+        iterable = self.subnode_iterable
+        key = self.subnode_key
+        reverse = self.subnode_reverse
+
+        if (
+            key is None
+            and iterable.isCompileTimeConstant()
+            and (reverse is None or reverse.isCompileTimeConstant())
+        ):
+            return trace_collection.getCompileTimeComputationResult(
+                node=self,
+                computation=lambda: sorted(
+                    iterable.getCompileTimeConstant(),
+                    reverse=reverse is not None and reverse.getCompileTimeConstant(),
+                ),
+                description="Built-in call to 'sorted' pre-computed.",
+            )
+
+        # Iteration and comparison of the values may execute any code.
+        iterable.onContentEscapes(trace_collection)
+
+        # Any code could be run, note that.
+        trace_collection.onControlFlowEscape(self)
+
+        # Any exception may be raised.
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    @staticmethod
+    def getTypeShape():
+        return tshape_list
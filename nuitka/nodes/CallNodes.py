@@ -47,6 +47,9 @@ class ExpressionCall(ExpressionChildrenHavingBase):
     def isExpressionCall():
         return True
 
+    def getTypeShape(self):
+        return self.subnode_called.getCallResultTypeShape()
+
     def computeExpression(self, trace_collection):
         called = self.subnode_called
 
@@ -90,6 +93,9 @@ class ExpressionCallNoKeywords(ExpressionChildrenHavingBase):
     def isExpressionCall():
         return True
 
+    def getTypeShape(self):
+        return self.subnode_called.getCallResultTypeShape()
+
     def extractSideEffectsPreCall(self):
         args = self.subnode_args
 
@@ -122,6 +128,9 @@ class ExpressionCallKeywordsOnly(ExpressionChildrenHavingBase):
     def isExpressionCall():
         return True
 
+    def getTypeShape(self):
+        return self.subnode_called.getCallResultTypeShape()
+
     def extractSideEffectsPreCall(self):
         kw = self.subnode_kwargs
 
@@ -153,6 +162,9 @@ class ExpressionCallEmpty(ExpressionChildHavingBase):
     def isExpressionCall():
         return True
 
+    def getTypeShape(self):
+        return self.subnode_called.getCallResultTypeShape()
+
     @staticmethod
     def extractSideEffectsPreCall():
         return ()
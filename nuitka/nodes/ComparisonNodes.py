@@ -25,6 +25,7 @@ from nuitka.PythonVersions import python_version
 
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .NodeMakingHelpers import (
+    makeComputationCacheKey,
     makeConstantReplacementNode,
     makeRaiseExceptionReplacementExpressionFromInstance,
     wrapExpressionWithSideEffects,
@@ -69,6 +70,10 @@ class ExpressionComparisonBase(ExpressionChildrenHavingBase):
             node=self,
             computation=lambda: self.getSimulator()(left_value, right_value),
             description="Comparison of constant arguments.",
+            # Identity of values is not part of the key.
+            cache_key=makeComputationCacheKey(self.comparator, left_value, right_value)
+            if self.comparator not in ("Is", "IsNot")
+            else None,
         )
 
     def makeInverseComparision(self):
@@ -220,6 +225,9 @@ class ExpressionComparisonRichBase(ExpressionComparisonBase):
             self.escape_desc is None or self.escape_desc.getExceptionExit() is not None
         )
 
+    def mayRunUserCode(self):
+        return self.escape_desc is None or self.escape_desc.isControlFlowEscape()
+
 
 class ExpressionComparisonLt(ExpressionComparisonRichBase):
     kind = "EXPRESSION_COMPARISON_LT"
@@ -340,6 +348,11 @@ class ExpressionComparisonIsIsNotBase(ExpressionComparisonBase):
     def mayRaiseExceptionBool(self, exception_type):
         return False
 
+    @staticmethod
+    def mayRunUserCode():
+        # Identity is checked without asking the values.
+        return False
+
     def computeExpression(self, trace_collection):
         left, right = self.getOperands()
 
@@ -506,6 +519,11 @@ class ExpressionComparisonExceptionMatchBase(ExpressionComparisonBase):
     def mayRaiseExceptionBool(exception_type):
         return False
 
+    def mayRunUserCode(self):
+        # Only built-in exception classes are known to not have a meta class
+        # that checks sub classes with code of its own.
+        return self.subnode_right.getTypeShape() is not tshape_exception_class
+
 
 class ExpressionComparisonExceptionMatch(ExpressionComparisonExceptionMatchBase):
     kind = "EXPRESSION_COMPARISON_EXCEPTION_MATCH"
@@ -552,6 +570,10 @@ class ExpressionComparisonInNotInBase(ExpressionComparisonBase):
     def mayRaiseExceptionBool(exception_type):
         return False
 
+    def isChildValueReadOnly(self, child):
+        # Containment checks only look at the container.
+        return child is self.subnode_right
+
     def computeExpression(self, trace_collection):
         return self.subnode_right.computeExpressionComparisonIn(
             in_node=self,
@@ -34,7 +34,7 @@ from .NodeMakingHelpers import (
     wrapStatementWithSideEffects,
 )
 from .OperatorNodesUnary import ExpressionOperationNot
-from .shapes.BuiltinTypeShapes import tshape_bool
+from .shapes.BuiltinTypeShapes import scalar_shapes, tshape_bool
 from .StatementNodes import StatementsSequence
 
 
@@ -425,6 +425,10 @@ class StatementConditional(StatementChildrenHavingBase):
             source_ref=source_ref,
         )
 
+    def mayRunUserCode(self):
+        # Checking the truth of values of unknown type may run code.
+        return self.subnode_condition.getTypeShape() not in scalar_shapes
+
     def isStatementAborting(self):
         yes_branch = self.subnode_yes_branch
 
@@ -190,6 +190,10 @@ class ExpressionMakeTuple(ExpressionMakeSequenceBase):
             self, sequence_kind="TUPLE", elements=elements, source_ref=source_ref
         )
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     @staticmethod
     def getTypeShape():
         return tshape_tuple
@@ -243,6 +247,10 @@ class ExpressionMakeList(ExpressionMakeSequenceBase):
             self, sequence_kind="LIST", elements=elements, source_ref=source_ref
         )
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     @staticmethod
     def getTypeShape():
         return tshape_list
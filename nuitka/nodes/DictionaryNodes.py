@@ -378,6 +378,9 @@ class StatementDictOperationSet(StatementChildrenHavingBase):
             # Any exception may be raised.
             trace_collection.onExceptionRaiseExit(BaseException)
 
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         # TODO: Until we have proper dictionary tracing, do this.
         trace_collection.removeKnowledge(self.subnode_dict_arg)
 
@@ -436,6 +439,10 @@ class StatementDictOperationRemove(StatementChildrenHavingBase):
         # Any exception may be raised, we don't know if the key is present.
         trace_collection.onExceptionRaiseExit(BaseException)
 
+        if not self.subnode_key.isKnownToBeHashable():
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         # TODO: Until we have proper dictionary tracing, do this.
         trace_collection.removeKnowledge(self.subnode_dict_arg)
 
@@ -492,6 +499,10 @@ class ExpressionDictOperationPop2(ExpressionChildrenHavingBase):
                     side_effects=(dict_arg, key),
                 )
 
+        if self.known_hashable_key is None:
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         # TODO: Check if dict_arg has key.
 
         # TODO: Until we have proper dictionary tracing, do this.
@@ -560,6 +571,10 @@ class ExpressionDictOperationPop3(ExpressionChildrenHavingBase):
                     side_effects=(dict_arg, key, self.subnode_default),
                 )
 
+        if self.known_hashable_key is None:
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         # TODO: Check if dict_arg has key
 
         # TODO: Until we have proper dictionary tracing, do this.
@@ -621,6 +636,10 @@ class ExpressionDictOperationSetdefault2(ExpressionChildrenHavingBase):
                     side_effects=(dict_arg, key),
                 )
 
+        if self.known_hashable_key is None:
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         # TODO: Check if dict_arg has key, and eliminate this node entirely
         # if that's the case with hashing of the key as a remaining side effect
         # though.
@@ -680,6 +699,10 @@ class ExpressionDictOperationSetdefault3(ExpressionChildrenHavingBase):
                     side_effects=(dict_arg, key, self.subnode_default),
                 )
 
+        if self.known_hashable_key is None:
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         # TODO: Check if dict_arg has key, and eliminate this node entirely
         # if that's the case with hashing of the key as a remaining side effect
         # though.
@@ -717,6 +740,10 @@ class ExpressionDictOperationItem(ExpressionChildrenHavingBase):
             self, values={"dict_arg": dict_arg, "key": key}, source_ref=source_ref
         )
 
+    def isChildValueReadOnly(self, child):
+        # Lookups only look at the dictionary.
+        return child is self.subnode_dict_arg
+
     def computeExpression(self, trace_collection):
         dict_arg = self.subnode_dict_arg
         key = self.subnode_key
@@ -734,6 +761,10 @@ class ExpressionDictOperationItem(ExpressionChildrenHavingBase):
         # TODO: Only if the key is not hashable.
         trace_collection.onExceptionRaiseExit(BaseException)
 
+        if not key.isKnownToBeHashable():
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         return self, None, None
 
 
@@ -756,6 +787,10 @@ class ExpressionDictOperationGet2(ExpressionChildrenHavingBase):
 
         self.known_hashable_key = None
 
+    def isChildValueReadOnly(self, child):
+        # Lookups only look at the dictionary.
+        return child is self.subnode_dict_arg
+
     def computeExpression(self, trace_collection):
         dict_arg = self.subnode_dict_arg
         key = self.subnode_key
@@ -795,6 +830,9 @@ class ExpressionDictOperationGet2(ExpressionChildrenHavingBase):
         if self.known_hashable_key is None:
             trace_collection.onExceptionRaiseExit(BaseException)
 
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         return self, None, None
 
     def mayRaiseException(self, exception_type):
@@ -846,6 +884,10 @@ class ExpressionDictOperationGet3(ExpressionChildrenHavingBase):
 
         self.known_hashable_key = None
 
+    def isChildValueReadOnly(self, child):
+        # Lookups only look at the dictionary.
+        return child is self.subnode_dict_arg
+
     def computeExpression(self, trace_collection):
         dict_arg = self.subnode_dict_arg
         key = self.subnode_key
@@ -900,6 +942,9 @@ class ExpressionDictOperationGet3(ExpressionChildrenHavingBase):
         if self.known_hashable_key is None:
             trace_collection.onExceptionRaiseExit(BaseException)
 
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         return self, None, None
 
     def mayRaiseException(self, exception_type):
@@ -1300,6 +1345,10 @@ class StatementDictOperationUpdate(StatementChildrenHavingBase):
             self, values={"dict_arg": dict_arg, "value": value}, source_ref=source_ref
         )
 
+    def isChildValueReadOnly(self, child):
+        # The update only looks at the value, the dictionary is changed.
+        return child is self.subnode_value
+
     def computeStatement(self, trace_collection):
         result, change_tags, change_desc = self.computeStatementSubExpressions(
             trace_collection=trace_collection
@@ -1357,6 +1406,10 @@ class ExpressionDictOperationInNotInUncertainBase(ExpressionChildrenHavingBase):
     def getTypeShape():
         return tshape_bool
 
+    def isChildValueReadOnly(self, child):
+        # Containment checks only look at the dictionary.
+        return child is self.subnode_dict_arg
+
     def computeExpression(self, trace_collection):
         if self.known_hashable_key is None:
             self.known_hashable_key = self.subnode_key.isKnownToBeHashable()
@@ -1374,6 +1427,9 @@ class ExpressionDictOperationInNotInUncertainBase(ExpressionChildrenHavingBase):
         if self.known_hashable_key is None:
             trace_collection.onExceptionRaiseExit(BaseException)
 
+            # Hashing the key may run any code, which may also look at the frame.
+            trace_collection.onControlFlowEscape(self)
+
         return self, None, None
 
     def mayRaiseException(self, exception_type):
@@ -187,6 +187,10 @@ class StatementRaiseExceptionImplicit(StatementRaiseException):
 class StatementReraiseException(StatementRaiseExceptionMixin, StatementBase):
     kind = "STATEMENT_RERAISE_EXCEPTION"
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def finalize(self):
         del self.parent
 
@@ -33,12 +33,18 @@ from nuitka.PythonVersions import python_version
 from .NodeBases import ChildrenHavingMixin, NodeBase
 from .NodeMakingHelpers import (
     getComputationResult,
+    makeComputationCacheKey,
     makeConstantReplacementNode,
     makeRaiseTypeErrorExceptionReplacementFromTemplateAndValue,
     wrapExpressionWithNodeSideEffects,
     wrapExpressionWithSideEffects,
 )
-from .shapes.BuiltinTypeShapes import tshape_dict, tshape_str, tshape_unicode
+from .shapes.BuiltinTypeShapes import (
+    scalar_shapes,
+    tshape_dict,
+    tshape_str,
+    tshape_unicode,
+)
 from .shapes.StandardShapes import tshape_unknown
 
 
@@ -50,6 +56,11 @@ class ExpressionBase(NodeBase):
     def getTypeShape():
         return tshape_unknown
 
+    @staticmethod
+    def getCallResultTypeShape():
+        """Type shape of the result, when called."""
+        return tshape_unknown
+
     def getValueShape(self):
         return self
 
@@ -856,6 +867,11 @@ class ExpressionNoSideEffectsMixin(object):
         # Virtual method overload
         return False
 
+    @staticmethod
+    def mayRunUserCode():
+        # Virtual method overload
+        return False
+
     @staticmethod
     def extractSideEffects():
         # Virtual method overload, we said we have no effects.
@@ -949,6 +965,7 @@ class CompileTimeConstantExpressionBase(ExpressionNoSideEffectsMixin, Expression
             computation=lambda: not self.getCompileTimeConstant(),
             description="""\
 Compile time constant negation truth value pre-computed.""",
+            cache_key=makeComputationCacheKey("not", self.getCompileTimeConstant()),
         )
 
     def computeExpressionOperationRepr(self, repr_node, trace_collection):
@@ -958,6 +975,9 @@ Compile time constant negation truth value pre-computed.""",
                 computation=lambda: repr(self.getCompileTimeConstant()),
                 description="""\
 Compile time constant repr value pre-computed.""",
+                cache_key=makeComputationCacheKey(
+                    "repr", self.getCompileTimeConstant()
+                ),
             ),
             None,
         )
@@ -968,6 +988,7 @@ Compile time constant repr value pre-computed.""",
             computation=lambda: len(self.getCompileTimeConstant()),
             description="""\
 Compile time constant len value pre-computed.""",
+            cache_key=makeComputationCacheKey("len", self.getCompileTimeConstant()),
         )
 
     def computeExpressionAbs(self, abs_node, trace_collection):
@@ -976,6 +997,7 @@ Compile time constant len value pre-computed.""",
             computation=lambda: abs(self.getCompileTimeConstant()),
             description="""\
 Compile time constant abs value pre-computed.""",
+            cache_key=makeComputationCacheKey("abs", self.getCompileTimeConstant()),
         )
 
     def computeExpressionInt(self, int_node, trace_collection):
@@ -984,6 +1006,7 @@ Compile time constant abs value pre-computed.""",
             computation=lambda: int(self.getCompileTimeConstant()),
             description="""\
 Compile time constant int value pre-computed.""",
+            cache_key=makeComputationCacheKey("int", self.getCompileTimeConstant()),
         )
 
     def computeExpressionLong(self, long_node, trace_collection):
@@ -992,6 +1015,7 @@ Compile time constant int value pre-computed.""",
             computation=lambda: long(self.getCompileTimeConstant()),
             description="""\
 Compile time constant long value pre-computed.""",
+            cache_key=makeComputationCacheKey("long", self.getCompileTimeConstant()),
         )
 
     def computeExpressionFloat(self, float_node, trace_collection):
@@ -1000,6 +1024,7 @@ Compile time constant long value pre-computed.""",
             computation=lambda: float(self.getCompileTimeConstant()),
             description="""\
 Compile time constant float value pre-computed.""",
+            cache_key=makeComputationCacheKey("float", self.getCompileTimeConstant()),
         )
 
     def computeExpressionBytes(self, bytes_node, trace_collection):
@@ -1014,6 +1039,7 @@ Compile time constant float value pre-computed.""",
             computation=lambda: bytes(constant_value),
             description="""\
 Compile time constant bytes value pre-computed.""",
+            cache_key=makeComputationCacheKey("bytes", constant_value),
         )
 
     def isKnownToHaveAttribute(self, attribute_name):
@@ -1052,6 +1078,11 @@ Compile time constant bytes value pre-computed.""",
                     subscript.getCompileTimeConstant()
                 ],
                 description="Subscript of constant with constant value.",
+                cache_key=makeComputationCacheKey(
+                    "subscript",
+                    self.getCompileTimeConstant(),
+                    subscript.getCompileTimeConstant(),
+                ),
             )
 
         # TODO: Look-up of subscript to index may happen.
@@ -1075,6 +1106,12 @@ Compile time constant bytes value pre-computed.""",
                             lower.getCompileTimeConstant() : upper.getCompileTimeConstant()
                         ],
                         description="Slicing of constant with constant indexes.",
+                        cache_key=makeComputationCacheKey(
+                            "slice",
+                            self.getCompileTimeConstant(),
+                            lower.getCompileTimeConstant(),
+                            upper.getCompileTimeConstant(),
+                        ),
                         user_provided=False,
                     )
             else:
@@ -1085,6 +1122,12 @@ Compile time constant bytes value pre-computed.""",
                             lower.getCompileTimeConstant() :
                         ],
                         description="Slicing of constant with constant lower index only.",
+                        cache_key=makeComputationCacheKey(
+                            "slice",
+                            self.getCompileTimeConstant(),
+                            lower.getCompileTimeConstant(),
+                            None,
+                        ),
                         user_provided=False,
                     )
         else:
@@ -1096,6 +1139,12 @@ Compile time constant bytes value pre-computed.""",
                             : upper.getCompileTimeConstant()
                         ],
                         description="Slicing of constant with constant upper index only.",
+                        cache_key=makeComputationCacheKey(
+                            "slice",
+                            self.getCompileTimeConstant(),
+                            None,
+                            upper.getCompileTimeConstant(),
+                        ),
                         user_provided=False,
                     )
             else:
@@ -1103,6 +1152,9 @@ Compile time constant bytes value pre-computed.""",
                     node=lookup_node,
                     computation=lambda: self.getCompileTimeConstant()[:],
                     description="Slicing of constant with no indexes.",
+                    cache_key=makeComputationCacheKey(
+                        "slice", self.getCompileTimeConstant(), None, None
+                    ),
                     user_provided=False,
                 )
 
@@ -1128,6 +1180,11 @@ Predicted '%s' on compiled time constant values."""
         # Look-up of __contains__ on compile time constants does mostly nothing.
         trace_collection.onExceptionRaiseExit(BaseException)
 
+        # Comparing to the contained values, or hashing, may run any code for
+        # values not of a built-in type, which may also look at the frame.
+        if value_node.getTypeShape() not in scalar_shapes:
+            trace_collection.onControlFlowEscape(in_node)
+
         return in_node, None, None
 
     def computeExpressionBool(self, trace_collection):
@@ -1197,13 +1254,13 @@ class ExpressionChildHavingBase(ExpressionBase):
 
             value.parent = self
 
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         setattr(self, attr_name, value)
 
     def finalize(self):
         del self.parent
 
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         if value is not None:
@@ -1218,7 +1275,7 @@ class ExpressionChildHavingBase(ExpressionBase):
         be overloaded, e.g. conditional expressions.
         """
         # First apply the sub-expression, as they it's evaluated before.
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         if value is not None:
@@ -1246,7 +1303,7 @@ class ExpressionChildHavingBase(ExpressionBase):
         if self.checker is not None:
             value = self.checker(value)  # False alarm, pylint: disable=not-callable
 
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
 
         # Checks if it's a real change in debug mode.
         if Options.is_debug:
@@ -1267,7 +1324,7 @@ class ExpressionChildHavingBase(ExpressionBase):
         if self.checker is not None:
             self.checker(None)  # False alarm, pylint: disable=not-callable
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_child_attr
 
         # Determine old value, and inform it about losing its parent.
         old_value = getattr(self, attr_name)
@@ -1279,12 +1336,12 @@ class ExpressionChildHavingBase(ExpressionBase):
         # Only accept legal child name
         assert name == self.named_child, name
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_child_attr
         return getattr(self, attr_name)
 
     def getVisitableNodes(self):
         # TODO:
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         # In this case, generator is not faster.
@@ -1298,7 +1355,7 @@ class ExpressionChildHavingBase(ExpressionBase):
 
         For generic code to use in outputs and code generation.
         """
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         yield self.named_child, value
@@ -1312,7 +1369,7 @@ class ExpressionChildHavingBase(ExpressionBase):
         # Find the replaced node, as an added difficulty, what might be
         # happening, is that the old node is an element of a tuple, in which we
         # may also remove that element, by setting it to None.
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         if old_node is value:
@@ -1323,7 +1380,7 @@ class ExpressionChildHavingBase(ExpressionBase):
 
     def getCloneArgs(self):
         # Make clones of child nodes too.
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         values = {self.named_child: value.makeClone()}
@@ -1347,7 +1404,7 @@ class ExpressionChildTupleHavingBase(ExpressionBase):
         for expression in value:
             expression.parent = self
 
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         setattr(self, attr_name, value)
 
     def finalize(self):
@@ -1408,7 +1465,7 @@ class ExpressionChildTupleHavingBase(ExpressionBase):
         for val in value:
             val.parent = self
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_child_attr
         setattr(self, attr_name, value)
 
     def clearChild(self, name):
@@ -1419,11 +1476,11 @@ class ExpressionChildTupleHavingBase(ExpressionBase):
         # Only accept legal child names
         assert name == self.named_child, name
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_child_attr
         return getattr(self, attr_name)
 
     def getVisitableNodes(self):
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         return getattr(self, attr_name)
 
     def getVisitableNodesNamed(self):
@@ -1431,7 +1488,7 @@ class ExpressionChildTupleHavingBase(ExpressionBase):
 
         For generic code to use in outputs and code generation.
         """
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         yield self.named_child, value
@@ -1445,7 +1502,7 @@ class ExpressionChildTupleHavingBase(ExpressionBase):
         # Find the replaced node, as an added difficulty, what might be
         # happening, is that the old node is an element of a tuple, in which we
         # may also remove that element, by setting it to None.
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         if old_node not in value:
@@ -1464,7 +1521,7 @@ class ExpressionChildTupleHavingBase(ExpressionBase):
 
     def getCloneArgs(self):
         # Make clones of child nodes too.
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         values = {self.named_child: tuple(v.makeClone() for v in value)}
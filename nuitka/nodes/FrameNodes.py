@@ -162,6 +162,35 @@ class StatementsFrameBase(StatementsSequence):
     def needsFrameExceptionPreserving(self):
         return self.needs_frame_exception_preserve
 
+    @staticmethod
+    def mayRunUserCode():
+        # Our frame object needs the one of the containing frame as its parent.
+        return True
+
+    def isFrameObjectLazy(self):
+        """Can the frame object creation be delayed until an exception.
+
+        Only if every node inside of it is known to not run code of the
+        program, nothing can look at the frame stack, and the frame object
+        is only needed for the traceback of an exception leaving it, and
+        only function frames do that.
+        """
+
+        if self.guard_mode != "full" or self.needs_frame_exception_preserve:
+            return False
+
+        pending = list(self.getVisitableNodes())
+
+        while pending:
+            node = pending.pop()
+
+            if node.mayRunUserCode():
+                return False
+
+            pending.extend(node.getVisitableNodes())
+
+        return True
+
     def getCodeObject(self):
         return self.code_object
 
@@ -1175,3 +1175,37 @@ class ExpressionFunctionCall(ExpressionChildrenHavingBase):
 
     def getClosureVariableVersions(self):
         return self.variable_closure_traces
+
+
+class ExpressionParameterTypeExact(
+    SideEffectsFromChildrenMixin, ExpressionChildHavingBase
+):
+    """Value of a parameter, known to have exactly the type of its annotation.
+
+    Only used where that was checked at run time, for the copy of the function
+    body that is specialized for the annotated types. This must not be
+    optimized away, or the type shape is lost.
+    """
+
+    kind = "EXPRESSION_PARAMETER_TYPE_EXACT"
+
+    named_child = "value"
+
+    __slots__ = ("type_shape",)
+
+    def __init__(self, value, type_shape, source_ref):
+        ExpressionChildHavingBase.__init__(self, value=value, source_ref=source_ref)
+
+        self.type_shape = type_shape
+
+    def getDetails(self):
+        return {"type_shape": self.type_shape}
+
+    def getTypeShape(self):
+        return self.type_shape
+
+    def computeExpression(self, trace_collection):
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return self.subnode_value.mayRaiseException(exception_type)
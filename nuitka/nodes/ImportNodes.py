@@ -64,7 +64,11 @@ from .ExpressionBases import (
 )
 from .LocalsScopes import GlobalsDictHandle
 from .NodeBases import StatementChildHavingBase
-from .NodeMakingHelpers import makeRaiseExceptionReplacementExpression
+from .NodeMakingHelpers import (
+    makeConstantReplacementNode,
+    makeRaiseExceptionReplacementExpression,
+    wrapExpressionWithSideEffects,
+)
 from .shapes.BuiltinTypeShapes import tshape_module, tshape_module_builtin
 
 # These module are supported in code generation to be imported the hard way.
@@ -1116,6 +1120,41 @@ class StatementImportStar(StatementChildHavingBase):
         return "star import statement"
 
 
+def getImportedModuleName(module_node):
+    """Get the name of the module, an import expression gives, if known."""
+
+    if module_node.isExpressionTempVariableRef():
+        variable_trace = module_node.variable_trace
+
+        # Escaping the module value does not change the variable.
+        while variable_trace is not None and variable_trace.isEscapeTrace():
+            variable_trace = variable_trace.previous
+
+        if variable_trace is None or not variable_trace.isAssignTrace():
+            return None
+
+        module_node = variable_trace.getAssignNode().subnode_source
+
+    if (
+        not module_node.isExpressionBuiltinImport()
+        or module_node.finding == "not-found"
+        or module_node.imported_module_desc is None
+    ):
+        return None
+
+    # Without a "fromlist", the top level package is given.
+    fromlist = module_node.subnode_fromlist
+
+    if (
+        fromlist is None
+        or not fromlist.isCompileTimeConstant()
+        or not fromlist.getCompileTimeConstant()
+    ):
+        return None
+
+    return module_node.imported_module_desc[0]
+
+
 class ExpressionImportName(ExpressionChildHavingBase):
     kind = "EXPRESSION_IMPORT_NAME"
 
@@ -1144,6 +1183,41 @@ class ExpressionImportName(ExpressionChildHavingBase):
         return {"import_name": self.import_name, "level": self.level}
 
     def computeExpression(self, trace_collection):
+        imported_module_name = getImportedModuleName(self.subnode_module)
+
+        if imported_module_name is not None:
+            from nuitka.optimizations.ReadOnlyModuleVariables import (
+                getReadOnlyModuleVariable,
+            )
+
+            read_only_variable = getReadOnlyModuleVariable(
+                module_name=imported_module_name, variable_name=self.import_name
+            )
+
+            # Only if assigned before the module can be imported by others,
+            # the name cannot be missing.
+            if (
+                read_only_variable is not None
+                and read_only_variable.isConstant()
+                and read_only_variable.isAssignedFirst()
+            ):
+                result = wrapExpressionWithSideEffects(
+                    new_node=makeConstantReplacementNode(
+                        constant=read_only_variable.getConstant(),
+                        node=self,
+                        user_provided=True,
+                    ),
+                    old_node=self,
+                    side_effects=self.subnode_module.extractSideEffects(),
+                )
+
+                return (
+                    result,
+                    "read_only_mvar new_constant",
+                    "Imported name '%s' of module '%s' is constant, that is never changed."
+                    % (self.import_name, imported_module_name),
+                )
+
         return self.subnode_module.computeExpressionImportName(
             import_node=self,
             import_name=self.import_name,
@@ -27,6 +27,7 @@ from nuitka.tree.Extractions import getVariablesWrittenOrRead
 
 from .Checkers import checkStatementsSequenceOrNone
 from .NodeBases import StatementBase, StatementChildHavingBase
+from .shapes.BuiltinTypeShapes import tshapes_immutable
 from .shapes.StandardShapes import tshape_unknown, tshape_unknown_loop
 
 tshape_unknown_set = frozenset([tshape_unknown])
@@ -40,6 +41,16 @@ def minimizeShapes(shapes):
     return shapes
 
 
+def _isEscapeOf(trace, escaped_trace):
+    while trace.isEscapeTrace():
+        trace = trace.getPrevious()
+
+        if trace is escaped_trace:
+            return True
+
+    return False
+
+
 class StatementLoop(StatementChildHavingBase):
     kind = "STATEMENT_LOOP"
 
@@ -75,6 +86,10 @@ class StatementLoop(StatementChildHavingBase):
         # To allow an upper limit in case it doesn't terminate.
         self.incomplete_count = 0
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def mayReturn(self):
         loop_body = self.subnode_loop_body
 
@@ -270,7 +285,19 @@ class StatementLoop(StatementChildHavingBase):
 
                 shapes = set()
 
+                # Values of immutable types, that only escaped in the loop, are
+                # still the ones from the loop entry.
+                entry_immutable = all(
+                    shape in tshapes_immutable
+                    for shape in self.loop_previous_resume[loop_variable]
+                )
+
                 for loop_resume_trace in loop_resume_traces:
+                    if entry_immutable and _isEscapeOf(
+                        loop_resume_trace, loop_entry_trace
+                    ):
+                        continue
+
                     loop_resume_trace.getTypeShape().emitAlternatives(shapes.add)
 
                 self.loop_resume[loop_variable] = minimizeShapes(shapes)
@@ -379,6 +406,21 @@ Removed useless loop with immediate 'break' statement.""",
         # global variables. It may also raise.
         outer_trace_collection.onExceptionRaiseExit(BaseException)
 
+        # Operations giving the same value in every iteration need to be done
+        # only once.
+        from nuitka.optimizations.LoopInvariants import (
+            hoistLoopInvariantOperations,
+        )
+
+        result = hoistLoopInvariantOperations(self)
+
+        if result is not None:
+            return (
+                result,
+                "new_statements",
+                "Hoisted loop invariant operations out of loop.",
+            )
+
         return self, None, None
 
     @staticmethod
@@ -392,6 +434,10 @@ class StatementLoopContinue(StatementBase):
     def __init__(self, source_ref):
         StatementBase.__init__(self, source_ref=source_ref)
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def finalize(self):
         del self.parent
 
@@ -424,6 +470,10 @@ class StatementLoopBreak(StatementBase):
     def __init__(self, source_ref):
         StatementBase.__init__(self, source_ref=source_ref)
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def finalize(self):
         del self.parent
 
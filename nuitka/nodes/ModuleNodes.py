@@ -484,6 +484,15 @@ class CompiledPythonModule(
             if function not in self.active_functions:
                 yield function
 
+    def hasEarlierUsedFunctions(self):
+        """Were functions only used by earlier computations in this pass."""
+
+        for function in self.active_functions:
+            if function not in self.visited_functions:
+                return True
+
+        return False
+
     def addCrossUsedFunction(self, function_body):
         if function_body not in self.cross_used_functions:
             self.cross_used_functions.add(function_body)
@@ -436,6 +436,16 @@ class NodeBase(NodeMetaClassBase):
 
         return True
 
+    @staticmethod
+    def mayRunUserCode():
+        """May this node itself run code of the program, e.g. special methods.
+
+        Unless we are told otherwise, everything may. Children are not
+        considered, they need to be asked themselves.
+        """
+
+        return True
+
     @staticmethod
     def mayReturn():
         """May this node do a return exit, to be overloaded for things that might."""
@@ -460,6 +470,18 @@ class NodeBase(NodeMetaClassBase):
         # Virtual method, pylint: disable=unused-argument
         return False
 
+    @staticmethod
+    def isChildValueReadOnly(child):
+        """Is the value of the child only looked at, never modified or kept.
+
+        Elements of a container child may still be given to other code, e.g.
+        as the result of a lookup, but the container itself is not. For
+        mutable constants, this allows to share the constant value rather
+        than making a copy.
+        """
+        # Virtual method, pylint: disable=unused-argument
+        return False
+
     @staticmethod
     def isStatementAborting():
         """Is the node aborting, control flow doesn't continue after this node."""
@@ -521,6 +543,9 @@ class ChildrenHavingMixin(object):
 
     named_children = ()
 
+    # The "subnode_" attribute names of named children, made by the meta class.
+    named_children_attrs = ()
+
     checkers = {}
 
     def __init__(self, values):
@@ -609,34 +634,30 @@ class ChildrenHavingMixin(object):
         return getattr(self, attr_name)
 
     def getVisitableNodes(self):
-        # TODO: Consider if a generator would be faster.
-        result = []
-
-        for name in self.named_children:
-            attr_name = "subnode_" + name
+        result = ()
 
+        for attr_name in self.named_children_attrs:
             value = getattr(self, attr_name)
 
             if value is None:
                 pass
             elif type(value) is tuple:
-                result += list(value)
+                result += value
             elif isinstance(value, NodeBase):
-                result.append(value)
+                result += (value,)
             else:
                 raise AssertionError(
-                    self, "has illegal child", name, value, value.__class__
+                    self, "has illegal child", attr_name, value, value.__class__
                 )
 
-        return tuple(result)
+        return result
 
     def getVisitableNodesNamed(self):
         """Named children dictionary.
 
         For use in debugging and XML output.
         """
-        for name in self.named_children:
-            attr_name = "subnode_" + name
+        for name, attr_name in zip(self.named_children, self.named_children_attrs):
             value = getattr(self, attr_name)
 
             yield name, value
@@ -650,8 +671,8 @@ class ChildrenHavingMixin(object):
         # Find the replaced node, as an added difficulty, what might be
         # happening, is that the old node is an element of a tuple, in which we
         # may also remove that element, by setting it to None.
-        for key in self.named_children:
-            value = self.getChild(key)
+        for key, attr_name in zip(self.named_children, self.named_children_attrs):
+            value = getattr(self, attr_name)
 
             if value is None:
                 pass
@@ -684,8 +705,8 @@ class ChildrenHavingMixin(object):
     def getCloneArgs(self):
         values = {}
 
-        for key in self.named_children:
-            value = self.getChild(key)
+        for key, attr_name in zip(self.named_children, self.named_children_attrs):
+            value = getattr(self, attr_name)
 
             assert type(value) is not list, key
 
@@ -945,7 +966,7 @@ class StatementChildHavingBase(StatementBase):
         else:
             assert False, type(value)
 
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         setattr(self, attr_name, value)
 
     def setChild(self, name, value):
@@ -970,7 +991,7 @@ class StatementChildHavingBase(StatementBase):
         elif value is not None:
             value.parent = self
 
-        attr_name = "subnode_" + name
+        attr_name = self.named_child_attr
 
         # Determine old value, and inform it about losing its parent.
         old_value = getattr(self, attr_name)
@@ -986,7 +1007,7 @@ class StatementChildHavingBase(StatementBase):
 
     def getVisitableNodes(self):
         # TODO: Consider if a generator would be faster.
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         if value is None:
@@ -1003,7 +1024,7 @@ class StatementChildHavingBase(StatementBase):
 
         For use in debugging and XML output.
         """
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         value = getattr(self, attr_name)
 
         yield self.named_child, value
@@ -1070,7 +1091,7 @@ class StatementChildHavingBase(StatementBase):
     def finalize(self):
         del self.parent
 
-        attr_name = "subnode_" + self.named_child
+        attr_name = self.named_child_attr
         child = getattr(self, attr_name)
         if child is not None:
             child.finalize()
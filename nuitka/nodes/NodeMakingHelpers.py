@@ -27,7 +27,7 @@ making it more difficult to use.
 """
 
 from nuitka import Options
-from nuitka.__past__ import GenericAlias
+from nuitka.__past__ import GenericAlias, long, unicode
 from nuitka.Builtins import builtin_names
 from nuitka.Constants import isConstant
 from nuitka.PythonVersions import python_version
@@ -256,18 +256,108 @@ def makeCompileTimeConstantReplacementNode(value, node, user_provided):
         return node
 
 
-def getComputationResult(node, computation, description, user_provided):
-    """With a computation function, execute it and return constant result or
-    exception node.
+# Types of values, that are used in computation cache keys as they are.
+_computation_key_types = (int, long, str, unicode, bytes, bool, type(None))
+
+# Results of compile time computations, these are repeated for every pass, and
+# the same expressions also occur in many places.
+_computation_cache = {}
+_computation_cache_limit = 10000
+_computation_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _makeValueCacheKey(value):
+    value_type = type(value)
+
+    if value_type in _computation_key_types:
+        return value_type, value
+    elif value_type in (float, complex):
+        # Values like "-0.0" and "0.0" are equal, but not the same.
+        return value_type, repr(value)
+    elif value_type is tuple:
+        element_keys = tuple(_makeValueCacheKey(element) for element in value)
+
+        if None in element_keys:
+            return None
+
+        return value_type, element_keys
+    else:
+        return None
 
+
+def makeComputationCacheKey(operation, *values):
+    """Make a key for a compile time computation on constant values.
+
+    Args:
+        operation: hashable description of the operation
+        values: constant values the computation uses
+
+    Returns:
+        A key for "getComputationResult" or None, if the values are not
+        suitable, e.g. because they are mutable.
     """
 
+    value_keys = tuple(_makeValueCacheKey(value) for value in values)
+
+    if None in value_keys:
+        return None
+
+    return (operation,) + value_keys
+
+
+def getComputationCacheStats():
+    """Get the hits and misses of the compile time computation cache."""
+
+    return (
+        _computation_cache_stats["hits"],
+        _computation_cache_stats["misses"],
+    )
+
+
+def _getComputationResult(computation, cache_key):
+    if cache_key is not None:
+        try:
+            result = _computation_cache[cache_key]
+        except KeyError:
+            _computation_cache_stats["misses"] += 1
+        else:
+            _computation_cache_stats["hits"] += 1
+            return result
+
     # Try and turn raised exceptions into static raises. pylint: disable=broad-except
     try:
-        result = computation()
+        result = None, computation()
     except Exception as e:
+        result = e, None
+
+        # Do not keep the frames of the computation alive.
+        if python_version >= 0x300:
+            e.__traceback__ = None
+
+    if cache_key is not None and (
+        result[0] is not None or _makeValueCacheKey(result[1]) is not None
+    ):
+        if len(_computation_cache) >= _computation_cache_limit:
+            _computation_cache.clear()
+
+        _computation_cache[cache_key] = result
+
+    return result
+
+
+def getComputationResult(node, computation, description, user_provided, cache_key=None):
+    """With a computation function, execute it and return constant result or
+    exception node.
+
+    With a cache key, made with "makeComputationCacheKey", the result of the
+    computation is remembered for later calls.
+    """
+
+    exception, result = _getComputationResult(computation, cache_key)
+
+    if exception is not None:
         new_node = makeRaiseExceptionReplacementExpressionFromInstance(
-            expression=node, exception=e
+            expression=node, exception=exception
         )
 
         change_tags = "new_raise"
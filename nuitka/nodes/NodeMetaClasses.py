@@ -71,7 +71,10 @@ class NodeCheckMetaClass(ABCMeta):
                     type(named_child),
                 )
 
-            dictionary["__slots__"] += (intern("subnode_" + dictionary["named_child"]),)
+            named_child_attr = intern("subnode_" + named_child)
+
+            dictionary["__slots__"] += (named_child_attr,)
+            dictionary["named_child_attr"] = named_child_attr
 
         if "named_children" in dictionary:
             if len(dictionary["named_children"]) <= 1:
@@ -80,11 +83,14 @@ class NodeCheckMetaClass(ABCMeta):
                 )
 
             assert type(dictionary["named_children"]) is tuple
-            dictionary["__slots__"] += tuple(
+            named_children_attrs = tuple(
                 intern("subnode_" + named_child)
                 for named_child in dictionary["named_children"]
             )
 
+            dictionary["__slots__"] += named_children_attrs
+            dictionary["named_children_attrs"] = named_children_attrs
+
         # Not a method:
         if "checker" in dictionary:
             dictionary["checker"] = staticmethod(dictionary["checker"])
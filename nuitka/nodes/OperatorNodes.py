@@ -31,6 +31,7 @@ from nuitka.PythonVersions import python_version
 
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .NodeMakingHelpers import (
+    makeComputationCacheKey,
     makeRaiseExceptionReplacementExpressionFromInstance,
     wrapExpressionWithSideEffects,
 )
@@ -108,6 +109,9 @@ class ExpressionOperationBinaryBase(
             or self.subnode_right.mayRaiseException(exception_type)
         )
 
+    def mayRunUserCode(self):
+        return self.escape_desc is None or self.escape_desc.isControlFlowEscape()
+
     def getTypeShape(self):
         return self.type_shape
 
@@ -168,6 +172,7 @@ class ExpressionOperationBinaryBase(
             node=self,
             computation=lambda: self.simulator(left_value, right_value),
             description="Operator '%s' with constant arguments." % self.operator,
+            cache_key=makeComputationCacheKey(self.operator, left_value, right_value),
         )
 
     def computeExpression(self, trace_collection):
@@ -23,7 +23,8 @@ from nuitka import PythonOperators
 
 from .ConstantRefNodes import makeConstantRefNode
 from .ExpressionBases import ExpressionChildHavingBase
-from .shapes.BuiltinTypeShapes import tshape_bool, tshape_str
+from .NodeMakingHelpers import makeComputationCacheKey
+from .shapes.BuiltinTypeShapes import scalar_shapes, tshape_bool, tshape_str
 
 
 class ExpressionOperationUnaryBase(ExpressionChildHavingBase):
@@ -48,6 +49,7 @@ class ExpressionOperationUnaryBase(ExpressionChildHavingBase):
                 node=self,
                 computation=lambda: self.simulator(operand_value),
                 description="Operator '%s' with constant argument." % operator,
+                cache_key=makeComputationCacheKey(operator, operand_value),
             )
         else:
             # TODO: May go down to MemoryError for compile time constant overflow
@@ -178,6 +180,10 @@ class ExpressionOperationNot(ExpressionOperationUnaryBase):
             self, operand=operand, source_ref=source_ref
         )
 
+    def mayRunUserCode(self):
+        # Checking the truth of values of unknown type may run code.
+        return self.subnode_operand.getTypeShape() not in scalar_shapes
+
     @staticmethod
     def getTypeShape():
         return tshape_bool
@@ -65,6 +65,10 @@ class ExpressionOutlineBody(ExpressionChildHavingBase):
         # officially a child yet. Important during building.
         self.parent = provider
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def getDetails(self):
         return {"provider": self.provider, "name": self.name}
 
@@ -212,6 +216,10 @@ class ExpressionOutlineFunctionBase(ExpressionFunctionBodyBase):
 
         self.locals_scope = None
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     @staticmethod
     def isExpressionOutlineFunctionBase():
         return True
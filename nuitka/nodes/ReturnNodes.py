@@ -35,6 +35,10 @@ class StatementReturn(StatementChildHavingBase):
         assert expression
         StatementChildHavingBase.__init__(self, value=expression, source_ref=source_ref)
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     @staticmethod
     def mayReturn():
         return True
@@ -93,6 +97,10 @@ class StatementReturnConstantBase(StatementBase):
     def __init__(self, source_ref):
         StatementBase.__init__(self, source_ref=source_ref)
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     @staticmethod
     def isStatementReturn():
         return True
@@ -201,6 +209,10 @@ class StatementReturnReturnedValue(StatementBase):
     def __init__(self, source_ref):
         StatementBase.__init__(self, source_ref=source_ref)
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def finalize(self):
         del self.parent
 
@@ -52,6 +52,10 @@ class StatementsSequence(StatementChildHavingBase):
             self, value=tuple(statements), source_ref=source_ref
         )
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def finalize(self):
         del self.parent
 
@@ -213,6 +217,10 @@ class StatementExpressionOnly(StatementChildHavingBase):
 
         StatementChildHavingBase.__init__(self, value=expression, source_ref=source_ref)
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def mayHaveSideEffects(self):
         return self.subnode_expression.mayHaveSideEffects()
 
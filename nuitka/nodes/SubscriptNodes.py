@@ -118,6 +118,10 @@ class ExpressionSubscriptLookup(ExpressionChildrenHavingBase):
     def isKnownToBeIterable(count):
         return None
 
+    def isChildValueReadOnly(self, child):
+        # Lookups only look at the subscribed value.
+        return child is self.subnode_expression
+
 
 def hasSubscript(value, subscript):
     """Check if a value has a subscript."""
@@ -24,12 +24,52 @@ Manual for how this maps to try/finally and try/except as in Python.
 
 from nuitka.Errors import NuitkaOptimizationError
 from nuitka.optimizations.TraceCollections import TraceCollectionBranch
+from nuitka.PythonVersions import python_version
 
 from .Checkers import checkStatementsSequence, checkStatementsSequenceOrNone
 from .NodeBases import StatementChildrenHavingBase
 from .StatementNodes import StatementsSequence
 
 
+def _mayObserveCaughtException(node):
+    """Can the caught exception be observed by code of the handler node.
+
+    Only matching the exception type and re-raising it work without it
+    being published, anything else that may raise might run code that looks
+    at "sys.exc_info()", or chain to it as context, and nested exception
+    handlers chain to it too.
+    """
+    if node.isStatementReraiseException():
+        return False
+
+    if node.isStatementsSequence() or node.isStatementConditional():
+        for child in node.getVisitableNodes():
+            if _mayObserveCaughtException(child):
+                return True
+
+        return False
+
+    if node.mayRaiseException(BaseException):
+        return True
+
+    return _usesCaughtException(node)
+
+
+def _usesCaughtException(node):
+    if (
+        node.isStatementTry()
+        or node.isExpressionCaughtExceptionValueRef()
+        or node.isExpressionCaughtExceptionTracebackRef()
+    ):
+        return True
+
+    for child in node.getVisitableNodes():
+        if _usesCaughtException(child):
+            return True
+
+    return False
+
+
 class StatementTry(StatementChildrenHavingBase):
     kind = "STATEMENT_TRY"
 
@@ -70,6 +110,10 @@ class StatementTry(StatementChildrenHavingBase):
             source_ref=source_ref,
         )
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def computeStatement(self, trace_collection):
         # This node has many children to handle, pylint: disable=I0021,too-many-branches,too-many-locals,too-many-statements
         tried = self.subnode_tried
@@ -160,6 +204,19 @@ class StatementTry(StatementChildrenHavingBase):
                     self.setChild("except_handler", result)
                     except_handler = result
 
+            if except_handler is not None and python_version >= 0x300:
+                result = self._getUnpublishedExceptionHandler(except_handler)
+
+                if result is not None:
+                    self.setChild("except_handler", result)
+                    except_handler = result
+
+                    trace_collection.signalChange(
+                        tags="new_statements",
+                        message="Exception handler need not publish the exception.",
+                        source_ref=except_handler.source_ref,
+                    )
+
         if break_handler is not None:
             if not tried.mayBreak():
                 break_handler.finalize()
@@ -347,6 +404,61 @@ class StatementTry(StatementChildrenHavingBase):
 
         return self, None, None
 
+    @staticmethod
+    def _getUnpublishedExceptionHandler(except_handler):
+        """Exception handler that need not publish the exception, if possible.
+
+        For Python3, publishing of the exception as done for "except" is
+        undone after the handler. When the handler cannot observe it, the
+        exception can remain in the keeper variables, without normalizing it
+        and creating the traceback, which would only be done when it is
+        re-raised and leaves the frame.
+        """
+        statements = except_handler.subnode_statements
+
+        for count, statement in enumerate(statements[:-2]):
+            if statement.isStatementPreserveFrameException():
+                break
+        else:
+            return None
+
+        preserver_id = statement.getPreserverId()
+        publish_statement, try_statement = statements[count + 1 : count + 3]
+
+        if (
+            not publish_statement.isStatementPublishException()
+            or not try_statement.isStatementTry()
+        ):
+            return None
+
+        # What follows needs to be the restore of the preserved exception only,
+        # and the "finally" handlers of the tried handling restore it too.
+        for statement in statements[count + 3 :] + tuple(
+            handler.subnode_statements[0]
+            for handler in (
+                try_statement.subnode_except_handler,
+                try_statement.subnode_break_handler,
+                try_statement.subnode_continue_handler,
+                try_statement.subnode_return_handler,
+            )
+            if handler is not None
+        ):
+            if (
+                not statement.isStatementRestoreFrameException()
+                or statement.getPreserverId() != preserver_id
+            ):
+                return None
+
+        handling = try_statement.subnode_tried
+
+        if _mayObserveCaughtException(handling):
+            return None
+
+        return StatementsSequence(
+            statements=statements[:count] + handling.subnode_statements,
+            source_ref=except_handler.source_ref,
+        )
+
     def mayReturn(self):
         # TODO: If we optimized return handler away, this would be not needed
         # or even non-optimal.
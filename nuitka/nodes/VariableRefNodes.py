@@ -41,12 +41,69 @@ from .ModuleAttributeNodes import (
     ExpressionModuleAttributeSpecRef,
 )
 from .NodeMakingHelpers import (
+    makeConstantReplacementNode,
     makeRaiseExceptionReplacementExpression,
     makeRaiseTypeErrorExceptionReplacementFromTemplateAndValue,
 )
 from .shapes.StandardShapes import tshape_unknown
 
 
+def _getReadOnlyModuleVariable(variable):
+    from nuitka.optimizations.ReadOnlyModuleVariables import (
+        getReadOnlyModuleVariable,
+    )
+
+    return getReadOnlyModuleVariable(
+        module_name=variable.getModule().getFullName(),
+        variable_name=variable.getName(),
+    )
+
+
+def _isAssignedTrace(variable_trace):
+    # Escaping and unknown code may change the value, but not unassign it.
+    while variable_trace is not None and variable_trace.isEscapeOrUnknownTrace():
+        variable_trace = variable_trace.previous
+
+    return variable_trace is not None and variable_trace.isAssignTrace()
+
+
+def _makeInlinedCall(function_body, call_node, call_args):
+    if call_args is None:
+        values = ()
+    elif call_args.isExpressionConstantTupleRef() or call_args.isExpressionMakeTuple():
+        values = call_args.getIterationValues()
+    else:
+        return None
+
+    from nuitka.optimizations.FunctionInlining import (
+        convertFunctionCallToOutline,
+        getCrossModuleInlineCost,
+    )
+
+    # Ask for function for its cost.
+    cost = getCrossModuleInlineCost(function_body, len(values))
+
+    if cost is None or cost >= 50:
+        return None
+
+    result = convertFunctionCallToOutline(
+        provider=call_node.getParentVariableProvider(),
+        function_body=function_body,
+        values=values,
+        call_source_ref=call_node.source_ref,
+    )
+
+    return (
+        result,
+        "new_statements",
+        lambda: "Function call to '%s' of module '%s' in-lined."
+        % (
+            function_body.getFunctionName(),
+            function_body.getParentModule().getFullName(),
+        ),
+    )
+
+
 class ExpressionVariableNameRef(ExpressionBase):
     """These are used before the actual variable object is known from VariableClosure."""
 
@@ -126,6 +183,10 @@ class ExpressionVariableRefBase(ExpressionBase):
     def getVariableTrace(self):
         return self.variable_trace
 
+    @staticmethod
+    def mayRunUserCode():
+        return False
+
     def getTypeShape(self):
         if self.variable_trace is None:
             return tshape_unknown
@@ -428,6 +489,24 @@ class ExpressionVariableRef(ExpressionVariableRefBase):
 
         self.variable = variable
 
+    def _getAssignedReadOnlyModuleVariable(self):
+        """Module variable that is never changed, if known to be assigned here."""
+
+        if not self.variable.isModuleVariable():
+            return None
+
+        read_only_variable = _getReadOnlyModuleVariable(self.variable)
+
+        if read_only_variable is None:
+            return None
+
+        if _isAssignedTrace(self.variable_trace) or read_only_variable.isAssignedBefore(
+            self.getParentVariableProvider().getEntryPoint()
+        ):
+            return read_only_variable
+        else:
+            return None
+
     def computeExpressionRaw(self, trace_collection):
         # Terribly detailed, pylint: disable=too-many-branches,too-many-statements
 
@@ -442,6 +521,22 @@ class ExpressionVariableRef(ExpressionVariableRefBase):
         if replacement is not None:
             return self._applyReplacement(trace_collection, replacement)
 
+        read_only_variable = self._getAssignedReadOnlyModuleVariable()
+
+        if read_only_variable is not None and read_only_variable.isConstant():
+            result = makeConstantReplacementNode(
+                constant=read_only_variable.getConstant(),
+                node=self,
+                user_provided=True,
+            )
+
+            return (
+                result,
+                "read_only_mvar new_constant",
+                "Module variable '%s' is constant, that is never changed."
+                % variable.getName(),
+            )
+
         if not self.variable_trace.mustHaveValue():
             # TODO: This could be way more specific surely, either NameError or UnboundLocalError
             # could be decided from context.
@@ -560,6 +655,22 @@ Replaced read-only module attribute '__spec__' with module attribute reference."
         return self, None, None
 
     def computeExpressionCall(self, call_node, call_args, call_kw, trace_collection):
+        read_only_variable = self._getAssignedReadOnlyModuleVariable()
+
+        if (
+            read_only_variable is not None
+            and not read_only_variable.isConstant()
+            and call_kw is None
+        ):
+            result = _makeInlinedCall(
+                function_body=read_only_variable.getFunctionBody(),
+                call_node=call_node,
+                call_args=call_args,
+            )
+
+            if result is not None:
+                return result
+
         # The called and the arguments escape for good.
         self.onContentEscapes(trace_collection)
         if call_args is not None:
@@ -582,6 +693,15 @@ Replaced read-only module attribute '__spec__' with module attribute reference."
 
         return call_node, None, None
 
+    def getCallResultTypeShape(self):
+        if self.variable.isModuleVariable():
+            read_only_variable = _getReadOnlyModuleVariable(self.variable)
+
+            if read_only_variable is not None and not read_only_variable.isConstant():
+                return read_only_variable.getReturnTypeShape()
+
+        return tshape_unknown
+
     def hasShapeDictionaryExact(self):
         return (
             self.variable_trace is not None
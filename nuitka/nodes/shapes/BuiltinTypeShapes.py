@@ -1494,6 +1494,72 @@ class ShapeTypeXrangeIterator(ShapeIteratorMixin, ShapeNotNumberMixin, ShapeBase
 tshape_xrange_iterator = ShapeTypeXrangeIterator()
 
 
+class ShapeTypeEnumerate(ShapeIteratorMixin, ShapeNotNumberMixin, ShapeBase):
+    typical_value = enumerate(())
+
+    @staticmethod
+    def getTypeName():
+        return "enumerate"
+
+    @staticmethod
+    def getShapeIter():
+        return tshape_enumerate
+
+
+tshape_enumerate = ShapeTypeEnumerate()
+
+
+class ShapeTypeZip(ShapeIteratorMixin, ShapeNotNumberMixin, ShapeBase):
+    # Python2 "zip" gives a list, and is not using this shape.
+    if python_version >= 0x300:
+        typical_value = zip()
+
+    @staticmethod
+    def getTypeName():
+        return "zip"
+
+    @staticmethod
+    def getShapeIter():
+        return tshape_zip
+
+
+tshape_zip = ShapeTypeZip()
+
+
+class ShapeTypeMap(ShapeIteratorMixin, ShapeNotNumberMixin, ShapeBase):
+    # Python2 "map" gives a list, and is not using this shape.
+    if python_version >= 0x300:
+        typical_value = map(id, ())
+
+    @staticmethod
+    def getTypeName():
+        return "map"
+
+    @staticmethod
+    def getShapeIter():
+        return tshape_map
+
+
+tshape_map = ShapeTypeMap()
+
+
+class ShapeTypeFilter(ShapeIteratorMixin, ShapeNotNumberMixin, ShapeBase):
+    # Python2 "filter" gives a list, and is not using this shape.
+    if python_version >= 0x300:
+        typical_value = filter(None, ())
+
+    @staticmethod
+    def getTypeName():
+        return "filter"
+
+    @staticmethod
+    def getShapeIter():
+        return tshape_filter
+
+
+tshape_filter = ShapeTypeFilter()
+
+
 class ShapeTypeType(ShapeNotContainerMixin, ShapeNotNumberMixin, ShapeBase):
     typical_value = int
 
@@ -1613,6 +1679,25 @@ class ShapeTypeClassmethod(ShapeNotContainerMixin, ShapeNotNumberMixin, ShapeBas
 
 tshape_classmethod = ShapeTypeClassmethod()
 
+# Exact types with immutable values, which also cannot be changed with a
+# "__class__" assignment, so code run with them cannot change them at all.
+tshapes_immutable = frozenset(
+    shape
+    for shape in (
+        tshape_bool,
+        tshape_int,
+        tshape_long,
+        tshape_int_or_long,
+        tshape_float,
+        tshape_complex,
+        tshape_str,
+        tshape_unicode,
+        tshape_str_or_unicode,
+        tshape_bytes,
+    )
+    if shape is not None
+)
+
 
 # Precanned tuples to save creating return value tuples:
 operation_result_bool_noescape = tshape_bool, ControlFlowDescriptionNoEscape
@@ -3971,3 +4056,18 @@ class ShapeTypeBuiltinExceptionClass(
 
 
 tshape_exception_class = ShapeTypeBuiltinExceptionClass()
+
+
+# Values of these types check truth, compare, hash, and get released without
+# running any other code.
+scalar_shapes = (
+    tshape_none,
+    tshape_bool,
+    tshape_int,
+    tshape_long,
+    tshape_float,
+    tshape_complex,
+    tshape_str,
+    tshape_unicode,
+    tshape_bytes,
+)
@@ -0,0 +1,533 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Removal of unused module level definitions of the whole program.
+
+Functions and classes defined on module level are kept by module local
+optimization, as other modules may use them. With the whole program known,
+a definition whose name is not mentioned anywhere else, i.e. not as variable,
+attribute, imported name, or in a string constant that could be used with
+"getattr", can be removed before generating code for it.
+
+This is only a heuristic for what is dynamic, therefore it must be asked for,
+and modules doing dynamic things with their own namespace are not touched.
+"""
+
+import dis
+import marshal
+import re
+from collections import Counter
+
+from nuitka import ModuleRegistry, Options
+from nuitka.__past__ import unicode  # pylint: disable=I0021,redefined-builtin
+from nuitka.importing.StandardLibrary import isStandardLibraryPath
+from nuitka.plugins.Plugins import Plugins
+from nuitka.PythonVersions import python_version
+from nuitka.Tracing import general, optimization_logger
+from nuitka.Variables import Variable
+
+# Strings that could be names, or dotted names, e.g. given to "getattr" or
+# used to lookup things by qualified name.
+_name_string_re = re.compile(r"^[A-Za-z_][\w.:]*$")
+
+
+def _addStringNames(counter, value):
+    if _name_string_re.match(value):
+        counter.update(re.split("[.:]", value))
+
+
+def _addConstantNames(counter, constant):
+    if type(constant) in (str, unicode):
+        _addStringNames(counter, constant)
+    elif type(constant) in (tuple, list, set, frozenset):
+        for element in constant:
+            _addConstantNames(counter, element)
+    elif type(constant) is dict:
+        for key, value in constant.items():
+            _addConstantNames(counter, key)
+            _addConstantNames(counter, value)
+
+
+def _addNodeNames(counter, node, follow_functions):
+    for value in node.getDetails().values():
+        if type(value) is str:
+            counter[value] += 1
+        elif isinstance(value, Variable):
+            counter[value.getName()] += 1
+
+    if node.isExpressionConstantRef():
+        _addConstantNames(counter, node.getCompileTimeConstant())
+
+    if node.isExpressionFunctionRef() and follow_functions is not None:
+        function_body = node.getFunctionBody()
+
+        if function_body not in follow_functions:
+            follow_functions.add(function_body)
+
+            _addNodeNames(counter, function_body, follow_functions)
+
+    for child in node.getVisitableNodes():
+        _addNodeNames(counter, child, follow_functions)
+
+
+def _addCodeObjectNames(counter, code_object):
+    counter.update(code_object.co_names)
+    counter.update(code_object.co_varnames)
+
+    for constant in code_object.co_consts:
+        if type(constant) is type(code_object):
+            _addCodeObjectNames(counter, constant)
+        else:
+            _addConstantNames(counter, constant)
+
+
+_import_star_opcode = dis.opmap["IMPORT_STAR"]
+
+
+def _hasImportStar(code_object):
+    # Only with word code, we know where the opcodes are, otherwise arguments
+    # may look like it, which is only a false alarm.
+    code = bytearray(code_object.co_code)
+    if python_version >= 0x360:
+        code = code[::2]
+
+    if _import_star_opcode in code:
+        return True
+
+    for constant in code_object.co_consts:
+        if type(constant) is type(code_object) and _hasImportStar(constant):
+            return True
+
+    return False
+
+
+def _getStarImportedModuleNames(node):
+    """Get names of modules star imported, None if one is not known."""
+
+    result = set()
+
+    if node.isStatementImportStar():
+        module_import = node.subnode_module
+
+        if (
+            module_import.isExpressionBuiltinImport()
+            and module_import.imported_module_desc is not None
+        ):
+            result.add(module_import.imported_module_desc[0])
+        elif module_import.isExpressionImportModuleHard():
+            result.add(module_import.getModuleName())
+        else:
+            return None
+
+    for child in node.getVisitableNodes():
+        child_result = _getStarImportedModuleNames(child)
+
+        if child_result is None:
+            return None
+
+        result.update(child_result)
+
+    return result
+
+
+def _getProgramStarImportedModuleNames():
+    result = set()
+
+    for module in ModuleRegistry.getDoneModules():
+        if module.isCompiledPythonModule():
+            for node in (module.subnode_body,) + module.subnode_functions:
+                module_result = _getStarImportedModuleNames(node)
+
+                if module_result is None:
+                    return None
+
+                result.update(module_result)
+        elif module.isUncompiledPythonModule() and module.getByteCode():
+            if _hasImportStar(marshal.loads(module.getByteCode())):
+                return None
+
+    return result
+
+
+def _getProgramNames():
+    # The "__all__" of a module is only used by star imports, so names in it
+    # do not count, unless the module is star imported.
+    star_imported_module_names = _getProgramStarImportedModuleNames()
+
+    counter = Counter()
+
+    for module in ModuleRegistry.getDoneModules():
+        if module.isCompiledPythonModule():
+            ignore_all = (
+                star_imported_module_names is not None
+                and module.getFullName() not in star_imported_module_names
+            )
+
+            for _sequence, statement in _getModuleStatements(module):
+                if ignore_all and _isModuleVariableAssignment(
+                    statement, module, "__all__"
+                ):
+                    continue
+
+                _addNodeNames(counter, statement, None)
+
+            for function_body in module.subnode_functions:
+                _addNodeNames(counter, function_body, None)
+        elif module.isUncompiledPythonModule() and module.getByteCode():
+            _addCodeObjectNames(counter, marshal.loads(module.getByteCode()))
+
+    return counter
+
+
+# Built-ins that access the module namespace with computed names, "locals"
+# on module level is "globals" too, and otherwise not about the module.
+_dynamic_namespace_kinds = frozenset(
+    (
+        "EXPRESSION_BUILTIN_VARS",
+        "EXPRESSION_BUILTIN_EXEC",
+        "EXPRESSION_BUILTIN_EXECFILE",
+        "EXPRESSION_BUILTIN_EVAL",
+    )
+)
+
+
+def _isDynamicNamespaceUsage(node):
+    if node.isExpressionBuiltinGlobals():
+        # All imports give their globals, these don't count.
+        return not node.getParent().isExpressionBuiltinImport()
+
+    return node.kind in _dynamic_namespace_kinds
+
+
+def _hasDynamicNamespaceUsage(node):
+    if _isDynamicNamespaceUsage(node):
+        return True
+
+    for child in node.getVisitableNodes():
+        if _hasDynamicNamespaceUsage(child):
+            return True
+
+    return False
+
+
+def hasDynamicNamespaceUsage(module):
+    """Check if a module may access its namespace with computed names."""
+
+    if _hasDynamicNamespaceUsage(module.subnode_body):
+        return True
+
+    for function_body in module.subnode_functions:
+        if _hasDynamicNamespaceUsage(function_body):
+            return True
+
+    return False
+
+
+def _iterNodes(node):
+    yield node
+
+    for child in node.getVisitableNodes():
+        for descendant in _iterNodes(child):
+            yield descendant
+
+
+def _getNodeVariables(node):
+    return [
+        value for value in node.getDetails().values() if isinstance(value, Variable)
+    ]
+
+
+def _getModuleTempVariables(node, module):
+    return set(
+        variable
+        for descendant in _iterNodes(node)
+        for variable in _getNodeVariables(descendant)
+        if variable.isTempVariable() and variable.getOwner() is module
+    )
+
+
+def _isSimpleClassConstant(constant):
+    if type(constant) in (tuple, list, set, frozenset):
+        return all(_isSimpleClassConstant(element) for element in constant)
+    elif type(constant) is dict:
+        # Keywords for the class creation, or values with unknown effects.
+        return not constant
+    elif isinstance(constant, type):
+        # Bases or metaclass other than the default ones.
+        return constant in (object, type)
+    else:
+        return True
+
+
+def _isSimpleClassBody(frame):
+    for statement in frame.subnode_statements:
+        if not (
+            statement.isStatementLocalsDictOperationSet()
+            or statement.isStatementAssignmentVariable()
+        ):
+            return False
+
+        if statement.getVariableName() == "__metaclass__":
+            return False
+
+        if statement.subnode_source.mayHaveSideEffects():
+            return False
+
+    return True
+
+
+def _isSimpleClassCreationNode(node, class_assignment):
+    if node.isExpressionVariableNameRef() or node.isExpressionVariableLocalNameRef():
+        return False
+
+    # Other module variables are bases, decorators, values, and what not.
+    if node is not class_assignment:
+        for variable in _getNodeVariables(node):
+            if variable.isModuleVariable():
+                return False
+
+    if node.isStatementsFrame():
+        if not _isSimpleClassBody(node):
+            return False
+    elif node.isExpressionConstantRef():
+        if not _isSimpleClassConstant(node.getCompileTimeConstant()):
+            return False
+    elif node.isExpressionBuiltinRef():
+        if node.getBuiltinName() not in ("object", "type"):
+            return False
+
+    for child in node.getVisitableNodes():
+        if not _isSimpleClassCreationNode(child, class_assignment):
+            return False
+
+    return True
+
+
+def _isSimpleClassCreation(statements, class_assignment):
+    """Check if creating the class has no effects beyond defining it.
+
+    Bases other than "object", metaclasses, decorators, and code in the class
+    body could all do anything, and e.g. register the class elsewhere.
+    """
+
+    class_bodies = [
+        node
+        for _sequence, statement in statements
+        for node in _iterNodes(statement)
+        if node.isExpressionClassBody()
+    ]
+
+    if (
+        len(class_bodies) != 1
+        or class_bodies[0].getFunctionName() != class_assignment.getVariableName()
+    ):
+        return False
+
+    # With decorators, the class is first given to them.
+    source = class_assignment.subnode_source
+    if source is not class_bodies[0] and not source.isExpressionTempVariableRef():
+        return False
+
+    for _sequence, statement in statements:
+        if not _isSimpleClassCreationNode(statement, class_assignment):
+            return False
+
+    return True
+
+
+def _getClassCreationStatements(module_statements, index, module):
+    """Get the statements creating a class, around the one assigning it.
+
+    These are the neighbouring statements that share the temporary variables
+    of the class creation, e.g. for bases, and release them.
+    """
+
+    sequence = module_statements[index][0]
+    temp_variables = _getModuleTempVariables(module_statements[index][1], module)
+
+    if not temp_variables:
+        return None
+
+    start = index
+    while start > 0 and module_statements[start - 1][0] is sequence:
+        statement_temp_variables = _getModuleTempVariables(
+            module_statements[start - 1][1], module
+        )
+
+        if not statement_temp_variables & temp_variables:
+            break
+
+        temp_variables.update(statement_temp_variables)
+        start -= 1
+
+    end = index + 1
+    while end < len(module_statements) and module_statements[end][0] is sequence:
+        if not (
+            _getModuleTempVariables(module_statements[end][1], module) & temp_variables
+        ):
+            break
+
+        end += 1
+
+    return module_statements[start:end]
+
+
+def _getModuleStatements(module):
+    for statement in module.subnode_body.subnode_statements:
+        if statement.isStatementsFrame():
+            for frame_statement in statement.subnode_statements:
+                yield statement, frame_statement
+        else:
+            yield module.subnode_body, statement
+
+
+def _isModuleVariableAssignment(node, module, variable_name):
+    return (
+        node.isStatementAssignmentVariable()
+        and node.getVariable().isModuleVariable()
+        and node.getVariable().getOwner() is module
+        and node.getVariableName() == variable_name
+    )
+
+
+def _getClassAssignments(statement, module):
+    for node in _iterNodes(statement):
+        if (
+            node.isStatementAssignmentVariable()
+            and _isModuleVariableAssignment(node, module, node.getVariableName())
+            and (
+                node.subnode_source.isExpressionClassBody()
+                or node.subnode_source.isExpressionTempVariableRef()
+            )
+        ):
+            yield node
+
+
+def _getModuleDefinitions(module):
+    """Get the definitions of a module, with their statements.
+
+    Returns:
+        Dictionary of definition names to their statements, each given
+        with the sequence it belongs to.
+    """
+
+    result = {}
+
+    module_statements = list(_getModuleStatements(module))
+
+    for index, (sequence, statement) in enumerate(module_statements):
+        if statement.isStatementAssignmentVariable():
+            source = statement.subnode_source
+
+            if (
+                source.isExpressionFunctionCreation()
+                and not source.mayHaveSideEffects()
+                and _isModuleVariableAssignment(
+                    statement, module, statement.getVariableName()
+                )
+            ):
+                result[statement.getVariableName()] = [(sequence, statement)]
+                continue
+
+        for class_assignment in _getClassAssignments(statement, module):
+            class_statements = _getClassCreationStatements(
+                module_statements, index, module
+            )
+
+            if class_statements and _isSimpleClassCreation(
+                class_statements, class_assignment
+            ):
+                result[class_assignment.getVariableName()] = class_statements
+
+    return result
+
+
+def _isKeptDefinition(module, definition_name):
+    if definition_name.startswith("__") and definition_name.endswith("__"):
+        return True
+
+    full_name = module.getFullName().getChildNamed(definition_name)
+
+    if full_name.matchesToShellPatterns(Options.getKeptDefinitionPatterns())[0]:
+        return True
+
+    return Plugins.isDefinitionDynamicallyUsed(
+        module_name=module.getFullName(), definition_name=definition_name
+    )
+
+
+def removeUnusedModuleDefinitions():
+    """Remove module level functions and classes not used by name anywhere.
+
+    Returns:
+        Count of removed definitions, modules need to be optimized again,
+        if any.
+    """
+
+    program_names = _getProgramNames()
+
+    root_modules = ModuleRegistry.getRootModules()
+
+    result = 0
+
+    for module in ModuleRegistry.getDoneModules():
+        # The interpreter itself uses standard library modules by name, e.g.
+        # "threading._shutdown", so these cannot be changed.
+        if (
+            not module.isCompiledPythonModule()
+            or module in root_modules
+            or module.isMainModule()
+            or isStandardLibraryPath(module.getCompileTimeFilename())
+        ):
+            continue
+
+        if hasDynamicNamespaceUsage(module):
+            continue
+
+        for definition_name, statements in _getModuleDefinitions(module).items():
+            definition_names = Counter()
+            follow_functions = set()
+
+            for _sequence, statement in statements:
+                _addNodeNames(definition_names, statement, follow_functions)
+
+            if definition_names[definition_name] != program_names[definition_name]:
+                continue
+
+            if _isKeptDefinition(module, definition_name):
+                continue
+
+            # Do not leave behind empty statement sequences.
+            sequence = statements[0][0]
+            if len(sequence.subnode_statements) <= len(statements):
+                continue
+
+            for sequence, statement in statements:
+                sequence.removeStatement(statement)
+                statement.finalize()
+
+            optimization_logger.info(
+                "Removed unused definition '%s' of module '%s'."
+                % (definition_name, module.getFullName())
+            )
+
+            result += 1
+
+    if result:
+        general.info("Removed %d unused module level definitions." % result)
+
+    return result
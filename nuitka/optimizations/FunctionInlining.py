@@ -26,16 +26,19 @@ from nuitka.nodes.AssignNodes import (
     StatementReleaseVariable,
 )
 from nuitka.nodes.OutlineNodes import ExpressionOutlineBody
+from nuitka.nodes.ReturnNodes import StatementReturnNone
 from nuitka.tree.Operations import VisitorNoopMixin, visitTree
 from nuitka.tree.ReformulationTryFinallyStatements import (
     makeTryFinallyStatement,
 )
-from nuitka.tree.TreeHelpers import makeStatementsSequence
+from nuitka.tree.TreeHelpers import (
+    makeStatementsSequence,
+    makeStatementsSequenceFromStatement,
+)
 
 
-class VariableScopeUpdater(VisitorNoopMixin):
-    def __init__(self, locals_scope, variable_translation):
-        self.locals_scope = locals_scope
+class VariableUpdater(VisitorNoopMixin):
+    def __init__(self, variable_translation):
         self.variable_translation = variable_translation
 
     def onEnterNode(self, node):
@@ -43,18 +46,81 @@ class VariableScopeUpdater(VisitorNoopMixin):
             if node.variable in self.variable_translation:
                 node.variable = self.variable_translation[node.variable]
 
-        if hasattr(node, "locals_scope"):
-            node.locals_scope = self.locals_scope
-
 
-def updateLocalsScope(provider, locals_scope, variable_translation):
-    visitor = VariableScopeUpdater(
-        locals_scope=locals_scope, variable_translation=variable_translation
-    )
+def updateVariables(provider, variable_translation):
+    visitor = VariableUpdater(variable_translation=variable_translation)
 
     visitTree(provider, visitor)
 
 
+def _getInlineNodeCount(node, function_body):
+    """Count nodes of a function body, None if not to be used elsewhere."""
+
+    # Frames, other functions, outlines referring to the function, and the
+    # module namespace, cannot be moved to another function.
+    if (
+        node.isStatementsFrame()
+        or node.isExpressionFunctionRef()
+        or node.isExpressionOutlineBody()
+        or node.isExpressionOutlineFunctionBase()
+        or node.isExpressionBuiltinGlobals()
+        or node.isExpressionBuiltinImport()
+        or node.isExpressionImportName()
+        or node.isExpressionBuiltinType3()
+        or hasattr(node, "locals_scope")
+    ):
+        return None
+
+    if hasattr(node, "variable") and node.variable.getOwner() is not function_body:
+        return None
+
+    result = 1
+
+    for child in node.getVisitableNodes():
+        count = _getInlineNodeCount(child, function_body)
+
+        if count is None:
+            return None
+
+        result += count
+
+    return result
+
+
+def getCrossModuleInlineCost(function_body, arg_count):
+    """Cost of inlining a function into another module, with positional arguments.
+
+    Only functions that cannot raise are considered, as for these, the frame
+    of the function and its line numbers are not visible. Functions using
+    variables other than their own cannot be recursive.
+
+    Returns: None or integer values, None means don't do it.
+    """
+
+    parameters = function_body.getParameters()
+
+    if (
+        parameters.getArgumentCount() != arg_count
+        or parameters.getKwOnlyParameterCount()
+        or parameters.getStarListArgumentName() is not None
+        or parameters.getStarDictArgumentName() is not None
+    ):
+        return None
+
+    if function_body.getClosureVariables():
+        return None
+
+    body = function_body.subnode_body
+
+    if body is None:
+        return 0
+
+    if body.mayRaiseException(BaseException):
+        return None
+
+    return _getInlineNodeCount(body, function_body)
+
+
 def convertFunctionCallToOutline(provider, function_body, values, call_source_ref):
     # This has got to have pretty man details, pylint: disable=too-many-locals
     function_source_ref = function_body.getSourceReference()
@@ -64,51 +130,66 @@ def convertFunctionCallToOutline(provider, function_body, values, call_source_re
     )
 
     # Make a clone first, so we do not harm other references.
-    clone = function_body.subnode_body.makeClone()
-
-    locals_scope_clone, variable_translation = function_body.locals_scope.makeClone(
-        clone
-    )
+    clone = function_body.subnode_body
+    if clone is not None:
+        clone = clone.makeClone()
+
+    # Variables of the function become temporary variables of the outline.
+    temp_scope = outline_body.getOutlineTempScope()
+
+    variable_translation = {}
+
+    for variable in function_body.getLocalVariables() + list(
+        function_body.getTempVariables()
+    ):
+        variable_translation[variable] = outline_body.allocateTempVariable(
+            temp_scope=temp_scope,
+            name=variable.getName(),
+            temp_type="bool" if variable.isTempVariableBool() else None,
+        )
 
     # TODO: Lets update all at once maybe, it would take less visits.
-    updateLocalsScope(
-        clone,
-        locals_scope=locals_scope_clone,
-        variable_translation=variable_translation,
-    )
+    if clone is not None:
+        updateVariables(clone, variable_translation=variable_translation)
 
-    argument_names = function_body.getParameters().getParameterNames()
-    assert len(argument_names) == len(values), (argument_names, values)
+    argument_variables = function_body.getParameters().getAllVariables()
+    assert len(argument_variables) == len(values), (argument_variables, values)
 
     statements = []
 
-    for argument_name, value in zip(argument_names, values):
+    for argument_variable, value in zip(argument_variables, values):
         statements.append(
             StatementAssignmentVariable(
-                variable=variable_translation[argument_name],
+                variable=variable_translation[argument_variable],
                 source=value,
                 source_ref=call_source_ref,
             )
         )
 
     body = makeStatementsSequence(
-        statements=(statements, clone), allow_none=False, source_ref=function_source_ref
+        statements=(
+            statements,
+            clone,
+            # Functions without return at the end, give "None".
+            StatementReturnNone(source_ref=function_source_ref),
+        ),
+        allow_none=False,
+        source_ref=function_source_ref,
     )
 
-    auto_releases = function_body.getFunctionVariablesWithAutoReleases()
-
-    # TODO: Not possible to auto release with outline bodies too?
-    if auto_releases:
+    if variable_translation:
         releases = [
             StatementReleaseVariable(variable=variable, source_ref=function_source_ref)
-            for variable in auto_releases
+            for variable in variable_translation.values()
         ]
 
-        body = makeTryFinallyStatement(
-            provider=outline_body,
-            tried=body,
-            final=releases,
-            source_ref=function_source_ref,
+        body = makeStatementsSequenceFromStatement(
+            statement=makeTryFinallyStatement(
+                provider=outline_body,
+                tried=body,
+                final=releases,
+                source_ref=function_source_ref,
+            )
         )
 
     outline_body.setChild("body", body)
@@ -0,0 +1,210 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Hoisting of loop invariant expressions.
+
+Operations in a loop body, that only use values the loop does not change, are
+done once before the loop into a temporary variable. This is only done where
+it cannot be told apart, i.e. for operations that cannot raise and have no
+side effects, on values of immutable types, for which sharing one result is
+the same as making a new one for every iteration.
+
+Attribute lookups and module variables are not considered, any code run in
+the loop may change them.
+
+Hoisted operations are done even if the loop body would not reach them, e.g.
+in a branch not taken, after a "break", or with no iteration at all. Therefore
+operations, whose result can be a lot larger than their operands, e.g.
+repeating sequences or multiplying big integers, are not considered, these
+could take unbounded time and memory.
+"""
+
+from nuitka.nodes.AssignNodes import (
+    StatementAssignmentVariable,
+    StatementReleaseVariable,
+)
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    tshape_complex,
+    tshape_float,
+    tshapes_immutable,
+)
+from nuitka.nodes.VariableRefNodes import ExpressionTempVariableRef
+from nuitka.tree.Extractions import getVariablesWritten
+from nuitka.tree.ReformulationTryFinallyStatements import (
+    makeTryFinallyStatement,
+)
+from nuitka.tree.TreeHelpers import makeStatementsSequence
+
+
+def _isInvariantVariableRef(node, written_variables, entry_point):
+    variable = node.getVariable()
+
+    if variable in written_variables:
+        return False
+
+    if not variable.isLocalVariable() and not variable.isTempVariable():
+        return False
+
+    owner = variable.getOwner()
+
+    # Other scopes, e.g. closures, or "exec" and "locals" might change it.
+    if owner.getEntryPoint() is not entry_point or owner.isUnoptimized():
+        return False
+
+    if variable.hasWritersOutsideOf(owner) is not False:
+        return False
+
+    return node.getTypeShape() in tshapes_immutable
+
+
+# Operators that can give results much larger than their operands, unless
+# done with fixed size numbers.
+_growing_operators = ("Mult", "Pow", "LShift")
+
+
+def _isBoundedOperation(node):
+    """Decide if an operation is cheap enough to be done when not needed."""
+
+    if node.operator not in _growing_operators:
+        return True
+
+    return node.getTypeShape() in (tshape_float, tshape_complex)
+
+
+def _isInvariantOperation(node, written_variables, entry_point):
+    """Decide if an operation gives the same value in every iteration."""
+
+    if not node.isExpressionOperationBinary() or node.isExpressionOperationInplace():
+        return False
+
+    escape_desc = node.escape_desc
+
+    # Not yet computed, or may run code or raise.
+    if (
+        escape_desc is None
+        or escape_desc.getExceptionExit() is not None
+        or escape_desc.isControlFlowEscape()
+        or escape_desc.isValueEscaping()
+    ):
+        return False
+
+    if node.getTypeShape() not in tshapes_immutable:
+        return False
+
+    if not _isBoundedOperation(node):
+        return False
+
+    # Operations on constants only are computed at compile time, if at all.
+    has_variable = False
+
+    for operand in node.getVisitableNodes():
+        if operand.isExpressionVariableRef() or operand.isExpressionTempVariableRef():
+            if not _isInvariantVariableRef(operand, written_variables, entry_point):
+                return False
+
+            has_variable = True
+        elif operand.isCompileTimeConstant():
+            if operand.isMutable():
+                return False
+        elif _isInvariantOperation(operand, written_variables, entry_point):
+            has_variable = True
+        else:
+            return False
+
+    return has_variable
+
+
+def _getInvariantOperations(node, written_variables, entry_point, result):
+    for child in node.getVisitableNodes():
+        if _isInvariantOperation(child, written_variables, entry_point):
+            result.append(child)
+        else:
+            _getInvariantOperations(child, written_variables, entry_point, result)
+
+
+def hoistLoopInvariantOperations(loop_node):
+    """Move loop invariant operations out of a loop.
+
+    Args:
+        loop_node: the loop statement, its body must have been computed
+
+    Returns:
+        Statement to replace the loop with, or None if nothing was hoisted.
+    """
+
+    loop_body = loop_node.subnode_loop_body
+
+    if loop_body is None:
+        return None
+
+    provider = loop_node.getParentVariableProvider()
+
+    operations = []
+    _getInvariantOperations(
+        node=loop_body,
+        written_variables=getVariablesWritten(loop_body),
+        entry_point=provider.getEntryPoint(),
+        result=operations,
+    )
+
+    if not operations:
+        return None
+
+    source_ref = loop_node.getSourceReference()
+
+    temp_scope = provider.allocateTempScope("loop_invariant")
+
+    assignments = []
+    releases = []
+
+    for count, operation in enumerate(operations):
+        tmp_variable = provider.allocateTempVariable(
+            temp_scope=temp_scope, name="value_%d" % (count + 1)
+        )
+
+        operation.parent.replaceChild(
+            operation,
+            ExpressionTempVariableRef(
+                variable=tmp_variable, source_ref=operation.getSourceReference()
+            ),
+        )
+
+        assignments.append(
+            StatementAssignmentVariable(
+                variable=tmp_variable,
+                source=operation,
+                source_ref=operation.getSourceReference(),
+            )
+        )
+
+        releases.append(
+            StatementReleaseVariable(variable=tmp_variable, source_ref=source_ref)
+        )
+
+    return makeStatementsSequence(
+        statements=(
+            assignments,
+            makeTryFinallyStatement(
+                provider=provider,
+                tried=loop_node,
+                final=releases,
+                source_ref=source_ref,
+            ),
+        ),
+        allow_none=False,
+        source_ref=source_ref,
+    )
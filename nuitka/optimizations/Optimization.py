@@ -28,6 +28,7 @@ import inspect
 from nuitka import ModuleRegistry, Options, Variables
 from nuitka.Errors import NuitkaForbiddenImportEncounter
 from nuitka.importing import ImportCache
+from nuitka.nodes.NodeMakingHelpers import getComputationCacheStats
 from nuitka.plugins.Plugins import Plugins
 from nuitka.Progress import (
     closeProgressBar,
@@ -47,6 +48,8 @@ from nuitka.utils.MemoryUsage import (
 
 from . import Graphs
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
+from .DefinitionRemoval import removeUnusedModuleDefinitions
+from .ReadOnlyModuleVariables import findReadOnlyModuleVariables
 from .Tags import TagSet
 from .TraceCollections import withChangeIndicationsTo
 
@@ -97,6 +100,8 @@ def optimizeCompiledPythonModule(module):
     while True:
         tag_set.clear()
 
+        ModuleRegistry.startModuleUses(module, repeated=unchanged_count > 0 or touched)
+
         try:
             # print("Compute module")
             with withChangeIndicationsTo(signalChange):
@@ -235,11 +240,12 @@ def _restartProgress():
     )
 
 
-def _traceProgressModuleStart(current_module):
+def _traceProgressModuleStart(current_module, skipped):
     optimization_logger.info_fileoutput(
         """\
-Optimizing module '{module_name}', {remaining:d} more modules to go \
+{action} module '{module_name}', {remaining:d} more modules to go \
 after that.""".format(
+            action="Skipping unchanged" if skipped else "Optimizing",
             module_name=current_module.getFullName(),
             remaining=ModuleRegistry.getRemainingModulesCount(),
         ),
@@ -295,6 +301,8 @@ def makeOptimizationPass():
 
     finished = True
 
+    changed_modules = set()
+
     ModuleRegistry.startTraversal()
 
     _restartProgress()
@@ -307,21 +315,45 @@ def makeOptimizationPass():
             # optimizeModule(getInternalModule())
             break
 
-        _traceProgressModuleStart(current_module)
+        # Modules at a fixed point, using only unchanged modules, will not
+        # change, but what they use, must still be used.
+        skipped = ModuleRegistry.isUnchangedModule(current_module)
+
+        _traceProgressModuleStart(current_module, skipped=skipped)
+
+        if skipped:
+            ModuleRegistry.repeatModuleUses(current_module)
+            changed = False
+        else:
+            changed = optimizeModule(current_module)
 
-        changed = optimizeModule(current_module)
+            ModuleRegistry.endModuleUses()
 
         _traceProgressModuleEnd(current_module)
 
         if changed:
             finished = False
 
+            # In the first pass, modules are optimized once more after they
+            # stopped changing, so they are known to be at a fixed point,
+            # unless earlier optimizations used things, that the last one did
+            # not, which only the next pass will drop.
+            if (
+                pass_count > 1
+                or ModuleRegistry.hasDroppedModuleUses(current_module)
+                or current_module.hasEarlierUsedFunctions()
+            ):
+                changed_modules.add(current_module)
+
     # Unregister collection traces from now unused code, dropping the trace
     # collections of functions no longer used. This must be done after global
     # optimization due to cross module usages.
     for current_module in ModuleRegistry.getDoneModules():
         if current_module.isCompiledPythonModule():
             for unused_function in current_module.getUnusedFunctions():
+                # Variable usages change, so it may optimize further.
+                changed_modules.add(current_module)
+
                 Variables.updateVariablesFromCollection(
                     old_collection=unused_function.trace_collection,
                     new_collection=None,
@@ -338,6 +370,12 @@ def makeOptimizationPass():
 
             current_module.setChild("functions", used_functions)
 
+    # For comparison, all modules can be optimized in every pass.
+    if Options.isExperimental("optimize-all-modules"):
+        changed_modules = None
+
+    ModuleRegistry.updateUnchangedModules(changed_modules)
+
     _endProgress()
 
     return finished
@@ -355,10 +393,40 @@ def optimize(output_filename):
             module.isCompiledPythonModule()
             and module.getCompilationMode() == "bytecode"
         ):
+            ModuleRegistry.markModuleChanged(module)
             demoteCompiledModuleToBytecode(module)
 
     # Second, "endless" pass.
     while not finished:
         finished = makeOptimizationPass()
 
+    # Module variables found to never change, may be used in other modules,
+    # and there, make more module variables known to be constant.
+    if Options.shallOptimizeCrossModule():
+        while findReadOnlyModuleVariables():
+            ModuleRegistry.updateUnchangedModules(None)
+            finished = False
+
+            while not finished:
+                finished = makeOptimizationPass()
+
+    # Removing definitions nobody uses may make other ones unused, and it
+    # needs all modules to be known and optimized.
+    if Options.shallRemoveUnusedDefinitions():
+        while removeUnusedModuleDefinitions():
+            ModuleRegistry.updateUnchangedModules(None)
+            finished = False
+
+            while not finished:
+                finished = makeOptimizationPass()
+
+    hits, misses = getComputationCacheStats()
+
+    if hits or misses:
+        optimization_logger.info_fileoutput(
+            "Compile time computation cache had %d hits and %d misses, %.1f%% hit rate."
+            % (hits, misses, 100.0 * hits / (hits + misses)),
+            other_logger=progress_logger,
+        )
+
     Graphs.endGraph(output_filename)
@@ -61,11 +61,22 @@ from nuitka.nodes.BuiltinIntegerNodes import (
     ExpressionBuiltinInt1,
     ExpressionBuiltinInt2,
 )
+from nuitka.nodes.BuiltinIteratorMakingNodes import (
+    ExpressionBuiltinEnumerate1,
+    ExpressionBuiltinEnumerate2,
+    ExpressionBuiltinFilter,
+    ExpressionBuiltinMap,
+    ExpressionBuiltinZip,
+)
 from nuitka.nodes.BuiltinIteratorNodes import (
     ExpressionBuiltinIter1,
     ExpressionBuiltinIter2,
 )
 from nuitka.nodes.BuiltinLenNodes import ExpressionBuiltinLen
+from nuitka.nodes.BuiltinMinMaxNodes import (
+    ExpressionBuiltinMax,
+    ExpressionBuiltinMin,
+)
 from nuitka.nodes.BuiltinNextNodes import (
     ExpressionBuiltinNext1,
     ExpressionBuiltinNext2,
@@ -83,6 +94,7 @@ from nuitka.nodes.BuiltinRefNodes import (
     ExpressionBuiltinAnonymousRef,
     makeExpressionBuiltinTypeRef,
 )
+from nuitka.nodes.BuiltinSortedNodes import ExpressionBuiltinSorted
 from nuitka.nodes.BuiltinSumNodes import (
     ExpressionBuiltinSum1,
     ExpressionBuiltinSum2,
@@ -305,6 +317,125 @@ def sum_extractor(node):
     )
 
 
+def _getSimpleCallPositionalCount(node, allowed_keywords=()):
+    """Number of positional arguments of a call, if it is simple enough.
+
+    Returns None for calls with unknown star arguments, or keyword arguments
+    that are not allowed, so these remain calls of the built-in itself.
+    """
+    kw = node.subnode_kwargs
+
+    if kw is not None:
+        if not kw.isMappingWithConstantStringKeys():
+            return None
+
+        for key, _value in kw.getMappingStringKeyPairs():
+            if key not in allowed_keywords:
+                return None
+
+    args = node.subnode_args
+
+    if args is None:
+        return 0
+
+    if not args.canPredictIterationValues():
+        return None
+
+    return len(args.getIterationValues())
+
+
+def enumerate_extractor(node):
+    if _getSimpleCallPositionalCount(node, ("start",)) not in (1, 2):
+        return None
+
+    # Split up enumerate with and without start value, the former is the
+    # most common.
+    def selectEnumerateBuiltinClass(iterable, start, source_ref):
+        if start is None:
+            return ExpressionBuiltinEnumerate1(iterable=iterable, source_ref=source_ref)
+        else:
+            return ExpressionBuiltinEnumerate2(
+                iterable=iterable, start=start, source_ref=source_ref
+            )
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=selectEnumerateBuiltinClass,
+        builtin_spec=BuiltinParameterSpecs.builtin_enumerate_spec,
+    )
+
+
+def zip_extractor(node):
+    # Python3.10 "strict" is not handled here.
+    if _getSimpleCallPositionalCount(node) is None:
+        return None
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinZip,
+        builtin_spec=BuiltinParameterSpecs.builtin_zip_spec,
+    )
+
+
+def map_extractor(node):
+    count = _getSimpleCallPositionalCount(node)
+
+    if count is None or count < 2:
+        return None
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinMap,
+        builtin_spec=BuiltinParameterSpecs.builtin_map_spec,
+    )
+
+
+def filter_extractor(node):
+    if _getSimpleCallPositionalCount(node) != 2:
+        return None
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinFilter,
+        builtin_spec=BuiltinParameterSpecs.builtin_filter_spec,
+    )
+
+
+def sorted_extractor(node):
+    if _getSimpleCallPositionalCount(node, ("key", "reverse")) != 1:
+        return None
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinSorted,
+        builtin_spec=BuiltinParameterSpecs.builtin_sorted_spec,
+    )
+
+
+def min_extractor(node):
+    # The "key" and "default" variants are not handled here.
+    if not _getSimpleCallPositionalCount(node):
+        return None
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinMin,
+        builtin_spec=BuiltinParameterSpecs.builtin_min_spec,
+    )
+
+
+def max_extractor(node):
+    # The "key" and "default" variants are not handled here.
+    if not _getSimpleCallPositionalCount(node):
+        return None
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinMax,
+        builtin_spec=BuiltinParameterSpecs.builtin_max_spec,
+    )
+
+
 def dict_extractor(node):
     # The "dict" built-in is a bit strange in that it accepts a position
     # parameter, or not, but won't have a default value.
@@ -1385,6 +1516,9 @@ _dispatch_dict = {
     "staticmethod": staticmethod_extractor,
     "classmethod": classmethod_extractor,
     "divmod": divmod_extractor,
+    "enumerate": enumerate_extractor,
+    "min": min_extractor,
+    "max": max_extractor,
 }
 
 if python_version < 0x300:
@@ -1404,6 +1538,12 @@ else:
     # The Python3 range is really an xrange, use that.
     _dispatch_dict["range"] = xrange_extractor
 
+    # These give lists in Python2, and are only handled for Python3.
+    _dispatch_dict["zip"] = zip_extractor
+    _dispatch_dict["map"] = map_extractor
+    _dispatch_dict["filter"] = filter_extractor
+    _dispatch_dict["sorted"] = sorted_extractor
+
 
 def check():
     from nuitka.Builtins import builtin_names
@@ -1418,14 +1558,11 @@ _builtin_ignore_list = (
     # Not supporting 'print', because it could be replaced, and is not
     # worth the effort yet.
     "print",
-    # TODO: This could, and should be supported, as we could e.g. lower
-    # types easily for it.
+    # TODO: For Python2, these give lists, and would need other nodes.
     "sorted",
-    # TODO: This would be very worthwhile, as it could easily optimize
-    # its iteration away.
     "zip",
-    # TODO: This would be most precious due to the type hint it gives
-    "enumerate",
+    "map",
+    "filter",
     # TODO: Also worthwhile for known values.
     "reversed",
     # TODO: Not sure what this really is about.
@@ -1502,8 +1639,11 @@ def computeBuiltinCall(builtin_name, call_node):
     if builtin_name in _dispatch_dict:
         new_node = _dispatch_dict[builtin_name](call_node)
 
+        # Extractors may decline forms of calls they do not specialize.
+        if new_node is None:
+            return call_node, None, None
+
         assert new_node is not call_node, builtin_name
-        assert new_node is not None, builtin_name
 
         # For traces, we are going to ignore side effects, and output traces
         # only based on the basis of it.
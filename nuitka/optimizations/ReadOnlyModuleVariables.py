@@ -0,0 +1,492 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Module variables of the whole program, that are never changed.
+
+Module local optimization cannot know the value of a module variable outside
+of the module body, as other modules may change it. With the whole program
+known, a module variable assigned only once, on the top level of its module,
+and never deleted or assigned elsewhere, e.g. with "global" in a function, or
+as attribute of the module, has the same value wherever it is read without
+raising an exception.
+
+For constants and functions, this value is recorded, such that imports with
+"from module import name" can use the constant, and calls of the function its
+result type. In functions created after the assignment, and in the module body
+after it, reading the variable cannot fail, so it is replaced with the constant.
+
+This is only a heuristic for what is dynamic. Names given as strings, e.g. to
+"mock.patch", count as written, and any use of "setattr", "delattr", "vars" or
+"__dict__" disables it for the whole program. Changes from extension modules or
+modules not part of the program are not seen, therefore it must be asked for,
+and modules doing dynamic things with their namespace are not considered.
+"""
+
+import marshal
+
+from nuitka import ModuleRegistry
+from nuitka.__past__ import basestring
+from nuitka.importing.Importing import findModule
+from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
+from nuitka.nodes.ImportNodes import getImportedModuleName
+from nuitka.nodes.shapes.StandardShapes import tshape_unknown
+from nuitka.Tracing import general, optimization_logger
+from nuitka.utils.ModuleNames import ModuleName
+
+from .DefinitionRemoval import hasDynamicNamespaceUsage
+
+# Read-only module variables by module name and variable name.
+_read_only_variables = {}
+
+# Names of built-ins and attributes, that write attributes with names not known.
+_dynamic_names = frozenset(("setattr", "delattr", "vars", "__dict__"))
+
+
+def getReadOnlyModuleVariable(module_name, variable_name):
+    """Get a module variable, if it is known to be never changed.
+
+    Returns:
+        ReadOnlyModuleVariable or None
+    """
+
+    return _read_only_variables.get((module_name, variable_name))
+
+
+class ReadOnlyModuleVariable(object):
+    """Value of a module variable, that is never changed."""
+
+    __slots__ = (
+        "constant",
+        "function_body",
+        "return_type_shape",
+        "assigned_first",
+        "assign_index",
+        "function_indexes",
+    )
+
+    def __init__(
+        self,
+        constant,
+        function_body,
+        return_type_shape,
+        assigned_first,
+        assign_index,
+        function_indexes,
+    ):
+        self.constant = constant
+        self.function_body = function_body
+        self.return_type_shape = return_type_shape
+
+        # Assigned before the module runs code of other modules.
+        self.assigned_first = assigned_first
+
+        # Index of the assignment in module level statements, and of the
+        # statement, that first creates a function of the module.
+        self.assign_index = assign_index
+        self.function_indexes = function_indexes
+
+    def isConstant(self):
+        return self.function_body is None
+
+    def getConstant(self):
+        return self.constant
+
+    def getFunctionBody(self):
+        return self.function_body
+
+    def getReturnTypeShape(self):
+        return self.return_type_shape
+
+    def isAssignedFirst(self):
+        """Is the variable assigned, before other modules can import it."""
+
+        return self.assigned_first
+
+    def isAssignedBefore(self, entry_point):
+        """Is the variable assigned, before the function can be created."""
+
+        function_index = self.function_indexes.get(entry_point)
+
+        return function_index is not None and function_index > self.assign_index
+
+
+def _isReraisingHandler(handler):
+    return (
+        handler is None or handler.subnode_statements[-1].isStatementReraiseException()
+    )
+
+
+def _getModuleLevelStatements(statement_sequence):
+    """Get the statements on module level in order, and if always executed.
+
+    Statements in the tried block of "try" statements that re-raise all
+    exceptions, are executed unless the module raises.
+    """
+
+    for statement in statement_sequence.subnode_statements:
+        if statement.isStatementsFrame():
+            for item in _getModuleLevelStatements(statement):
+                yield item
+        elif statement.isStatementTry() and _isReraisingHandler(
+            statement.subnode_except_handler
+        ):
+            for item in _getModuleLevelStatements(statement.subnode_tried):
+                yield item
+
+            for child in statement.getVisitableNodes():
+                if child is not statement.subnode_tried:
+                    yield child, False
+        else:
+            yield statement, True
+
+
+def _mayRunCode(statement):
+    if statement.isStatementAssignmentVariable():
+        return statement.subnode_source.mayHaveSideEffects()
+    elif statement.isStatementExpressionOnly():
+        return statement.subnode_expression.mayHaveSideEffects()
+    # Setup of every module, of the "__spec__" attributes, and for packages,
+    # of the importer cache in "sys".
+    elif statement.isStatementAssignmentAttribute():
+        return (
+            not statement.subnode_expression.isExpressionModuleAttributeSpecRef()
+            or statement.subnode_source.mayHaveSideEffects()
+        )
+    elif statement.isStatementDictOperationSet():
+        return not statement.subnode_dict_arg.isExpressionImportModuleNameHard()
+    else:
+        return True
+
+
+def _addFunctionIndexes(node, index, function_indexes):
+    if node.isExpressionFunctionRef():
+        function_body = node.getFunctionBody()
+
+        if function_body not in function_indexes:
+            function_indexes[function_body] = index
+
+            _addFunctionIndexes(function_body, index, function_indexes)
+
+    for child in node.getVisitableNodes():
+        _addFunctionIndexes(child, index, function_indexes)
+
+
+def _addReturnTypeShapes(node, result):
+    if node.isStatementReturnConstant():
+        result.add(
+            makeConstantRefNode(
+                constant=node.getConstant(), source_ref=node.source_ref
+            ).getTypeShape()
+        )
+    elif node.isStatementReturnReturnedValue():
+        result.add(tshape_unknown)
+    elif node.isStatementReturn():
+        result.add(node.subnode_expression.getTypeShape())
+    # Returns of outlines are not returns of the function.
+    elif not node.isExpressionOutlineBody() and not node.isExpressionOutlineFunction():
+        for child in node.getVisitableNodes():
+            _addReturnTypeShapes(child, result)
+
+
+def _getReturnTypeShape(function_body):
+    if function_body.subnode_body is None:
+        return tshape_unknown
+
+    type_shapes = set()
+    _addReturnTypeShapes(function_body.subnode_body, type_shapes)
+
+    if len(type_shapes) == 1:
+        return type_shapes.pop()
+    else:
+        return tshape_unknown
+
+
+def _addConstantNames(names, constant):
+    """Add names, that strings may give to code writing attributes."""
+
+    if isinstance(constant, basestring):
+        names.add(constant)
+
+        # Dotted names, e.g. for "mock.patch", end in the attribute name.
+        names.add(constant.rsplit(".", 1)[-1])
+    elif type(constant) in (tuple, list, set, frozenset):
+        for element in constant:
+            _addConstantNames(names, element)
+    elif type(constant) is dict:
+        for key, value in constant.items():
+            _addConstantNames(names, key)
+            _addConstantNames(names, value)
+
+
+def _addCodeObjectNames(names, code_object):
+    names.update(code_object.co_names)
+
+    for constant in code_object.co_consts:
+        if type(constant) is type(code_object):
+            _addCodeObjectNames(names, constant)
+        else:
+            _addConstantNames(names, constant)
+
+
+def _addWrittenAttributeNames(names, node):
+    """Add names of attributes written, return False for unknown names."""
+
+    if node.isStatementAssignmentAttribute() or node.isStatementDelAttribute():
+        if node.getAttributeName() in _dynamic_names:
+            return False
+
+        names.add(node.getAttributeName())
+    elif (
+        node.isExpressionAttributeLookup() or node.isExpressionAttributeLookupSpecial()
+    ):
+        if node.getAttributeName() in _dynamic_names:
+            return False
+    elif node.isExpressionBuiltinSetattr() or node.isExpressionBuiltinVars():
+        return False
+    elif node.isExpressionBuiltinRef() and node.getBuiltinName() in _dynamic_names:
+        return False
+    elif node.isExpressionConstantRef():
+        constant_names = set()
+        _addConstantNames(constant_names, node.getCompileTimeConstant())
+
+        # E.g. "getattr(module, '__dict__')" is as dynamic.
+        if not constant_names.isdisjoint(_dynamic_names):
+            return False
+
+        names.update(constant_names)
+
+    for child in node.getVisitableNodes():
+        # Names imported from modules are only read.
+        if node.isExpressionBuiltinImport() and child is node.subnode_fromlist:
+            continue
+
+        if not _addWrittenAttributeNames(names, child):
+            return False
+
+    return True
+
+
+def _getProgramWrittenAttributeNames():
+    """Get names of attributes the program may write, None if not known."""
+
+    result = set()
+
+    for module in ModuleRegistry.getDoneModules():
+        if module.isCompiledPythonModule():
+            for node in (module.subnode_body,) + module.subnode_functions:
+                if node is not None and not _addWrittenAttributeNames(result, node):
+                    return None
+        elif module.isUncompiledPythonModule() and module.getByteCode():
+            # Names used in any way count, these can be attribute writes.
+            names = set()
+            _addCodeObjectNames(names, marshal.loads(module.getByteCode()))
+
+            if not names.isdisjoint(_dynamic_names):
+                return None
+
+            result.update(names)
+
+    return result
+
+
+def _isSubModuleName(module, variable_name):
+    if not module.isCompiledPythonPackage():
+        return False
+
+    _module_package, module_filename, _finding = findModule(
+        importing=module,
+        module_name=ModuleName(variable_name),
+        parent_package=module.getFullName(),
+        level=-1,  # Relative import, so child is used.
+        warn=False,
+    )
+
+    return module_filename is not None
+
+
+def _isSingleAssignment(variable, assign_node):
+    for trace in variable.traces:
+        if trace.isAssignTrace():
+            if trace.getAssignNode() is not assign_node:
+                return False
+        elif trace.isDeletedTrace():
+            return False
+
+    return True
+
+
+def _getAssignedValue(source, read_only_variables):
+    """Get constant and function body assigned, None if not suitable."""
+
+    if source.isExpressionConstantRef():
+        if source.isMutable():
+            return None
+
+        return source.getCompileTimeConstant(), None
+    elif source.isExpressionFunctionCreation():
+        return None, source.subnode_function_ref.getFunctionBody()
+    elif source.isExpressionImportName():
+        imported_module_name = getImportedModuleName(source.subnode_module)
+
+        if imported_module_name is None:
+            return None
+
+        imported_variable = read_only_variables.get(
+            (imported_module_name, source.getImportName())
+        )
+
+        if imported_variable is None:
+            return None
+
+        return imported_variable.getConstant(), imported_variable.getFunctionBody()
+    else:
+        return None
+
+
+def _addModuleReadOnlyVariables(module, written_names, read_only_variables):
+    """Add read-only variables of a module, return count of added ones."""
+
+    function_indexes = {}
+    candidates = []
+
+    may_have_run_code = False
+
+    for index, (statement, executed) in enumerate(
+        _getModuleLevelStatements(module.subnode_body)
+    ):
+        _addFunctionIndexes(statement, index, function_indexes)
+
+        if (
+            executed
+            and statement.isStatementAssignmentVariable()
+            and statement.getVariable().isModuleVariable()
+            and statement.getVariable().getOwner() is module
+        ):
+            candidates.append((statement, index, not may_have_run_code))
+
+        if _mayRunCode(statement):
+            may_have_run_code = True
+
+    result = 0
+
+    for assign_node, assign_index, assigned_first in candidates:
+        variable = assign_node.getVariable()
+        variable_name = variable.getName()
+
+        key = module.getFullName(), variable_name
+
+        if key in read_only_variables:
+            continue
+
+        if variable_name.startswith("__") and variable_name.endswith("__"):
+            continue
+
+        if variable_name in written_names:
+            continue
+
+        if not _isSingleAssignment(variable, assign_node):
+            continue
+
+        value = _getAssignedValue(assign_node.subnode_source, read_only_variables)
+
+        if value is None:
+            continue
+
+        if _isSubModuleName(module, variable_name):
+            continue
+
+        constant, function_body = value
+
+        # Replacing the code of the function would change what it does.
+        if function_body is not None and "__code__" in written_names:
+            continue
+
+        read_only_variables[key] = ReadOnlyModuleVariable(
+            constant=constant,
+            function_body=function_body,
+            return_type_shape=None
+            if function_body is None
+            else _getReturnTypeShape(function_body),
+            assigned_first=assigned_first,
+            assign_index=assign_index,
+            function_indexes=function_indexes,
+        )
+
+        result += 1
+
+    return result
+
+
+def findReadOnlyModuleVariables():
+    """Find module variables of the whole program, that are never changed.
+
+    Returns:
+        Count of module variables not known before, modules need to be
+        optimized again, if any.
+    """
+
+    written_names = _getProgramWrittenAttributeNames()
+
+    if written_names is None:
+        optimization_logger.info(
+            "Not using read-only module variables, program may set attributes with computed names."
+        )
+
+        return 0
+
+    modules = [
+        module
+        for module in ModuleRegistry.getDoneModules()
+        if module.isCompiledPythonModule()
+        and not module.getLocalsScope().isEscaped()
+        and not hasDynamicNamespaceUsage(module)
+    ]
+
+    read_only_variables = {}
+
+    # Variables imported from other modules, need these to be done first.
+    while True:
+        added = 0
+
+        for module in modules:
+            added += _addModuleReadOnlyVariables(
+                module=module,
+                written_names=written_names,
+                read_only_variables=read_only_variables,
+            )
+
+        if not added:
+            break
+
+    result = 0
+
+    for key in read_only_variables:
+        if key not in _read_only_variables:
+            optimization_logger.info(
+                "Module variable '%s' of module '%s' is never changed."
+                % (key[1], key[0])
+            )
+
+            result += 1
+
+    _read_only_variables.clear()
+    _read_only_variables.update(read_only_variables)
+
+    if result:
+        general.info("Found %d module variables, that are never changed." % result)
+
+    return result
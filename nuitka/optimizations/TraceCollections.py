@@ -24,14 +24,14 @@ This is about collecting these constraints and to manage them.
 """
 
 import contextlib
-from collections import defaultdict
 from contextlib import contextmanager
 
 from nuitka import Tracing, Variables
 from nuitka.__past__ import iterItems  # Python3 compatibility.
+from nuitka.containers.LayeredDict import LayeredDict, getDivergedValues
 from nuitka.containers.oset import OrderedSet
 from nuitka.importing.ImportCache import getImportedModuleByNameAndPath
-from nuitka.ModuleRegistry import addUsedModule
+from nuitka.ModuleRegistry import addUsedFunction, addUsedModule
 from nuitka.nodes.NodeMakingHelpers import getComputationResult
 from nuitka.nodes.shapes.BuiltinTypeShapes import tshape_dict
 from nuitka.nodes.shapes.StandardShapes import tshape_uninit
@@ -349,8 +349,8 @@ class TraceCollectionBase(object):
         # Value state extra information per node.
         self.value_states = {}
 
-        # Currently active values in the tracing.
-        self.variable_actives = {}
+        # Currently active values in the tracing, branches share them.
+        self.variable_actives = LayeredDict()
 
     def __repr__(self):
         return "<%s for %s at 0x%x>" % (self.__class__.__name__, self.name, id(self))
@@ -467,7 +467,7 @@ class TraceCollectionBase(object):
         # Make sure the owning module is added to the used set. This is most
         # important for helper functions, or modules, which otherwise have
         # become unused.
-        addUsedModule(owning_module)
+        addUsedFunction(function_body)
 
         needs_visit = owning_module.addUsedFunction(function_body)
 
@@ -724,39 +724,29 @@ class TraceCollectionBase(object):
             collection1 = collection_yes
             collection2 = collection_no
 
-        variable_versions = {}
+        actives1 = collection1.variable_actives
+        actives2 = collection2.variable_actives
 
-        for variable, version in iterItems(collection1.variable_actives):
-            variable_versions[variable] = version
+        # Only variables set in a branch can differ, the others have the
+        # versions of the shared values.
+        common, variables, (values1, values2) = getDivergedValues((actives1, actives2))
 
-        for variable, version in iterItems(collection2.variable_actives):
-            if variable not in variable_versions:
-                variable_versions[variable] = 0, version
-            else:
-                other = variable_versions[variable]
-
-                if other != version:
-                    variable_versions[variable] = other, version
-                else:
-                    variable_versions[variable] = other
-
-        for variable in variable_versions:
-            if variable not in collection2.variable_actives:
-                variable_versions[variable] = variable_versions[variable], 0
+        self.variable_actives = LayeredDict(common)
 
-        self.variable_actives = {}
+        for variable in variables:
+            version1 = values1.get(variable, 0)
+            version2 = values2.get(variable, 0)
 
-        for variable, versions in iterItems(variable_versions):
-            if type(versions) is tuple:
+            if version1 != version2:
                 version = self.addVariableMergeMultipleTrace(
                     variable=variable,
                     traces=(
-                        self.getVariableTrace(variable, versions[0]),
-                        self.getVariableTrace(variable, versions[1]),
+                        self.getVariableTrace(variable, version1),
+                        self.getVariableTrace(variable, version2),
                     ),
                 )
             else:
-                version = versions
+                version = version1
 
             self.markCurrentVariableTrace(variable, version)
 
@@ -774,20 +764,29 @@ class TraceCollectionBase(object):
             message="Running merge for %s took %%.2f seconds" % collections,
             decider=lambda: 0,
         ):
-            variable_versions = defaultdict(OrderedSet)
+            all_actives = [collection.variable_actives for collection in collections]
 
-            for collection in collections:
-                for variable, version in iterItems(collection.variable_actives):
-                    variable_versions[variable].add(version)
+            # Only variables set in a branch can differ, the others have the
+            # versions of the shared values.
+            common, variables, all_values = getDivergedValues(all_actives)
 
-            for collection in collections:
-                for variable, versions in iterItems(variable_versions):
-                    if variable not in collection.variable_actives:
-                        versions.add(0)
+            self.variable_actives = LayeredDict(common)
 
-            self.variable_actives = {}
+            for variable in variables:
+                versions = OrderedSet()
+                missing = False
+
+                for values in all_values:
+                    version = values.get(variable)
+
+                    if version is None:
+                        missing = True
+                    else:
+                        versions.add(version)
+
+                if missing:
+                    versions.add(0)
 
-            for variable, versions in iterItems(variable_versions):
                 if len(versions) == 1:
                     (version,) = versions
                 else:
@@ -856,12 +855,15 @@ class TraceCollectionBase(object):
     def onLocalsDictEscaped(self, locals_scope):
         self.parent.onLocalsDictEscaped(locals_scope)
 
-    def getCompileTimeComputationResult(self, node, computation, description):
+    def getCompileTimeComputationResult(
+        self, node, computation, description, cache_key=None
+    ):
         new_node, change_tags, message = getComputationResult(
             node=node,
             computation=computation,
             description=description,
             user_provided=False,
+            cache_key=cache_key,
         )
 
         if change_tags == "new_raise":
@@ -894,8 +896,8 @@ class TraceCollectionBranch(CollectionUpdateMixin, TraceCollectionBase):
     def __init__(self, name, parent):
         TraceCollectionBase.__init__(self, owner=parent.owner, name=name, parent=parent)
 
-        # Detach from others
-        self.variable_actives = dict(parent.variable_actives)
+        # Detach from others, sharing the values unchanged.
+        self.variable_actives = parent.variable_actives.snapshot()
 
         # For quick access without going to parent.
         self.variable_traces = parent.variable_traces
@@ -924,7 +926,7 @@ class TraceCollectionBranch(CollectionUpdateMixin, TraceCollectionBase):
     def dumpActiveTraces(self):
         Tracing.printSeparator()
         Tracing.printLine("Active are:")
-        for variable, _version in sorted(self.variable_actives.iteritems()):
+        for variable, _version in sorted(self.variable_actives.items()):
             self.getVariableCurrentTrace(variable).dump()
 
         Tracing.printSeparator()
@@ -32,7 +32,11 @@ Values can be seen as:
 * LoopComplete (complete knowledge of loop types)
 """
 
-from nuitka.nodes.shapes.BuiltinTypeShapes import tshape_dict, tshape_tuple
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    tshape_dict,
+    tshape_tuple,
+    tshapes_immutable,
+)
 from nuitka.nodes.shapes.StandardShapes import (
     ShapeLoopCompleteAlternative,
     ShapeLoopInitialAlternative,
@@ -356,6 +360,15 @@ class ValueTraceEscaped(ValueTraceUnknown):
     def mustNotHaveValue(self):
         return self.previous.mustNotHaveValue()
 
+    def getTypeShape(self):
+        # Escaping cannot change values of immutable types, nor their type.
+        type_shape = self.previous.getTypeShape()
+
+        if type_shape in tshapes_immutable:
+            return type_shape
+
+        return tshape_unknown
+
     def getReplacementNode(self, usage):
         return self.previous.getReplacementNode(usage)
 
@@ -28,16 +28,15 @@ it being used.
 
 import os
 import pkgutil
-import shutil
-import sys
 from collections import namedtuple
 
 from nuitka.__past__ import getMetaClassBase
 from nuitka.Tracing import plugins_logger
-from nuitka.utils.Execution import NuitkaCalledProcessError, check_output
-from nuitka.utils.FileOperations import makePath
+from nuitka.utils.FileOperations import copyFile, makePath
 from nuitka.utils.ModuleNames import ModuleName
 
+from .RuntimeInformation import queryRuntimeInformation
+
 pre_modules = {}
 post_modules = {}
 
@@ -384,9 +383,7 @@ class NuitkaPluginBase(getMetaClassBase("Plugin")):
             # Copy to the dist directory, which normally should not be our task, but is for now.
             makePath(os.path.dirname(included_entry_point.dest_path))
 
-            shutil.copyfile(
-                included_entry_point.source_path, included_entry_point.dest_path
-            )
+            copyFile(included_entry_point.source_path, included_entry_point.dest_path)
 
             yield included_entry_point
 
@@ -522,6 +519,24 @@ class NuitkaPluginBase(getMetaClassBase("Plugin")):
         # Virtual method, pylint: disable=no-self-use,unused-argument
         return None
 
+    def isDefinitionDynamicallyUsed(self, module_name, definition_name):
+        """Decide whether a module level definition is used dynamically.
+
+        Notes:
+            With "--remove-unused-definitions", functions and classes whose
+            name is not found in the program are removed. Plugins that know
+            a package accesses definitions by computed names, must keep them.
+
+        Args:
+            module_name: name of module
+            definition_name: name of the function or class
+
+        Returns:
+            True or False (default)
+        """
+        # Virtual method, pylint: disable=no-self-use,unused-argument
+        return False
+
     def getPreprocessorSymbols(self):
         """Decide which C defines to be used in compilation.
 
@@ -601,64 +616,34 @@ class NuitkaPluginBase(getMetaClassBase("Plugin")):
     _runtime_information_cache = {}
 
     def queryRuntimeInformationMultiple(self, info_name, setup_codes, values):
-        if info_name in self._runtime_information_cache:
-            return self._runtime_information_cache[info_name]
-
-        keys = []
-        query_codes = []
-
-        for key, value_expression in values:
-            keys.append(key)
-
-            query_codes.append("print(repr(%s))" % value_expression)
-            query_codes.append('print("-" * 27)')
-
         if type(setup_codes) is str:
             setup_codes = setup_codes.split("\n")
 
-        cmd = r"""\
-from __future__ import print_function
-from __future__ import absolute_import
-
-try:
-    %(setup_codes)s
-except ImportError:
-    import sys
-    sys.exit(38)
-%(query_codes)s
-""" % {
-            "setup_codes": "\n   ".join(setup_codes),
-            "query_codes": "\n".join(query_codes),
-        }
-
-        try:
-            feedback = check_output([sys.executable, "-c", cmd])
-        except NuitkaCalledProcessError as e:
-            if e.returncode == 38:
-                return None
-            raise
-
-        if str is not bytes:  # We want to work with strings, that's hopefully OK.
-            feedback = feedback.decode("utf8")
-
-        # Ignore Windows newlines difference.
-        feedback = [line.strip() for line in feedback.splitlines()]
-
-        if feedback.count("-" * 27) != len(keys):
-            self.sysexit(
-                "Error, mismatch in output retrieving %r information." % info_name
-            )
+        keys = tuple(key for key, _value_expression in values)
+        value_expressions = tuple(value_expression for _key, value_expression in values)
 
-        feedback = [line for line in feedback if line != "-" * 27]
+        # Different plugins may use the same information name, so the query
+        # itself is what identifies it.
+        cache_key = tuple(setup_codes), value_expressions
 
-        NamedTupleResult = namedtuple(info_name, keys)
+        if cache_key not in self._runtime_information_cache:
+            feedback = queryRuntimeInformation(
+                info_name=info_name,
+                setup_codes=setup_codes,
+                value_expressions=value_expressions,
+            )
 
-        # We are being lazy here, the code is trusted, pylint: disable=eval-used
-        self._runtime_information_cache[info_name] = NamedTupleResult(
-            *(eval(value) for value in feedback)
-        )
+            if feedback is None:
+                self._runtime_information_cache[cache_key] = None
+            else:
+                NamedTupleResult = namedtuple(info_name, keys)
+
+                # We are being lazy here, the code is trusted, pylint: disable=eval-used
+                self._runtime_information_cache[cache_key] = NamedTupleResult(
+                    *(eval(value) for value in feedback)
+                )
 
-        return self._runtime_information_cache[info_name]
+        return self._runtime_information_cache[cache_key]
 
     def queryRuntimeInformationSingle(self, setup_codes, value):
         return self.queryRuntimeInformationMultiple(
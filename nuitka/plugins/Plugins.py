@@ -29,7 +29,6 @@ The base class in PluginBase will serve as documentation of available.
 
 import inspect
 import os
-import shutil
 from optparse import OptionConflictError, OptionGroup
 
 import nuitka.plugins.commercial
@@ -43,7 +42,12 @@ from nuitka.Errors import NuitkaPluginError
 from nuitka.freezer.IncludedEntryPoints import makeDllEntryPointOld
 from nuitka.ModuleRegistry import addUsedModule
 from nuitka.Tracing import plugins_logger, printLine
-from nuitka.utils.FileOperations import makePath, putTextFileContents, relpath
+from nuitka.utils.FileOperations import (
+    copyFile,
+    makePath,
+    putTextFileContents,
+    relpath,
+)
 from nuitka.utils.Importing import importFileAsModule
 from nuitka.utils.ModuleNames import ModuleName
 
@@ -392,7 +396,7 @@ class Plugins(object):
 
                     makePath(os.path.dirname(extra_dll.dest_path))
 
-                    shutil.copyfile(extra_dll.source_path, extra_dll.dest_path)
+                    copyFile(extra_dll.source_path, extra_dll.dest_path)
 
                 result.append(extra_dll)
 
@@ -738,6 +742,22 @@ class Plugins(object):
 
         return "compiled"
 
+    @staticmethod
+    def isDefinitionDynamicallyUsed(module_name, definition_name):
+        """Let plugins decide whether a module level definition must be kept.
+
+        Notes:
+            If all plugins return False, the return will be False, else True.
+
+        Returns:
+            True or False (default)
+        """
+        for plugin in getActivePlugins():
+            if plugin.isDefinitionDynamicallyUsed(module_name, definition_name):
+                return True
+
+        return False
+
     preprocessor_symbols = None
 
     @classmethod
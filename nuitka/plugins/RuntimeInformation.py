@@ -0,0 +1,305 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Query runtime information of the compiled Python for plugins.
+
+Plugins need to ask e.g. Qt where its plugins live, which requires importing
+the package, often a heavy one, in the Python that is being compiled for. We
+do not want to import these in Nuitka itself, so this runs in a helper
+interpreter that stays alive for the whole compilation, which avoids starting
+a new interpreter for every query. Where possible, the helper forks for each
+query, so that no query can see what another one did, and otherwise every
+query is run in a fresh process.
+
+Results only depend on the Python installation, the environment, and the
+query itself, so they are also cached persistently. Installing, updating, or
+removing packages changes the modification time of the directories in the
+module search path, which is part of the cache key.
+
+Should a query fail in the helper interpreter, it is repeated in a fresh
+process, as it was done before the helper existed.
+"""
+
+import ast
+import atexit
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+from nuitka.Tracing import plugins_logger
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.Execution import (
+    NuitkaCalledProcessError,
+    check_output,
+    getNullOutput,
+)
+from nuitka.utils.FileOperations import (
+    getFileContents,
+    makePath,
+    putFileContentsAtomic,
+)
+
+# Exit code of the fresh process to indicate failed imports in setup code.
+_import_error_exit_code = 38
+
+# The helper interpreter reads one query per line, each being the "repr" of
+# the setup code and the value expressions, and answers with one line, being
+# the "repr" of the list of value "repr" strings, "None" if the setup code
+# raised an "ImportError", and "False" if anything else went wrong. Queries
+# run in a forked child, so the helper itself never imports anything they
+# do. Output of the queries itself, even from C code, goes to "stderr", which
+# is discarded.
+_helper_code = r"""
+import ast, os, sys
+
+reply_file = os.fdopen(os.dup(1), "w")
+os.dup2(2, 1)
+
+def runQuery(setup_code, value_expressions):
+    namespace = {"__name__": "__main__"}
+
+    try:
+        try:
+            exec(setup_code, namespace)
+        except ImportError:
+            return None
+        else:
+            return [repr(eval(value, namespace)) for value in value_expressions]
+    except BaseException:
+        return False
+
+while True:
+    line = sys.stdin.readline()
+
+    if not line:
+        break
+
+    setup_code, value_expressions = ast.literal_eval(line)
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        os.close(read_fd)
+
+        reply = runQuery(setup_code, value_expressions)
+
+        with os.fdopen(write_fd, "w") as child_reply_file:
+            child_reply_file.write(repr(reply))
+
+        os._exit(0)
+
+    os.close(write_fd)
+
+    with os.fdopen(read_fd, "r") as child_reply_file:
+        reply = child_reply_file.read()
+
+    os.waitpid(pid, 0)
+
+    # Crashed or exited queries give no reply.
+    if not reply:
+        reply = "False"
+
+    reply_file.write(reply + "\n")
+    reply_file.flush()
+"""
+
+_helper_process = None
+
+
+def _stopHelperProcess():
+    # Global is the process handle, pylint: disable=global-statement
+    global _helper_process
+
+    if _helper_process is not None:
+        # Closing its input makes it exit, after which we collect it.
+        try:
+            _helper_process.stdin.close()
+            _helper_process.wait()
+        except (OSError, IOError):
+            pass
+
+        _helper_process = None
+
+
+def _getHelperProcess():
+    # Global is the process handle, pylint: disable=global-statement
+    global _helper_process
+
+    if _helper_process is None:
+        # The process is supposed to stay, pylint: disable=consider-using-with
+        _helper_process = subprocess.Popen(
+            (sys.executable, "-c", _helper_code),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=getNullOutput(),
+            universal_newlines=True,
+        )
+
+        atexit.register(_stopHelperProcess)
+
+    return _helper_process
+
+
+def _queryHelperProcess(setup_code, value_expressions):
+    # Without "fork", queries cannot be isolated from one another in the
+    # helper, so they each need a fresh process.
+    if not hasattr(os, "fork"):
+        return False
+
+    process = _getHelperProcess()
+
+    try:
+        process.stdin.write(repr((setup_code, tuple(value_expressions))) + "\n")
+        process.stdin.flush()
+
+        reply = process.stdout.readline()
+    except (OSError, IOError):
+        reply = ""
+
+    if not reply:
+        # The helper died, e.g. a query crashed or exited it, start over with
+        # another one for the next query.
+        _stopHelperProcess()
+        return False
+
+    return ast.literal_eval(reply)
+
+
+def _queryFreshProcess(info_name, setup_code, value_expressions):
+    query_codes = []
+
+    for value_expression in value_expressions:
+        query_codes.append("print(repr(%s))" % value_expression)
+        query_codes.append('print("-" * 27)')
+
+    cmd = r"""\
+from __future__ import print_function
+from __future__ import absolute_import
+
+try:
+    %(setup_codes)s
+except ImportError:
+    import sys
+    sys.exit(%(import_error_exit_code)d)
+%(query_codes)s
+""" % {
+        "setup_codes": "\n    ".join(setup_code.split("\n")),
+        "import_error_exit_code": _import_error_exit_code,
+        "query_codes": "\n".join(query_codes),
+    }
+
+    try:
+        feedback = check_output([sys.executable, "-c", cmd])
+    except NuitkaCalledProcessError as e:
+        if e.returncode == _import_error_exit_code:
+            return None
+        raise
+
+    if str is not bytes:  # We want to work with strings, that's hopefully OK.
+        feedback = feedback.decode("utf8")
+
+    # Ignore Windows newlines difference.
+    feedback = [line.strip() for line in feedback.splitlines()]
+
+    if feedback.count("-" * 27) != len(value_expressions):
+        plugins_logger.sysexit(
+            "Error, mismatch in output retrieving %r information." % info_name
+        )
+
+    return [line for line in feedback if line != "-" * 27]
+
+
+def _getInstallationStamp():
+    # Using the function object to cache its result, avoiding global variable
+    # usage.
+    if not hasattr(_getInstallationStamp, "result"):
+        stamp = []
+
+        for path_element in sys.path:
+            if os.path.isdir(path_element):
+                stamp.append((path_element, os.path.getmtime(path_element)))
+
+        _getInstallationStamp.result = repr(stamp)
+
+    return _getInstallationStamp.result
+
+
+def _isRelevantEnvironmentVariable(key):
+    # Only these influence what gets imported, others change too often, e.g.
+    # per terminal session, the current directory is considered separately.
+    return key.startswith("PYTHON") or key == "PATH"
+
+
+def _getCacheFilename(setup_code, value_expressions):
+    hashed_value = repr(
+        (
+            sys.executable,
+            sys.version,
+            os.getcwd(),
+            sorted(
+                (key, value)
+                for key, value in os.environ.items()
+                if _isRelevantEnvironmentVariable(key)
+            ),
+            _getInstallationStamp(),
+            setup_code,
+            tuple(value_expressions),
+        )
+    )
+
+    if str is not bytes:
+        hashed_value = hashed_value.encode("utf8")
+
+    cache_dir = os.path.join(getCacheDir(), "runtime_information")
+
+    makePath(cache_dir)
+
+    return os.path.join(cache_dir, hashlib.md5(hashed_value).hexdigest())
+
+
+def queryRuntimeInformation(info_name, setup_codes, value_expressions):
+    """Get the "repr" of expression values in the compiled for Python.
+
+    Args:
+        info_name: name of the information, for use in error messages
+        setup_codes: lines of code to run first, typically imports
+        value_expressions: expressions to get the values of
+
+    Returns:
+        list of "repr" strings of the expression values or None, if the
+        setup code gave an "ImportError".
+    """
+
+    setup_code = "\n".join(setup_codes)
+    value_expressions = tuple(value_expressions)
+
+    cache_filename = _getCacheFilename(setup_code, value_expressions)
+
+    if os.path.exists(cache_filename):
+        return json.loads(getFileContents(cache_filename))
+
+    result = _queryHelperProcess(setup_code, value_expressions)
+
+    if result is False:
+        result = _queryFreshProcess(info_name, setup_code, value_expressions)
+
+    putFileContentsAtomic(cache_filename, json.dumps(result))
+
+    return result
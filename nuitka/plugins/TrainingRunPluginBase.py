@@ -0,0 +1,82 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Base class for plugins, that use records of training runs of the program.
+
+A training build injects code into the main module, that adds what it observes
+when run to a record file, which a later build then uses. Records of several
+runs accumulate in the same file.
+"""
+
+import json
+import os
+from abc import abstractmethod
+
+from nuitka import Options
+from nuitka.utils.FileOperations import getFileContents
+
+from .PluginBase import NuitkaPluginBase
+
+
+class NuitkaPluginTrainingRunBase(NuitkaPluginBase):
+    # For overload in the derived plugins, to name options and records in
+    # messages.
+    record_option_name = None
+    use_option_name = None
+    record_description = None
+
+    def __init__(self, record_filename, use_filename):
+        if bool(record_filename) == bool(use_filename):
+            self.sysexit(
+                "Error, need exactly one of '%s' or '%s'."
+                % (self.record_option_name, self.use_option_name)
+            )
+
+        # The training program runs from other directories than the build.
+        if record_filename:
+            self.record_filename = os.path.abspath(record_filename)
+        else:
+            self.record_filename = None
+
+        if use_filename:
+            try:
+                self.record = json.loads(getFileContents(use_filename))
+            except (IOError, OSError, ValueError) as e:
+                self.sysexit(
+                    "Error, cannot read %s %r: %s"
+                    % (self.record_description, use_filename, e)
+                )
+        else:
+            self.record = None
+
+    @classmethod
+    def isRelevant(cls):
+        return not Options.shallMakeModule()
+
+    @abstractmethod
+    def getRecordCode(self):
+        """Code recording a training run, with "%(filename)r" for the record file."""
+
+    def createPreModuleLoadCode(self, module):
+        if self.record_filename and module.getFullName() == "__main__":
+            return (
+                self.getRecordCode() % {"filename": self.record_filename},
+                "Recording %s to '%s'."
+                % (self.record_description, self.record_filename),
+            )
+
+        return None
@@ -0,0 +1,180 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Standard plug-in to exclude modules never imported in a recorded trace.
+
+Following imports statically includes everything a program might import,
+e.g. test suites and optional backends of packages, that are never used. A
+training build records the modules actually imported when run, and a build
+using that trace then does not follow imports to other modules.
+"""
+
+import os
+import time
+
+from nuitka import Options
+from nuitka.plugins.TrainingRunPluginBase import NuitkaPluginTrainingRunBase
+from nuitka.utils.FileOperations import getFileList
+
+# The meta path finder sees imports of modules not yet loaded, and modules
+# loaded otherwise, e.g. during startup, are found in "sys.modules" at exit.
+_record_code = r"""
+def _nuitka_import_trace():
+    import atexit, sys
+
+    module_names = set()
+
+    class NuitkaImportTraceFinder(object):
+        @staticmethod
+        def find_module(fullname, path=None):
+            module_names.add(fullname)
+
+        @staticmethod
+        def find_spec(fullname, path, target=None):
+            module_names.add(fullname)
+
+    def writeTrace():
+        module_names.update(
+            name for name, module in list(sys.modules.items()) if module is not None
+        )
+
+        import json
+
+        try:
+            with open(%(filename)r) as trace_file:
+                module_names.update(json.load(trace_file))
+        except (IOError, OSError, ValueError):
+            pass
+
+        with open(%(filename)r, "w") as trace_file:
+            json.dump(sorted(module_names), trace_file, indent=2)
+
+    atexit.register(writeTrace)
+    sys.meta_path.insert(0, NuitkaImportTraceFinder)
+
+_nuitka_import_trace()
+del _nuitka_import_trace
+"""
+
+
+def _getCodeSize(module_filename):
+    if module_filename is None or not os.path.exists(module_filename):
+        return 0
+    elif os.path.isdir(module_filename):
+        return sum(
+            os.path.getsize(filename)
+            for filename in getFileList(module_filename, only_suffixes=(".py",))
+        )
+    else:
+        return os.path.getsize(module_filename)
+
+
+class NuitkaPluginImportTrace(NuitkaPluginTrainingRunBase):
+    """This is to exclude the modules not imported in a training run.
+
+    Traces of multiple runs are merged in the same file. Modules explicitly
+    asked for on the command line are still included.
+    """
+
+    plugin_name = "import-trace"
+    plugin_desc = "Exclude modules never imported in a recorded trace"
+
+    record_option_name = "--import-trace-record"
+    use_option_name = "--import-trace-use"
+    record_description = "import trace"
+
+    def __init__(self, import_trace_record, import_trace_use):
+        NuitkaPluginTrainingRunBase.__init__(
+            self, record_filename=import_trace_record, use_filename=import_trace_use
+        )
+
+        if self.record is not None:
+            self.record = frozenset(self.record)
+
+        self.excluded_modules = {}
+
+        self.start_time = time.time()
+
+    @classmethod
+    def addPluginCommandLineOptions(cls, group):
+        group.add_option(
+            "--import-trace-record",
+            action="store",
+            dest="import_trace_record",
+            metavar="TRACE_FILE",
+            default=None,
+            help="""\
+Make a training build, that adds the names of all modules imported to the
+given trace file, when run. Default off.""",
+        )
+
+        group.add_option(
+            "--import-trace-use",
+            action="store",
+            dest="import_trace_use",
+            metavar="TRACE_FILE",
+            default=None,
+            help="""\
+Do not follow imports to modules not in the given trace file. Default off.""",
+        )
+
+    def getRecordCode(self):
+        return _record_code
+
+    def onModuleEncounter(self, module_filename, module_name, module_kind):
+        if self.record is None or module_name.asString() in self.record:
+            return None
+
+        for patterns in (
+            Options.getShallFollowModules(),
+            Options.getMustIncludeModules(),
+            Options.getMustIncludePackages(),
+        ):
+            if module_name.matchesToShellPatterns(patterns)[0]:
+                return None
+
+        self.excluded_modules[module_name] = module_filename
+
+        return False, "Module was never imported in the recorded import trace."
+
+    def onFinalResult(self, filename):
+        if self.record is None:
+            return
+
+        # Cyclic dependency
+        from nuitka import ModuleRegistry
+
+        excluded_size = sum(
+            _getCodeSize(module_filename)
+            for module_filename in self.excluded_modules.values()
+        )
+        included_size = sum(
+            _getCodeSize(module.getCompileTimeFilename())
+            for module in ModuleRegistry.getDoneModules()
+        )
+
+        # Compile time is assumed to be proportional to the code size.
+        saved_time = (
+            (time.time() - self.start_time)
+            * excluded_size
+            / float(max(included_size, 1))
+        )
+
+        self.info(
+            "Excluded %d modules with %d KB of code never imported, saving an estimated %.0f seconds."
+            % (len(self.excluded_modules), excluded_size // 1024, saved_time)
+        )
@@ -0,0 +1,212 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Standard plug-in to decide compiled vs. bytecode modules from a profile.
+
+Compiling every module to C takes long and makes large binaries, while most
+modules are only imported and hardly executed. A training build includes all
+modules as bytecode, and records for each module how often its functions are
+called, and how long the code of the module itself took when imported. A
+build using that profile then only compiles the hot modules, and includes the
+cold ones as bytecode.
+"""
+
+from nuitka.plugins.TrainingRunPluginBase import NuitkaPluginTrainingRunBase
+
+# The recording is done in the main thread only. Importing "threading" to
+# cover other threads, would happen before e.g. "gevent" gets to monkey
+# patch it. The import time of a module does not include that of modules it
+# imports, nor of the main module, which is started before this code runs.
+_record_code = r"""
+def _nuitka_module_profile():
+    import atexit, sys, time
+
+    calls = {}
+    imports = {}
+    import_times = {}
+
+    # Module code running, with start time and time spent in nested imports.
+    module_stack = []
+
+    def profiler(frame, event, arg):
+        if event == "call":
+            module_name = frame.f_globals.get("__name__")
+
+            if frame.f_code.co_name == "<module>":
+                imports[module_name] = imports.get(module_name, 0) + 1
+                module_stack.append([frame, time.time(), 0.0])
+            else:
+                calls[module_name] = calls.get(module_name, 0) + 1
+        elif event == "return" and module_stack and module_stack[-1][0] is frame:
+            _frame, start_time, nested_time = module_stack.pop()
+            module_time = time.time() - start_time
+
+            if module_stack:
+                module_stack[-1][2] += module_time
+
+            module_name = frame.f_globals.get("__name__")
+            import_times[module_name] = (
+                import_times.get(module_name, 0.0) + module_time - nested_time
+            )
+
+    def writeProfile():
+        sys.setprofile(None)
+
+        import json
+
+        try:
+            with open(%(filename)r) as profile_file:
+                profile = json.load(profile_file)
+        except (IOError, OSError, ValueError):
+            profile = {}
+
+        for module_name in set(calls) | set(imports):
+            if type(module_name) is str:
+                entry = profile.setdefault(module_name, {})
+
+                entry["calls"] = entry.get("calls", 0) + calls.get(module_name, 0)
+                entry["imports"] = entry.get("imports", 0) + imports.get(module_name, 0)
+                entry["import_time"] = entry.get("import_time", 0.0) + import_times.get(
+                    module_name, 0.0
+                )
+
+        with open(%(filename)r, "w") as profile_file:
+            json.dump(profile, profile_file, indent=2, sort_keys=True)
+
+    atexit.register(writeProfile)
+    sys.setprofile(profiler)
+
+_nuitka_module_profile()
+del _nuitka_module_profile
+"""
+
+
+class NuitkaPluginModuleProfile(NuitkaPluginTrainingRunBase):
+    """This is to compile only the modules hot in a profile of a training run.
+
+    Recording the profile makes all modules bytecode, such that Python can
+    report calls of their functions. Profiles of multiple runs are added up
+    in the same file.
+    """
+
+    plugin_name = "module-profile"
+    plugin_desc = "Compile only modules hot in a recorded profile"
+
+    record_option_name = "--module-profile-record"
+    use_option_name = "--module-profile-use"
+    record_description = "module profile"
+
+    def __init__(
+        self, module_profile_record, module_profile_use, min_calls, min_import_ms
+    ):
+        NuitkaPluginTrainingRunBase.__init__(
+            self, record_filename=module_profile_record, use_filename=module_profile_use
+        )
+
+        self.min_calls = min_calls
+        self.min_import_time = min_import_ms / 1000.0
+
+        self.hot_count = 0
+        self.cold_count = 0
+
+    @classmethod
+    def addPluginCommandLineOptions(cls, group):
+        group.add_option(
+            "--module-profile-record",
+            action="store",
+            dest="module_profile_record",
+            metavar="PROFILE_FILE",
+            default=None,
+            help="""\
+Make a training build, with all modules as bytecode, that adds how often
+functions of each module are called in the main thread, and how long its
+import took, to the given profile file, when run. Default off.""",
+        )
+
+        group.add_option(
+            "--module-profile-use",
+            action="store",
+            dest="module_profile_use",
+            metavar="PROFILE_FILE",
+            default=None,
+            help="""\
+Compile only modules hot in the given profile file, and include the others
+as bytecode. Default off.""",
+        )
+
+        group.add_option(
+            "--module-profile-min-calls",
+            action="store",
+            dest="min_calls",
+            type="int",
+            default=100,
+            help="""\
+Calls of functions of a module in the profile for it to be hot, and be
+compiled. Default is %default.""",
+        )
+
+        group.add_option(
+            "--module-profile-min-import-ms",
+            action="store",
+            dest="min_import_ms",
+            type="float",
+            default=10.0,
+            help="""\
+Milliseconds spent in the code of a module itself when imported, that make it
+hot, and be compiled, regardless of calls. Default is %default.""",
+        )
+
+    def getRecordCode(self):
+        return _record_code
+
+    def isHotModule(self, module_name):
+        entry = self.record.get(module_name.asString())
+
+        # Modules never imported in the training runs are not hot.
+        if entry is None:
+            return False
+
+        return (
+            entry.get("calls", 0) >= self.min_calls
+            or entry.get("import_time", 0.0) >= self.min_import_time
+        )
+
+    def decideCompilation(self, module_name, source_ref):
+        # The main module is not covered by the profile, and the compiled
+        # program needs to start somewhere.
+        if module_name == "__main__":
+            return None
+
+        if self.record is None:
+            return "bytecode"
+
+        if self.isHotModule(module_name):
+            self.hot_count += 1
+
+            # Other plugins may still demand bytecode.
+            return None
+        else:
+            self.cold_count += 1
+
+            return "bytecode"
+
+    def onFinalResult(self, filename):
+        if self.record is not None:
+            self.info(
+                "Compiled %d hot modules, included %d cold modules as bytecode."
+                % (self.hot_count, self.cold_count)
+            )
@@ -0,0 +1,81 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Standard plug-in to make "importlib.resources.files" find embedded data files.
+
+Python 3.9 does not ask the resource reader of a package loader for "files",
+but only looks at the package directory, where embedded data files do not
+exist. Newer Python versions use the "files" method of the reader, which the
+Nuitka loader provides.
+"""
+
+from nuitka import Options
+from nuitka.plugins.PluginBase import NuitkaPluginBase
+from nuitka.PythonVersions import python_version
+
+
+class NuitkaPluginResourcesFiles(NuitkaPluginBase):
+    """This is to make "importlib.resources.files" use the resource reader."""
+
+    plugin_name = "resources-files"
+
+    @classmethod
+    def isRelevant(cls):
+        return (
+            0x390 <= python_version < 0x3A0
+            and Options.isStandaloneMode()
+            and bool(Options.getShallEmbedDataFilePatterns())
+        )
+
+    @staticmethod
+    def isAlwaysEnabled():
+        return True
+
+    @staticmethod
+    def createPostModuleLoadCode(module):
+        full_name = module.getFullName()
+
+        # This is a private API, only patch the version known to need it, and
+        # only if it is still there.
+        if full_name == "importlib._common" and 0x390 <= python_version < 0x3A0:
+            code = """\
+import sys
+
+# Not yet an attribute of the "importlib" package.
+_common = sys.modules["importlib._common"]
+_from_package = getattr(_common, "from_package", None)
+
+if sys.version_info[:2] == (3, 9) and _from_package is not None:
+    def from_package(package):
+        spec = package.__spec__
+        get_resource_reader = getattr(spec.loader, "get_resource_reader", None)
+
+        if get_resource_reader is not None:
+            reader = get_resource_reader(spec.name)
+
+            if hasattr(reader, "files"):
+                return reader.files()
+
+        return _from_package(package)
+
+    _common.from_package = from_package
+"""
+            return (
+                code,
+                """\
+Monkey patching "importlib.resources" to find embedded data files.""",
+            )
@@ -483,7 +483,9 @@ if python_version < 0x300:
         "sorted", ("iterable", "cmp", "key", "reverse"), default_count=2
     )
 else:
-    builtin_sorted_spec = BuiltinParameterSpecNoKeywords(
+    # Actually "iterable" is positional only and the others are keyword only,
+    # which the extractor checks for before using this.
+    builtin_sorted_spec = BuiltinParameterSpec(
         "sorted", ("iterable", "key", "reverse"), default_count=2
     )
 
@@ -504,6 +506,24 @@ else:
         "enumerate", ("iterable", "start"), default_count=1
     )
 
+if python_version >= 0x300:
+    builtin_zip_spec = BuiltinParameterSpecNoKeywords(
+        "zip", (), default_count=0, list_star_arg="iterables"
+    )
+    builtin_map_spec = BuiltinParameterSpecNoKeywords(
+        "map", ("function",), default_count=0, list_star_arg="iterables"
+    )
+    builtin_filter_spec = BuiltinParameterSpecNoKeywords(
+        "filter", ("function", "iterable"), default_count=0
+    )
+
+builtin_min_spec = BuiltinParameterSpecNoKeywords(
+    "min", (), default_count=0, list_star_arg="args"
+)
+builtin_max_spec = BuiltinParameterSpecNoKeywords(
+    "max", (), default_count=0, list_star_arg="args"
+)
+
 
 class BuiltinRangeSpec(BuiltinParameterSpecNoKeywords):
     def isCompileTimeComputable(self, values):
@@ -19,9 +19,11 @@
 
 import binascii
 import ctypes
+import json
 import math
 import os
 import re
+import shutil
 import struct
 import sys
 
@@ -318,7 +320,26 @@ def _writeConstantStream(constants_reader):
 crc32 = 0
 
 
-def _writeConstantsBlob(output_filename, desc):
+def _writeEmbeddedDataFiles(output, embedded_data_files):
+    # Not covered by the CRC32, these can be large and need no check at program
+    # start. Sorted by name, so the binary can do a binary search for them.
+    embedded_data_files = sorted(
+        (name.encode("utf8"), source_path) for name, source_path in embedded_data_files
+    )
+
+    output.write(struct.pack("I", len(embedded_data_files)))
+
+    for name, source_path in embedded_data_files:
+        datacomposer_logger.info("Embedding data file %r." % source_path)
+
+        output.write(name + b"\0")
+        output.write(struct.pack("I", os.path.getsize(source_path)))
+
+        with open(source_path, "rb") as data_file:
+            shutil.copyfileobj(data_file, output)
+
+
+def _writeConstantsBlob(output_filename, desc, embedded_data_files):
     global crc32  # singleton, pylint: disable=global-statement
 
     with open(output_filename, "w+b") as output:
@@ -351,6 +372,10 @@ def _writeConstantsBlob(output_filename, desc):
         )
         datacomposer_logger.info("Total constants blob CRC32 is %d." % crc32)
 
+        output.seek(0, 2)
+
+        _writeEmbeddedDataFiles(output, embedded_data_files)
+
 
 def main():
     datacomposer_logger.is_quiet = (
@@ -362,6 +387,9 @@ def main():
     build_dir = sys.argv[1]
     output_filename = sys.argv[2]
 
+    with open(sys.argv[3]) as index_file:
+        embedded_data_files = json.load(index_file)
+
     const_files = scanConstFiles(build_dir)
 
     total = 0
@@ -396,6 +424,10 @@ def main():
 
     datacomposer_logger.info("Total amount of constants is %d." % total)
 
-    _writeConstantsBlob(output_filename=output_filename, desc=desc)
+    _writeConstantsBlob(
+        output_filename=output_filename,
+        desc=desc,
+        embedded_data_files=embedded_data_files,
+    )
 
     sys.exit(0)
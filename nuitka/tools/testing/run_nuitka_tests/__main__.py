@@ -64,6 +64,16 @@ The basic tests, execute these to check if Nuitka is healthy.
 Default is %default.""",
     )
 
+    parser.add_option(
+        "--skip-unit-tests",
+        action="store_false",
+        dest="unit_tests",
+        default=True,
+        help="""\
+The unit tests, execute these to check if Nuitka internals, e.g. caches, work
+fine. Default is %default.""",
+    )
+
     parser.add_option(
         "--skip-syntax-tests",
         action="store_false",
@@ -643,13 +653,13 @@ def main():
 
         yield flags
 
-    def executeSubTest(command, hide_output=False):
+    def executeSubTest(command, hide_output=False, python=None):
         with TimerReport(
             message="Overall execution of %r took %%.2f seconds" % command
         ):
-            _executeSubTest(command, hide_output)
+            _executeSubTest(command, hide_output, python)
 
-    def _executeSubTest(command, hide_output):
+    def _executeSubTest(command, hide_output, python):
         if options.coverage and "search" in command:
             command = command.replace("search", "coverage")
 
@@ -658,7 +668,7 @@ def main():
 
         # The running Python will be good enough, on some platforms there is no
         # "python", and we need to pass this alone then.
-        parts.insert(0, sys.executable)
+        parts.insert(0, python or sys.executable)
 
         my_print("Run '%s' in '%s'." % (" ".join(parts), os.getcwd()))
 
@@ -697,6 +707,11 @@ def main():
             with withExtendedExtraOptions(*getExtraFlags(where, "basics", flags)):
                 executeSubTest("./tests/basics/run_all.py search")
 
+        # These use Nuitka directly, so they must run with the Python tested.
+        if options.unit_tests:
+            my_print("Running the unit tests with '%s':" % use_python)
+            executeSubTest("./tests/unit/run_all.py", python=os.environ["PYTHON"])
+
         if options.syntax_tests:
             my_print(
                 "Running the syntax tests with options '%s' with '%s':"
@@ -164,6 +164,8 @@ from .ReformulationForLoopStatements import (
 from .ReformulationFunctionStatements import (
     buildAsyncFunctionNode,
     buildFunctionNode,
+    popModuleBindings,
+    pushModuleBindings,
 )
 from .ReformulationImportStatements import (
     buildImportFromNode,
@@ -752,6 +754,8 @@ def buildParseTree(provider, ast_tree, source_ref, is_module, is_main):
     if is_module:
         provider.setFutureSpec(getFutureSpec())
 
+    pushModuleBindings(ast_tree)
+
     body, doc = extractDocFromBody(ast_tree)
 
     if is_module and is_main and python_version >= 0x360:
@@ -925,6 +929,7 @@ def buildParseTree(provider, ast_tree, source_ref, is_module, is_main):
         )
 
         popFutureSpec()
+        popModuleBindings()
 
         return result
     else:
@@ -52,6 +52,31 @@ def getVariablesWrittenOrRead(node):
     return visitor.getResult()
 
 
+class VariableWriteExtractor(VisitorNoopMixin):
+    """Extract variables written to."""
+
+    def __init__(self):
+        self.written_to = OrderedSet()
+
+    def onEnterNode(self, node):
+        if (
+            node.isStatementAssignmentVariable()
+            or node.isStatementDelVariable()
+            or node.isStatementReleaseVariable()
+        ):
+            self.written_to.add(node.getVariable())
+
+    def getResult(self):
+        return self.written_to
+
+
+def getVariablesWritten(node):
+    visitor = VariableWriteExtractor()
+    visitTree(node, visitor)
+
+    return visitor.getResult()
+
+
 class VariableUsageUpdater(VisitorNoopMixin):
     def __init__(self, old_variable, new_variable):
         self.old_variable = old_variable
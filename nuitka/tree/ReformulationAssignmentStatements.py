@@ -123,6 +123,144 @@ def buildExtSliceNode(provider, node, source_ref):
     )
 
 
+def _buildUnpackingFromIterator(
+    provider, temp_scope, detail, source, element_vars, starred_index, source_ref
+):
+    source_iter_var = provider.allocateTempVariable(
+        temp_scope=temp_scope, name="source_iter"
+    )
+
+    starred_list_var = None
+
+    statements = []
+
+    for element_index, element in enumerate(detail):
+        element_var = element_vars[element_index]
+
+        if starred_list_var is not None:
+            statements.insert(
+                starred_index + 1,
+                StatementAssignmentVariable(
+                    variable=element_var,
+                    source=ExpressionListOperationPop(
+                        list_arg=ExpressionTempVariableRef(
+                            variable=starred_list_var, source_ref=source_ref
+                        ),
+                        source_ref=source_ref,
+                    ),
+                    source_ref=source_ref,
+                ),
+            )
+        elif element[0] != "Starred":
+            statements.append(
+                StatementAssignmentVariable(
+                    variable=element_var,
+                    source=ExpressionSpecialUnpack(
+                        value=ExpressionTempVariableRef(
+                            variable=source_iter_var, source_ref=source_ref
+                        ),
+                        count=element_index + 1,
+                        expected=starred_index or len(detail),
+                        starred=starred_index is not None,
+                        source_ref=source_ref,
+                    ),
+                    source_ref=source_ref,
+                )
+            )
+        else:
+            assert starred_index == element_index
+            starred_list_var = element_var
+
+            statements.append(
+                StatementAssignmentVariable(
+                    variable=element_var,
+                    source=ExpressionBuiltinList(
+                        value=ExpressionTempVariableRef(
+                            variable=source_iter_var, source_ref=source_ref
+                        ),
+                        source_ref=source_ref,
+                    ),
+                    source_ref=source_ref,
+                )
+            )
+
+    if starred_list_var is None:
+        statements.append(
+            StatementSpecialUnpackCheck(
+                iterator=ExpressionTempVariableRef(
+                    variable=source_iter_var, source_ref=source_ref
+                ),
+                count=len(detail),
+                source_ref=source_ref,
+            )
+        )
+    else:
+        statements.insert(
+            starred_index + 1,
+            makeStatementConditional(
+                condition=makeComparisonExpression(
+                    comparator="Lt",
+                    left=ExpressionBuiltinLen(
+                        value=ExpressionTempVariableRef(
+                            variable=starred_list_var, source_ref=source_ref
+                        ),
+                        source_ref=source_ref,
+                    ),
+                    right=makeConstantRefNode(
+                        constant=len(statements) - starred_index - 1,
+                        source_ref=source_ref,
+                    ),
+                    source_ref=source_ref,
+                ),
+                yes_branch=makeRaiseExceptionExpressionFromTemplate(
+                    exception_type="ValueError",
+                    template="""\
+not enough values to unpack (expected at least %d, got %%d)"""
+                    % (len(statements) - 1),
+                    template_args=makeBinaryOperationNode(
+                        operator="Add",
+                        left=ExpressionBuiltinLen(
+                            value=ExpressionTempVariableRef(
+                                variable=starred_list_var, source_ref=source_ref
+                            ),
+                            source_ref=source_ref,
+                        ),
+                        right=makeConstantRefNode(
+                            constant=starred_index, source_ref=source_ref
+                        ),
+                        source_ref=source_ref,
+                    ),
+                    source_ref=source_ref,
+                ).asStatement(),
+                no_branch=None,
+                source_ref=source_ref,
+            ),
+        )
+
+    if python_version >= 0x370:
+        iter_creation_class = ExpressionBuiltinIterForUnpack
+    else:
+        iter_creation_class = ExpressionBuiltinIter1
+
+    return [
+        StatementAssignmentVariable(
+            variable=source_iter_var,
+            source=iter_creation_class(value=source, source_ref=source_ref),
+            source_ref=source_ref,
+        ),
+        makeTryFinallyStatement(
+            provider=provider,
+            tried=statements,
+            final=(
+                StatementReleaseVariable(
+                    variable=source_iter_var, source_ref=source_ref
+                ),
+            ),
+            source_ref=source_ref,
+        ),
+    ]
+
+
 def buildAssignmentStatementsFromDecoded(provider, kind, detail, source, source_ref):
     # This is using many variable names on purpose, so as to give names to the
     # unpacked detail values, and has many branches due to the many cases
@@ -182,10 +320,6 @@ def buildAssignmentStatementsFromDecoded(provider, kind, detail, source, source_
     elif kind == "Tuple":
         temp_scope = provider.allocateTempScope("tuple_unpack")
 
-        source_iter_var = provider.allocateTempVariable(
-            temp_scope=temp_scope, name="source_iter"
-        )
-
         element_vars = [
             provider.allocateTempVariable(
                 temp_scope=temp_scope, name="element_%d" % (element_index + 1)
@@ -193,11 +327,8 @@ def buildAssignmentStatementsFromDecoded(provider, kind, detail, source, source_
             for element_index in range(len(detail))
         ]
 
-        starred_list_var = None
         starred_index = None
 
-        statements = []
-
         for element_index, element in enumerate(detail):
             if element[0] == "Starred":
                 if starred_index is not None:
@@ -210,131 +341,30 @@ def buildAssignmentStatementsFromDecoded(provider, kind, detail, source, source_
 
                 starred_index = element_index
 
-        for element_index, element in enumerate(detail):
-            element_var = element_vars[element_index]
-
-            if starred_list_var is not None:
-                statements.insert(
-                    starred_index + 1,
-                    StatementAssignmentVariable(
-                        variable=element_var,
-                        source=ExpressionListOperationPop(
-                            list_arg=ExpressionTempVariableRef(
-                                variable=starred_list_var, source_ref=source_ref
-                            ),
-                            source_ref=source_ref,
-                        ),
-                        source_ref=source_ref,
-                    ),
-                )
-            elif element[0] != "Starred":
-                statements.append(
-                    StatementAssignmentVariable(
-                        variable=element_var,
-                        source=ExpressionSpecialUnpack(
-                            value=ExpressionTempVariableRef(
-                                variable=source_iter_var, source_ref=source_ref
-                            ),
-                            count=element_index + 1,
-                            expected=starred_index or len(detail),
-                            starred=starred_index is not None,
-                            source_ref=source_ref,
-                        ),
-                        source_ref=source_ref,
-                    )
-                )
-            else:
-                assert starred_index == element_index
-                starred_list_var = element_var
-
-                statements.append(
-                    StatementAssignmentVariable(
-                        variable=element_var,
-                        source=ExpressionBuiltinList(
-                            value=ExpressionTempVariableRef(
-                                variable=source_iter_var, source_ref=source_ref
-                            ),
-                            source_ref=source_ref,
-                        ),
-                        source_ref=source_ref,
-                    )
-                )
-
-        if starred_list_var is None:
-            statements.append(
-                StatementSpecialUnpackCheck(
-                    iterator=ExpressionTempVariableRef(
-                        variable=source_iter_var, source_ref=source_ref
-                    ),
-                    count=len(detail),
-                    source_ref=source_ref,
+        if (
+            starred_index is None
+            and (source.isExpressionMakeTuple() or source.isExpressionMakeList())
+            and len(source.subnode_elements) == len(detail)
+        ):
+            # Sequence made only to be unpacked, e.g. "a, b = b, a", there is
+            # no need to create it and iterate over it, the values are the
+            # elements.
+            statements = [
+                StatementAssignmentVariable(
+                    variable=element_var, source=element, source_ref=source_ref
                 )
-            )
+                for element_var, element in zip(element_vars, source.subnode_elements)
+            ]
         else:
-            statements.insert(
-                starred_index + 1,
-                makeStatementConditional(
-                    condition=makeComparisonExpression(
-                        comparator="Lt",
-                        left=ExpressionBuiltinLen(
-                            value=ExpressionTempVariableRef(
-                                variable=starred_list_var, source_ref=source_ref
-                            ),
-                            source_ref=source_ref,
-                        ),
-                        right=makeConstantRefNode(
-                            constant=len(statements) - starred_index - 1,
-                            source_ref=source_ref,
-                        ),
-                        source_ref=source_ref,
-                    ),
-                    yes_branch=makeRaiseExceptionExpressionFromTemplate(
-                        exception_type="ValueError",
-                        template="""\
-not enough values to unpack (expected at least %d, got %%d)"""
-                        % (len(statements) - 1),
-                        template_args=makeBinaryOperationNode(
-                            operator="Add",
-                            left=ExpressionBuiltinLen(
-                                value=ExpressionTempVariableRef(
-                                    variable=starred_list_var, source_ref=source_ref
-                                ),
-                                source_ref=source_ref,
-                            ),
-                            right=makeConstantRefNode(
-                                constant=starred_index, source_ref=source_ref
-                            ),
-                            source_ref=source_ref,
-                        ),
-                        source_ref=source_ref,
-                    ).asStatement(),
-                    no_branch=None,
-                    source_ref=source_ref,
-                ),
-            )
-
-        if python_version >= 0x370:
-            iter_creation_class = ExpressionBuiltinIterForUnpack
-        else:
-            iter_creation_class = ExpressionBuiltinIter1
-
-        statements = [
-            StatementAssignmentVariable(
-                variable=source_iter_var,
-                source=iter_creation_class(value=source, source_ref=source_ref),
-                source_ref=source_ref,
-            ),
-            makeTryFinallyStatement(
+            statements = _buildUnpackingFromIterator(
                 provider=provider,
-                tried=statements,
-                final=(
-                    StatementReleaseVariable(
-                        variable=source_iter_var, source_ref=source_ref
-                    ),
-                ),
+                temp_scope=temp_scope,
+                detail=detail,
+                source=source,
+                element_vars=element_vars,
+                starred_index=starred_index,
                 source_ref=source_ref,
-            ),
-        ]
+            )
 
         # When all is done, copy over to the actual assignment targets, starred
         # or not makes no difference here anymore.
@@ -22,6 +22,8 @@ source code comments with developer manual sections.
 
 """
 
+import ast
+
 from nuitka.nodes.AssignNodes import (
     StatementAssignmentVariable,
     StatementReleaseVariable,
@@ -139,6 +141,17 @@ def _buildForLoopNode(provider, node, sync, source_ref):
         ),
     )
 
+    # For unpacking targets, release the value right away, so that iterators
+    # like "enumerate", "zip" or "dict.items" that re-use their result tuple
+    # when only they hold a reference, can do so on the next iteration rather
+    # than allocating a new tuple each time.
+    if type(node.target) in (ast.Tuple, ast.List):
+        statements += (
+            StatementReleaseVariable(
+                variable=tmp_value_variable, source_ref=source_ref
+            ),
+        )
+
     pushBuildContext("loop_body")
     statements += (
         buildStatementsNode(provider=provider, nodes=node.body, source_ref=source_ref),
@@ -22,6 +22,8 @@ source code comments with developer manual sections.
 
 """
 
+import ast
+
 from nuitka.nodes.AssignNodes import (
     StatementAssignmentVariable,
     StatementAssignmentVariableName,
@@ -38,6 +40,8 @@ from nuitka.nodes.BuiltinIteratorNodes import (
 from nuitka.nodes.BuiltinNextNodes import ExpressionSpecialUnpack
 from nuitka.nodes.BuiltinRefNodes import makeExpressionBuiltinTypeRef
 from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
+from nuitka.nodes.ComparisonNodes import makeComparisonExpression
+from nuitka.nodes.ConditionalNodes import makeStatementConditional
 from nuitka.nodes.CoroutineNodes import (
     ExpressionCoroutineObjectBody,
     ExpressionMakeCoroutineObject,
@@ -46,6 +50,7 @@ from nuitka.nodes.FunctionNodes import (
     ExpressionFunctionBody,
     ExpressionFunctionCreation,
     ExpressionFunctionRef,
+    ExpressionParameterTypeExact,
 )
 from nuitka.nodes.GeneratorNodes import (
     ExpressionGeneratorObjectBody,
@@ -55,16 +60,33 @@ from nuitka.nodes.GeneratorNodes import (
 from nuitka.nodes.LocalsDictNodes import StatementSetLocalsDictionary
 from nuitka.nodes.OutlineNodes import ExpressionOutlineFunction
 from nuitka.nodes.ReturnNodes import StatementReturn, StatementReturnNone
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    tshape_bool,
+    tshape_bytearray,
+    tshape_bytes,
+    tshape_dict,
+    tshape_frozenset,
+    tshape_int,
+    tshape_list,
+    tshape_set,
+    tshape_str,
+    tshape_tuple,
+)
+from nuitka.nodes.TypeNodes import ExpressionBuiltinType1
 from nuitka.nodes.VariableRefNodes import (
     ExpressionTempVariableRef,
     ExpressionVariableNameRef,
     ExpressionVariableRef,
 )
-from nuitka.Options import hasPythonFlagNoAnnotations
+from nuitka.Options import (
+    hasPythonFlagNoAnnotations,
+    shallTrustTypeAnnotations,
+)
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.specs.ParameterSpecs import ParameterSpec
 
+from .ReformulationBooleanExpressions import makeAndNode
 from .ReformulationTryFinallyStatements import makeTryFinallyStatement
 from .SyntaxErrors import raiseSyntaxError
 from .TreeHelpers import (
@@ -78,6 +100,7 @@ from .TreeHelpers import (
     makeCallNode,
     makeDictCreationOrConstant2,
     makeStatementsSequenceFromStatement,
+    makeStatementsSequenceFromStatements,
     mangleName,
 )
 
@@ -130,6 +153,296 @@ def _injectDecorator(decorators, inject, acceptable, source_ref):
         )
 
 
+# Built-in types, annotations of parameters are trusted for. Not "float" and
+# "complex", as "int" values are allowed for these too.
+_trusted_annotation_shapes = {
+    "bool": tshape_bool,
+    "bytearray": tshape_bytearray,
+    "bytes": tshape_bytes,
+    "dict": tshape_dict,
+    "frozenset": tshape_frozenset,
+    "int": tshape_int,
+    "list": tshape_list,
+    "set": tshape_set,
+    "str": tshape_str,
+    "tuple": tshape_tuple,
+}
+
+# Aliases from "typing" module for these.
+_trusted_annotation_aliases = {
+    "Dict": "dict",
+    "FrozenSet": "frozenset",
+    "List": "list",
+    "Set": "set",
+    "Tuple": "tuple",
+}
+
+# Function bodies are copied for trusted annotations only up to this number of
+# AST nodes, so larger functions don't double in code size.
+_max_specialized_body_size = 150
+
+# Names bound in the modules currently being built, with where their values
+# come from, to know what names used in annotations refer to.
+_module_bindings = []
+
+
+def _getModuleBindings(module_node):
+    """Names bound anywhere in the module, with what they are bound to.
+
+    Imports give the imported module name and the name from it, everything
+    else gives "None". The second value indicates a star import, which may
+    bind any name.
+    """
+
+    result = {}
+    star_import = False
+
+    def addBinding(name, origin):
+        result.setdefault(name, set()).add(origin)
+
+    for node in ast.walk(module_node):
+        kind = getKind(node)
+
+        if kind == "Name":
+            if getKind(node.ctx) != "Load":
+                addBinding(node.id, None)
+        elif kind in ("FunctionDef", "AsyncFunctionDef", "ClassDef"):
+            addBinding(node.name, None)
+        elif kind == "arg":
+            addBinding(node.arg, None)
+        elif kind in ("ExceptHandler", "MatchAs", "MatchStar"):
+            if node.name is not None:
+                addBinding(node.name, None)
+        elif kind == "MatchMapping":
+            if node.rest is not None:
+                addBinding(node.rest, None)
+        elif kind == "Import":
+            for alias in node.names:
+                if alias.asname is None:
+                    top_name = alias.name.split(".")[0]
+                    addBinding(top_name, (top_name, None))
+                else:
+                    addBinding(alias.asname, (alias.name, None))
+        elif kind == "ImportFrom":
+            for alias in node.names:
+                if alias.name == "*":
+                    star_import = True
+                elif node.level == 0:
+                    addBinding(alias.asname or alias.name, (node.module, alias.name))
+                else:
+                    addBinding(alias.asname or alias.name, None)
+
+    return result, star_import
+
+
+def pushModuleBindings(module_node):
+    if python_version >= 0x300 and shallTrustTypeAnnotations():
+        _module_bindings.append(_getModuleBindings(module_node))
+    else:
+        _module_bindings.append(None)
+
+
+def popModuleBindings():
+    del _module_bindings[-1]
+
+
+def _getTrustedAnnotationTypeName(annotation):
+    # Many cases for annotations, pylint: disable=too-many-return-statements
+
+    if not _module_bindings or _module_bindings[-1] is None:
+        return None
+
+    bindings, star_import = _module_bindings[-1]
+
+    # Any name might be bound by star imports.
+    if star_import:
+        return None
+
+    kind = getKind(annotation)
+
+    # String annotations, e.g. forward references.
+    if kind in ("Str", "Constant"):
+        value = annotation.s if kind == "Str" else annotation.value
+
+        if type(value) is not str:
+            return None
+
+        try:
+            annotation = ast.parse(value.strip(), mode="eval").body
+        except SyntaxError:
+            return None
+
+        kind = getKind(annotation)
+
+    # Only the container type is used from generic types, e.g. "list[int]".
+    if kind == "Subscript":
+        annotation = annotation.value
+        kind = getKind(annotation)
+
+    if kind == "Name":
+        origins = bindings.get(annotation.id)
+
+        # Built-in names, unless the module binds them to something else.
+        if origins is None:
+            return (
+                annotation.id if annotation.id in _trusted_annotation_shapes else None
+            )
+
+        # Names imported from "typing", e.g. "from typing import List".
+        if len(origins) != 1:
+            return None
+
+        origin = next(iter(origins))
+
+        if origin is None or origin[0] != "typing":
+            return None
+
+        return _trusted_annotation_aliases.get(origin[1])
+    elif kind == "Attribute" and getKind(annotation.value) == "Name":
+        # Names from the "typing" module, e.g. "typing.List" after only
+        # "import typing" was done.
+        if bindings.get(annotation.value.id) != set([("typing", None)]):
+            return None
+
+        return _trusted_annotation_aliases.get(annotation.attr)
+    else:
+        return None
+
+
+def _buildParameterTypeChecks(provider, function_body, node, source_ref):
+    """Trust annotations of parameters with built-in types, if asked to.
+
+    Returns conditions that check the exact types of the parameters, and
+    assignments that give the parameters these types for use after the
+    conditions were found true.
+    """
+
+    if python_version < 0x300 or not shallTrustTypeAnnotations():
+        return (), ()
+
+    args = node.args
+
+    parameter_variables = dict(
+        (variable.getName(), variable)
+        for variable in function_body.getParameters().getTopLevelVariables()
+    )
+
+    conditions = []
+    assignments = []
+
+    for arg in (
+        list(getattr(args, "posonlyargs", ())) + list(args.args) + list(args.kwonlyargs)
+    ):
+        if arg.annotation is None:
+            continue
+
+        type_name = _getTrustedAnnotationTypeName(arg.annotation)
+
+        if type_name is None:
+            continue
+
+        # The check uses the built-in type, not the name, so the type is
+        # correct regardless of what the annotation really referred to.
+        variable = parameter_variables[mangleName(arg.arg, provider)]
+
+        conditions.append(
+            makeComparisonExpression(
+                left=ExpressionBuiltinType1(
+                    value=ExpressionVariableRef(
+                        variable=variable, source_ref=source_ref
+                    ),
+                    source_ref=source_ref,
+                ),
+                right=makeExpressionBuiltinTypeRef(
+                    builtin_name=type_name, source_ref=source_ref
+                ),
+                comparator="Is",
+                source_ref=source_ref,
+            )
+        )
+
+        assignments.append(
+            StatementAssignmentVariable(
+                variable=variable,
+                source=ExpressionParameterTypeExact(
+                    value=ExpressionVariableRef(
+                        variable=variable, source_ref=source_ref
+                    ),
+                    type_shape=_trusted_annotation_shapes[type_name],
+                    source_ref=source_ref,
+                ),
+                source_ref=source_ref,
+            )
+        )
+
+    return conditions, assignments
+
+
+def _insertParameterTypeSpecialization(
+    function_body, node, function_statement_nodes, function_statements_body, source_ref
+):
+    """Use a copy of the function body specialized to annotated types.
+
+    If the parameters have exactly the types their trusted annotations name,
+    the copy is used, in which they have these types, otherwise the original
+    function body, so e.g. instances of sub-classes still work. This is only
+    done for small function bodies.
+    """
+
+    if not function_statements_body.isStatementsFrame():
+        return function_statements_body
+
+    body_size = sum(
+        len(tuple(ast.walk(statement_node)))
+        for statement_node in function_statement_nodes
+    )
+
+    if body_size > _max_specialized_body_size:
+        return function_statements_body
+
+    conditions, assignments = _buildParameterTypeChecks(
+        provider=function_body.getParentVariableProvider(),
+        function_body=function_body,
+        node=node,
+        source_ref=source_ref,
+    )
+
+    if not conditions:
+        return function_statements_body
+
+    # Built once more, rather than cloned, so functions and classes defined
+    # in the body are separate ones for the copy.
+    specialized_statements = _insertFinalReturnStatement(
+        function_statements_body=makeStatementsSequenceFromStatements(
+            *(
+                assignments
+                + buildNodeList(
+                    provider=function_body,
+                    nodes=function_statement_nodes,
+                    source_ref=source_ref,
+                )
+            )
+        ),
+        return_statement=StatementReturnNone(source_ref=source_ref),
+    )
+
+    function_statements_body.setChild(
+        "statements",
+        (
+            makeStatementConditional(
+                condition=makeAndNode(values=conditions, source_ref=source_ref),
+                yes_branch=specialized_statements,
+                no_branch=makeStatementsSequenceFromStatements(
+                    *function_statements_body.subnode_statements
+                ),
+                source_ref=source_ref,
+            ),
+        ),
+    )
+
+    return function_statements_body
+
+
 def buildFunctionNode(provider, node, source_ref):
     # Functions have way too many details, pylint: disable=too-many-locals
 
@@ -224,6 +537,15 @@ def buildFunctionNode(provider, node, source_ref):
             function_body=code_body, function_statements_body=function_statements_body
         )
 
+    if function_kind == "Function":
+        function_statements_body = _insertParameterTypeSpecialization(
+            function_body=function_body,
+            node=node,
+            function_statement_nodes=function_statement_nodes,
+            function_statements_body=function_statements_body,
+            source_ref=source_ref,
+        )
+
     if function_statements_body.isStatementsFrame():
         function_statements_body = makeStatementsSequenceFromStatement(
             statement=function_statements_body
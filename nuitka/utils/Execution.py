@@ -253,6 +253,31 @@ def withEnvironmentPathAdded(env_var_name, *paths):
             os.environ[env_var_name] = old_path
 
 
+def getEnvironmentWithPathAdded(env_var_name, *paths):
+    """Get a copy of the environment, with paths added to a variable.
+
+    Unlike "withEnvironmentPathAdded" this does not modify the environment
+    of the process, so it is usable when running processes from threads.
+    """
+    assert os.path.sep not in env_var_name
+
+    env = dict(os.environ)
+
+    paths = [path for path in paths if path]
+    path = os.pathsep.join(paths)
+
+    if path:
+        if str is not bytes and type(path) is bytes:
+            path = path.decode("utf8")
+
+        if env_var_name in env:
+            env[env_var_name] += os.pathsep + path
+        else:
+            env[env_var_name] = path
+
+    return env
+
+
 @contextmanager
 def withEnvironmentVarOverriden(env_var_name, value):
     """Change an environment and restore it after context."""
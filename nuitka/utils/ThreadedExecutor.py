@@ -23,9 +23,10 @@ stub that does not thread at all.
 
 from threading import RLock, current_thread
 
-# Set this to false, to enable actual use of threads. This was found no longer
-# useful with dependency walker, but might be true in other cases.
-_use_threaded_executor = False
+# Set this to false, to disable actual use of threads, e.g. for debugging. The
+# work done in threads is mostly running external tools and file operations,
+# which do not hold the GIL.
+_use_threaded_executor = True
 
 
 class NonThreadedPoolExecutor(object):
@@ -50,6 +51,8 @@ class NonThreadedPoolExecutor(object):
 def waitWorkers(workers):
     if workers:
         return iter(workers[0].results)
+    else:
+        return iter(())
 
 
 ThreadPoolExecutor = NonThreadedPoolExecutor
@@ -60,7 +63,6 @@ if _use_threaded_executor:
         from concurrent.futures import (  # pylint: disable=I0021,import-error,no-name-in-module,unused-import
             FIRST_EXCEPTION,
             ThreadPoolExecutor,
-            as_completed,
             wait,
         )
 
@@ -68,7 +70,9 @@ if _use_threaded_executor:
         def waitWorkers(workers):
             wait(workers, return_when=FIRST_EXCEPTION)
 
-            for future in as_completed(workers):
+            # Results in order of submission, so that users get deterministic
+            # results, no matter which worker finished first.
+            for future in workers:
                 yield future.result()
 
     except ImportError:
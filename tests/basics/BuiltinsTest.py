@@ -682,3 +682,52 @@ print(all("Nuitka rocks!"))
 print(all("string"))
 print(all(u"unicode"))
 print(all(b"bytes"))
+
+print("Tests for enumerate(), zip(), map() and filter():")
+some_list = [5, 3, 8]
+for count, item in enumerate(some_list):
+    print(count, item)
+for count, item in enumerate(some_list, 10):
+    print(count, item)
+for count, item in enumerate(some_list, start=-1):
+    print(count, item)
+for left, right in zip(some_list, "abc"):
+    print(left, right)
+print(list(zip()))
+print(list(map(str, some_list)))
+print(list(map(lambda a, b: a * b, some_list, some_list)))
+print(list(filter(None, [0, 1, None, 2])))
+print(list(filter(lambda x: x > 4, some_list)))
+try:
+    print(enumerate(1))
+except Exception as e:
+    print("caught ", repr(e))
+
+print("Tests for sorted():")
+print(sorted(some_list))
+print(sorted(some_list, reverse=True))
+print(sorted(some_list, key=lambda x: -x))
+print(sorted("Nuitka"))
+try:
+    print(sorted(1))
+except Exception as e:
+    print("caught ", repr(e))
+
+print("Tests for min() and max():")
+print(min(some_list), max(some_list))
+print(min(some_list[0], some_list[1]), max(some_list[0], some_list[1]))
+print(min(*some_list), max(*some_list))
+print(min(some_list, key=lambda x: -x), max(some_list, key=lambda x: -x))
+print(min(1, 1.0), max(1.0, 1))
+try:
+    print(min([]))
+except Exception as e:
+    print("caught ", repr(e))
+try:
+    print(max(some_list[0]))
+except Exception as e:
+    print("caught ", repr(e))
+try:
+    print(min(some_list[0], "a"))
+except Exception as e:
+    print("caught ", repr(e))
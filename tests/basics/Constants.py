@@ -171,3 +171,30 @@ min_signed_long = long(-(2 ** (8 * 8 - 1) - 1) - 1)
 print("Small long", min_signed_long, type(min_signed_long))
 min_signed_long = long(-(2 ** (8 * 4 - 1) - 1) - 1)
 print("Small long", min_signed_long, type(min_signed_long))
+
+
+def nestedMutableConstantChanger():
+    a = [[1, 2], {"x": [3], "y": {}}, ([4],), {5}]
+    a[0].append(6)
+    a[1]["x"].append(7)
+    a[1]["y"][8] = 9
+    a[2][0].append(10)
+    a[3].add(11)
+    print("Nested mutable constant changed to value:")
+    print(a[:3], sorted(a[3]))
+
+    # These only look at the constant, it may be shared.
+    for i in range(2):
+        print(
+            "Read only uses of mutable constants:",
+            i in [0, 2],
+            {"a": i}.get("a"),
+            [5, 6][i],
+            sorted([3, 1, i]),
+            max([4, i]),
+        )
+
+
+nestedMutableConstantChanger()
+print("Redo nested constant changes, to catch corruptions:")
+nestedMutableConstantChanger()
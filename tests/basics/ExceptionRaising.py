@@ -651,3 +651,44 @@ def checkRaiseExceptionDictBuildingList(arg):
 
 print("Check if list as dict key raises:")
 checkRaiseExceptionDictBuildingList(4)
+
+
+def checkExceptionHandlersWithoutUse(d, key):
+    try:
+        value = d[key]
+    except KeyError:
+        value = None
+
+    try:
+        d[key]
+    except (IndexError, KeyError):
+        pass
+
+    try:
+        d[key]
+    except TypeError:
+        value = 1
+    except KeyError:
+        print("Handler without exception use, current exception", sys.exc_info()[0])
+
+    try:
+        try:
+            d[key]
+        except KeyError:
+            raise
+    except KeyError as e:
+        print("Re-raised from handler without exception use", repr(e))
+
+    try:
+        try:
+            d[key]
+        except KeyError:
+            raise ValueError
+    except ValueError as e:
+        print("Raised from handler with context", repr(getattr(e, "__context__", None)))
+
+    return value
+
+
+print("Check handlers that do not use the exception:")
+print(checkExceptionHandlersWithoutUse({}, 1), sys.exc_info())
@@ -0,0 +1,203 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Frames of functions seen by code run from operations on their values.
+
+Functions not calling anything may create their frame only when an exception
+passes through them. Hashing and comparing values run code too, which must
+find the frame of the function doing it, and so do built-ins that use special
+methods of their arguments.
+"""
+
+from __future__ import print_function
+
+import sys
+
+
+class Observer(object):
+    def __hash__(self):
+        print("Hashed in", sys._getframe(1).f_code.co_name)
+
+        return hash(1)
+
+    def __eq__(self, other):
+        print("Compared in", sys._getframe(1).f_code.co_name)
+
+        return other == 1
+
+
+def constantTupleIn(x):
+    return x in (1, 2, 3)
+
+
+def constantTupleNotIn(x):
+    return x not in (1, 2, 3)
+
+
+def constantSetIn(x):
+    return x in {1, 2, 3}
+
+
+def dictItem(x):
+    d = {1: "one"}
+
+    return d[x]
+
+
+def dictGet(x):
+    d = {1: "one"}
+
+    return d.get(x)
+
+
+def dictGetDefault(x):
+    d = {1: "one"}
+
+    return d.get(x, "none")
+
+
+def dictIn(x):
+    d = {1: "one"}
+
+    return x in d
+
+
+def dictNotIn(x):
+    d = {1: "one"}
+
+    return x not in d
+
+
+for func in (
+    constantTupleIn,
+    constantTupleNotIn,
+    constantSetIn,
+    dictItem,
+    dictGet,
+    dictGetDefault,
+    dictIn,
+    dictNotIn,
+):
+    print(func.__name__, "gives", func(Observer()))
+
+
+class ObserverMeta(type):
+    def __instancecheck__(cls, instance):
+        print("Instance checked in", sys._getframe(1).f_code.co_name)
+
+        return True
+
+    def __subclasscheck__(cls, subclass):
+        print("Subclass checked in", sys._getframe(1).f_code.co_name)
+
+        return True
+
+
+Checker = ObserverMeta("Checker", (object,), {})
+
+
+class Special(object):
+    def __hash__(self):
+        print("Hashed in", sys._getframe(1).f_code.co_name)
+
+        return 1
+
+    def __index__(self):
+        print("Indexed in", sys._getframe(1).f_code.co_name)
+
+        return 65
+
+    # Python2 "chr" converts with this.
+    __int__ = __index__
+
+    def __iter__(self):
+        print("Iterated in", sys._getframe(1).f_code.co_name)
+
+        return iter((1, 2))
+
+    def __getattr__(self, attribute_name):
+        print("Attribute", attribute_name, "in", sys._getframe(1).f_code.co_name)
+
+        return 1
+
+    def __setattr__(self, attribute_name, value):
+        print("Set", attribute_name, "in", sys._getframe(1).f_code.co_name)
+
+
+def builtinHash(x):
+    return hash(x)
+
+
+def builtinIsinstance(x):
+    return isinstance(x, Checker)
+
+
+def builtinIssubclass(x):
+    return issubclass(type(x), Checker)
+
+
+def builtinGetattr(x):
+    return getattr(x, "some")
+
+
+def builtinHasattr(x):
+    return hasattr(x, "some")
+
+
+def builtinSetattr(x):
+    setattr(x, "some", 1)
+
+
+def builtinChr(x):
+    return chr(x)
+
+
+def builtinRange(x):
+    return range(x)[-1]
+
+
+def builtinTuple(x):
+    return tuple(x)
+
+
+def builtinList(x):
+    return list(x)
+
+
+def builtinSet(x):
+    return set(x)
+
+
+def builtinSum(x):
+    return sum(x)
+
+
+for func in (
+    builtinHash,
+    builtinIsinstance,
+    builtinIssubclass,
+    builtinGetattr,
+    builtinHasattr,
+    builtinSetattr,
+    builtinChr,
+    builtinRange,
+    builtinTuple,
+    builtinList,
+    builtinSet,
+    builtinSum,
+):
+    print(func.__name__, "gives", func(Special()))
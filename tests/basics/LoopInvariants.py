@@ -0,0 +1,111 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Loops with operations on values they do not change.
+
+Such operations may be done once before the loop, but that must not be told
+apart, even if the loop body does not reach them.
+"""
+
+from __future__ import print_function
+
+import sys
+
+# Lengths are known to be "int" values, this one is too large to repeat a
+# sequence with.
+try:
+    huge = xrange(sys.maxsize)
+except NameError:
+    huge = range(sys.maxsize)
+
+
+def sumWithInvariant(a, b):
+    a = len(a)
+    b = len(b)
+
+    result = 0
+
+    for x in range(5):
+        result += x + a * b + 1
+
+    return result
+
+
+print("Sum with invariant", sumWithInvariant("ab", "cde"))
+
+
+def repeatInBranch(items, flag):
+    count = len(items)
+
+    result = None
+
+    for _x in range(3):
+        if flag:
+            result = "a" * count
+
+    return result
+
+
+print("Repeat in branch not taken", repeatInBranch(huge, False))
+print("Repeat in branch", repeatInBranch("abc", True))
+
+
+def repeatTupleInBranch(items, flag):
+    count = len(items)
+
+    result = None
+
+    for _x in range(3):
+        if flag:
+            result = (1,) * count
+
+    return result
+
+
+print("Repeat tuple in branch not taken", repeatTupleInBranch(huge, False))
+print("Repeat tuple in branch", repeatTupleInBranch("abc", True))
+
+
+def repeatAfterBreak(items):
+    count = len(items)
+
+    result = None
+
+    for _x in range(3):
+        if count:
+            break
+
+        result = "a" * count
+
+    return result
+
+
+print("Repeat after break", repeatAfterBreak(huge))
+
+
+def repeatNoIteration(items):
+    count = len(items)
+
+    result = None
+
+    for _x in ():
+        result = "a" * count
+
+    return result
+
+
+print("Repeat without iteration", repeatNoIteration(huge))
@@ -643,6 +643,32 @@ def comparisonChainOrderCheck():
                     del r
 
 
+def containsOrderCheck():
+    print("Checking order of 'in' with made lists and tuples:")
+
+    class A(object):
+        def __init__(self, value):
+            self.value = value
+
+        def __eq__(self, other):
+            print("Test of %s == %s" % (self, other))
+            return self.value == other.value
+
+        def __str__(self):
+            return "<%s %r>" % (self.__class__.__name__, self.value)
+
+    def p(value):
+        print("Creating %d" % value)
+        return A(value)
+
+    print("In tuple of two:", p(1) in (p(2), p(1)))
+    print("In list of three:", p(3) in [p(4), p(5), p(3)])
+    print("Not in tuple of two:", p(6) not in (p(6), p(7)))
+
+    a = A(8)
+    print("Identical in list:", a in [p(9), a])
+
+
 dictOrderCheck()
 separator()
 listOrderCheck()
@@ -696,3 +722,5 @@ separator()
 boolOrderCheck()
 separator()
 comparisonChainOrderCheck()
+separator()
+containsOrderCheck()
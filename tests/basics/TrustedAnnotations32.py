@@ -0,0 +1,159 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Test annotated functions, with annotations of parameters trusted.
+
+Values of other types than annotated, e.g. of sub-classes, must work just as
+without trusting the annotations.
+"""
+
+# nuitka-project: --trust-type-annotations
+
+from __future__ import print_function
+
+import collections
+import enum
+import typing
+from collections import deque as List
+
+
+def addInts(a: int, b: int) -> int:
+    return a + b * 2
+
+
+def repeatStr(s: str, t: "str", n: int = 3) -> str:
+    return (s + t) * n
+
+
+def sumList(values: typing.List[int], scale: int = -1, *, name: str = "x"):
+    result = 0
+
+    for value in values:
+        result += value
+
+    return result * scale, len(values), name
+
+
+def lookupDict(d: typing.Dict[str, int], key: str, default: int = None):
+    return d.get(key, default)
+
+
+def scaleFloat(x: float, y: complex = 1j):
+    return x * 2, y
+
+
+def extendList(values: list, other: tuple) -> list:
+    values.extend(other)
+    return values
+
+
+class C:
+    def method(self, __value: int):
+        return __value + 1
+
+
+print("Ints:", addInts(1, 2), addInts(-(2 ** 70), 2 ** 65))
+print("Strings:", repeatStr("a", "b"), repeatStr("x", "y", n=2))
+print("List:", sumList([1, 2, 3]), sumList([1], scale=2, name="y"))
+print("Dict:", lookupDict({"a": 1}, "a"), lookupDict({}, "b"), lookupDict({}, "c", 7))
+print("Float:", scaleFloat(2), scaleFloat(2.5, 3))
+print("Containers:", extendList([1], (2, 3)))
+print("Method:", C().method(3))
+
+
+class Color(enum.IntEnum):
+    RED = 1
+    GREEN = 2
+
+
+class Text(str):
+    def __add__(self, other):
+        return "Text(%s+%s)" % (str(self), other)
+
+
+class Counter(int):
+    def __add__(self, other):
+        return "Counter(%d+%s)" % (int(self), other)
+
+
+# The annotation now means this class, not the built-in type.
+bytearray = Counter
+
+
+def incrementRebound(value: bytearray):
+    return value + 1
+
+
+# Not the "typing" alias, but something else.
+def firstValue(values: List):
+    return values[0], type(values).__name__
+
+
+print("Sub-class ints:", addInts(True, 2), addInts(Color.GREEN, Color.RED))
+print("Sub-class int:", addInts(Counter(1), 2), C().method(Color.RED))
+print("Sub-class str:", repeatStr(Text("a"), "b", 2))
+print(
+    "Sub-class dicts:",
+    lookupDict(collections.OrderedDict(a=1), "a"),
+    lookupDict(collections.defaultdict(int, b=2), "b"),
+)
+print("Default of other type:", lookupDict({"c": 3}, "c", None))
+print("Rebound name:", incrementRebound(Counter(3)))
+print("Other List:", firstValue(collections.deque([5, 6])))
+
+
+# The function body is copied for the annotated types, with all kinds of
+# nested things.
+def nestedThings(count: int, names: list):
+    def inner(x):
+        return x + count
+
+    class Local:
+        value = count
+
+        def get(self):
+            return self.value, names
+
+    generator = (name * count for name in names)
+
+    try:
+        result = [inner(i) for i in range(count)], (lambda: count * 2)()
+    finally:
+        names = names + ["done"]
+
+    return result, Local().get(), list(generator), nestedThings.__name__
+
+
+print("Nested:", nestedThings(2, ["a"]), nestedThings(True, collections.UserList()))
+
+
+# Too large a function body to be copied, but it must work all the same.
+def largeBody(a: int, b: list):
+    result = []
+
+    for i in range(a):
+        result.append((i + a, i - a, i * a, i // (a or 1), i % (a or 1)))
+        result.append((b[i % len(b)], b[-1], b[0], len(b), b.count(i)))
+        result.append((i + 1, i + 2, i + 3, i + 4, i + 5, i + 6, i + 7, i + 8))
+        result.append((a + 1, a + 2, a + 3, a + 4, a + 5, a + 6, a + 7, a + 8))
+        result.append((str(i), repr(a), hex(i), oct(a), bin(i), abs(-i)))
+        result.append((i < a, i > a, i == a, i != a, i <= a, i >= a))
+
+    return result
+
+
+print("Large:", largeBody(2, [1, 2]), largeBody(Counter(1), collections.UserList([3])))
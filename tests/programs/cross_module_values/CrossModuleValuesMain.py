@@ -0,0 +1,66 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Module variables used across modules, that are never changed, or only by name.
+
+"""
+
+# nuitka-project: --cross-module-optimization
+
+from __future__ import print_function
+
+try:
+    from unittest import mock
+except ImportError:
+    mock = None
+
+from layered_package import config, patched
+from layered_package.config import (
+    BUFFER_SIZE,
+    NAME,
+    TIMEOUT,
+    getDefaultName,
+    getLimits,
+)
+from layered_package.patched import getLimit
+from layered_package.util import describe, paired, scaled, shown
+
+print("Constants:", TIMEOUT * 2, NAME + "!", BUFFER_SIZE // 1024)
+
+
+def useConstants():
+    return TIMEOUT + 1, NAME.upper(), BUFFER_SIZE * 2
+
+
+print("In function:", useConstants())
+print("Calls:", scaled(3), describe(TIMEOUT), shown(None), getDefaultName())
+print("Return shapes:", scaled(2) + 1, describe(7) + "?", getDefaultName().lower())
+
+
+def useSmallFunctions():
+    return shown(TIMEOUT), paired(NAME, True), getLimits()
+
+
+print("Small functions:", useSmallFunctions(), shown(paired(1, None)), getLimits())
+print("Module attribute:", config.TIMEOUT, config.CHANGED)
+print("Changed:", config.changeSetting(), config.CHANGED)
+
+if mock is not None:
+    with mock.patch("layered_package.patched.LIMIT", 42):
+        print("Patched:", getLimit(), patched.LIMIT)
+
+print("Unpatched:", getLimit(), patched.LIMIT)
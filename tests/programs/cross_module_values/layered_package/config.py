@@ -0,0 +1,45 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Settings of the package, most of them are never changed. """
+
+import os
+
+TIMEOUT = 30
+NAME = "layered"
+BUFFER_SIZE = 64 * 1024
+
+CHANGED = 1
+
+
+def getDefaultName():
+    return NAME.title()
+
+
+def getLimits():
+    return TIMEOUT, BUFFER_SIZE
+
+
+def changeSetting():
+    # pylint: disable=global-statement
+    global CHANGED
+    CHANGED += 1
+
+    return CHANGED
+
+
+ENVIRONMENT_SIZE = len(os.environ) >= 0
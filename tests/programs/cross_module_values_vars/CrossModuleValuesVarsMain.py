@@ -0,0 +1,33 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Module variables changed through the module dictionary of another module.
+
+"""
+
+# nuitka-project: --cross-module-optimization
+
+from __future__ import print_function
+
+from vars_package import settings
+from vars_package.settings import getLimit
+
+print("Before:", getLimit(), settings.LIMIT)
+
+vars(settings)["LIMIT"] = 99
+
+print("After:", getLimit(), settings.LIMIT)
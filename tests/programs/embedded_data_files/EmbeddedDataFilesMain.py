@@ -0,0 +1,84 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+# nuitka-project: --include-data-file={MAIN_DIRECTORY}/data_package/greeting.txt=data_package/greeting.txt
+# nuitka-project: --include-data-file={MAIN_DIRECTORY}/data_package/plain.txt=data_package/plain.txt
+# nuitka-project: --include-data-file={MAIN_DIRECTORY}/data_package/sub/nested.txt=data_package/sub/nested.txt
+# nuitka-project: --embed-data-files=data_package/greeting.txt
+# nuitka-project: --embed-data-files=data_package/sub/*
+
+""" Read data files back through "importlib.resources".
+
+Some of them are embedded into the binary, one stays a file, results must
+be the same.
+"""
+
+from __future__ import print_function
+
+import sys
+from importlib import resources
+
+import data_package
+
+print("Binary:", resources.read_binary(data_package, "greeting.txt"))
+print("Text:", resources.read_text(data_package, "plain.txt"))
+
+with resources.open_text(data_package, "greeting.txt") as text_file:
+    print("Open text:", text_file.read())
+
+print("Is resource:", resources.is_resource(data_package, "greeting.txt"))
+print("Is resource:", resources.is_resource(data_package, "plain.txt"))
+print("Is resource:", resources.is_resource(data_package, "missing.txt"))
+
+print(
+    "Contents:",
+    sorted(
+        name
+        for name in resources.contents(data_package)
+        if name.endswith(".txt") or name == "sub"
+    ),
+)
+
+if sys.version_info >= (3, 9):
+    root = resources.files(data_package)
+
+    print("Files name:", root.name, root.is_dir(), root.is_file())
+    print(
+        "Files iterdir:",
+        sorted(
+            child.name
+            for child in root.iterdir()
+            if child.name.endswith(".txt") or child.name == "sub"
+        ),
+    )
+
+    nested = root / "sub" / "nested.txt"
+    print("Nested:", nested.name, nested.is_file(), nested.is_dir())
+    print("Nested text:", nested.read_text())
+    print("Nested bytes:", root.joinpath("sub", "nested.txt").read_bytes())
+    print("Sub is dir:", root.joinpath("sub").is_dir())
+    print("Sub iterdir:", sorted(child.name for child in (root / "sub").iterdir()))
+
+    with (root / "greeting.txt").open("rb") as binary_file:
+        print("Open binary:", binary_file.read())
+
+    with (root / "plain.txt").open(encoding="utf-8") as text_file:
+        print("Open plain:", text_file.read())
+
+    with resources.as_file(nested) as nested_path:
+        with open(nested_path) as nested_file:
+            print("As file:", nested_file.read())
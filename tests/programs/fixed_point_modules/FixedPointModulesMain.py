@@ -0,0 +1,30 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Modules skipped in later passes, while modules they use still change.
+
+The "run_all.py" compares the optimized tree against the one from optimizing
+all modules in every pass.
+"""
+
+from __future__ import print_function
+
+import user_module
+
+print("Values:", user_module.values())
+print("Described:", user_module.described(3), user_module.described(-1))
+print("Unchanged:", user_module.unchanged())
@@ -0,0 +1,46 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Module that takes several passes to settle. """
+
+LIMIT = 10
+
+
+def compute(value):
+    # Only after the first pass, this function is known to be unused, and
+    # dropped, changing the module again.
+    def scaled(arg):
+        return arg * 2
+
+    limit = -1
+
+    if limit > 0:
+        return (lambda arg: arg * LIMIT)(value)
+
+    return scaled(value)
+
+
+def describe(value):
+    def positive():
+        return "positive"
+
+    def negative():
+        return "negative"
+
+    kind = positive if value >= 0 else negative
+
+    return "%d is %s" % (value, kind())
@@ -40,6 +40,7 @@ sys.path.insert(
 # isort:start
 
 from nuitka.tools.testing.Common import (
+    check_output,
     compareWithCPython,
     createSearchMode,
     my_print,
@@ -61,6 +62,37 @@ Error, no file ends with 'Main.py' or 'Main' in %s, incomplete test case."""
     )
 
 
+def checkOptimizedTree(filename, filename_main):
+    """Compare the optimized tree against optimizing all modules in all passes.
+
+    Later passes skip modules at a fixed point, which must not make a
+    difference for the result.
+    """
+
+    results = []
+
+    for extra_options in ([], ["--experimental=optimize-all-modules"]):
+        command = (
+            [
+                os.environ["PYTHON"],
+                os.path.abspath(os.path.join("..", "..", "bin", "nuitka")),
+                "--xml",
+                "--quiet",
+                "--follow-imports",
+            ]
+            + extra_options
+            + [os.path.join(filename, filename_main)]
+        )
+
+        results.append(check_output(command))
+
+    if results[0] != results[1]:
+        sys.exit(
+            "Error, skipping unchanged modules changed the optimized tree of '%s'."
+            % filename
+        )
+
+
 def main():
     # Complex stuff, even more should become common code though.
     # pylint: disable=too-many-branches,too-many-statements
@@ -131,8 +163,8 @@ def main():
 
         # Use the original __file__ value, at least one case warns about things
         # with filename included, but for pkgutil iteration, make sure we do not
-        # see original Python dirs.
-        if filename != "pkgutil_itermodules":
+        # see original Python dirs, and standalone resources are found at runtime.
+        if filename not in ("pkgutil_itermodules", "embedded_data_files"):
             extra_flags.append("--file-reference-choice=original")
         else:
             extra_flags.append("--file-reference-choice=runtime")
@@ -141,10 +173,14 @@ def main():
         # ImportError, but that's not the test. In all other cases, use two
         # step execution, which will not add the program original source to
         # PYTHONPATH.
-        if filename != "syntax_errors":
-            extra_flags.append("two_step_execution")
-        else:
+        if filename == "syntax_errors":
             extra_flags.append("binary_python_path")
+        elif filename == "embedded_data_files":
+            # Data files are only embedded in standalone mode, which runs from
+            # the distribution folder.
+            extra_flags.append("--standalone")
+        else:
+            extra_flags.append("two_step_execution")
 
         if filename == "plugin_import":
             os.environ["NUITKA_EXTRA_OPTIONS"] = (
@@ -165,6 +201,12 @@ def main():
                 )
 
             extra_flags.append("ignore_warnings")
+        elif filename == "embedded_data_files":
+            if python_version < (3, 7):
+                reportSkip("Needs 'importlib.resources'", ".", filename)
+                continue
+
+            os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options
         elif filename == "multiprocessing_using":
             # TODO: Still true?
             if sys.platform == "darwin" and python_version >= (3, 8):
@@ -198,6 +240,11 @@ def main():
                     needs_2to3=False,
                 )
 
+            if filename == "fixed_point_modules":
+                my_print("Consider optimized tree of program:", filename)
+
+                checkOptimizedTree(filename, filename_main)
+
     search_mode.finish()
 
 
@@ -0,0 +1,48 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Module level definitions, some of which are not used by name anywhere.
+
+"""
+
+# nuitka-project: --remove-unused-definitions
+# nuitka-project: --keep-definition=definitions_package.shapes.KeptClass
+
+from __future__ import print_function
+
+import sys
+
+from definitions_package import namespace, shapes
+from definitions_package.shapes import UsedClass, usedFunction
+
+print("Used:", UsedClass().describe(), usedFunction(2))
+
+# Only used with names given as strings.
+print("Looked up:", getattr(shapes, "LookedUpClass")().value)
+print(
+    "Looked up dotted:",
+    getattr(shapes, "definitions_package.shapes.lookedUpFunction".split(".")[-1])(),
+)
+
+# The name is computed, but the definition is kept as asked for.
+print("Kept:", getattr(shapes, "Kept" + "Class" * len(sys.argv))().value)
+
+# Creating these has effects, so they cannot be removed.
+print("Registry:", shapes.registry)
+
+# The module uses its namespace with computed names, so it is not touched.
+print("Computed:", namespace.getByName("computed" + "Function" * len(sys.argv))())
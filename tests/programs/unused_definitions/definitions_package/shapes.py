@@ -0,0 +1,74 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Definitions used in various ways, or not at all. """
+
+registry = []
+
+
+def register(cls):
+    registry.append(cls.__name__)
+    return cls
+
+
+class UsedClass(object):
+    value = 1
+
+    def describe(self):
+        return "used %d" % self.value
+
+
+def usedFunction(x):
+    return x * 2
+
+
+class UnusedClass(object):
+    """Not used anywhere, and removed."""
+
+    value = (1, 2)
+
+    def method(self, x=3):
+        return x
+
+
+def unusedFunction():
+    return UnusedClass().method()
+
+
+class LookedUpClass(object):
+    value = "looked up"
+
+
+def lookedUpFunction():
+    return "looked up dotted"
+
+
+class KeptClass(object):
+    value = "kept"
+
+
+@register
+class DecoratedClass(object):
+    pass
+
+
+class EffectClass(object):
+    registry.append("effect")
+
+
+class DerivedClass(UsedClass):
+    registry.append("derived")
@@ -0,0 +1,162 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Unit tests for the directory index and the package search path cache. """
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from nuitka.importing import DirectoryIndex, Importing
+from nuitka.utils.ModuleNames import ModuleName
+
+
+class DirectoryIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.original_case_sensitive = DirectoryIndex._case_sensitive
+
+        self.test_dir = tempfile.mkdtemp()
+
+        with open(os.path.join(self.test_dir, "Module.py"), "w"):
+            pass
+        os.mkdir(os.path.join(self.test_dir, "Package"))
+
+    def tearDown(self):
+        DirectoryIndex._case_sensitive = self.original_case_sensitive
+
+        DirectoryIndex._directory_indexes.clear()
+        DirectoryIndex._directory_lookups.clear()
+
+        shutil.rmtree(self.test_dir)
+
+    def _setCaseSensitive(self, value):
+        DirectoryIndex._case_sensitive = value
+
+        DirectoryIndex._directory_indexes.clear()
+        DirectoryIndex._directory_lookups.clear()
+
+    def _path(self, *parts):
+        return os.path.join(self.test_dir, *parts)
+
+    def testKinds(self):
+        self.assertTrue(DirectoryIndex.isIndexedFile(self._path("Module.py")))
+        self.assertFalse(DirectoryIndex.isIndexedDirectory(self._path("Module.py")))
+
+        self.assertTrue(DirectoryIndex.isIndexedDirectory(self._path("Package")))
+        self.assertFalse(DirectoryIndex.isIndexedFile(self._path("Package")))
+
+        self.assertFalse(DirectoryIndex.isIndexedFile(self._path("Missing.py")))
+        self.assertFalse(
+            DirectoryIndex.isIndexedFile(self._path("Missing", "Module.py"))
+        )
+
+        self.assertEqual(
+            DirectoryIndex.getIndexedFilenames(self.test_dir),
+            ["Module.py", "Package"],
+        )
+
+    def testCaseSensitive(self):
+        self._setCaseSensitive(True)
+
+        self.assertTrue(DirectoryIndex.isIndexedFile(self._path("Module.py")))
+        self.assertFalse(DirectoryIndex.isIndexedFile(self._path("module.py")))
+        self.assertFalse(DirectoryIndex.isIndexedDirectory(self._path("PACKAGE")))
+
+    def testCaseInsensitive(self):
+        self._setCaseSensitive(False)
+
+        self.assertTrue(DirectoryIndex.isIndexedFile(self._path("Module.py")))
+        self.assertTrue(DirectoryIndex.isIndexedFile(self._path("module.py")))
+        self.assertTrue(DirectoryIndex.isIndexedFile(self._path("MODULE.PY")))
+        self.assertTrue(DirectoryIndex.isIndexedDirectory(self._path("PACKAGE")))
+        self.assertFalse(DirectoryIndex.isIndexedFile(self._path("PACKAGE")))
+
+        # Real names are still reported.
+        self.assertEqual(
+            DirectoryIndex.getIndexedFilenames(self.test_dir),
+            ["Module.py", "Package"],
+        )
+
+
+class PackageSearchPathTest(unittest.TestCase):
+    def setUp(self):
+        self.original_main_path = Importing.main_path
+        self.original_cache = dict(Importing._package_search_path_cache)
+        self.original_sys_path = list(sys.path)
+        self.original_cwd = os.getcwd()
+
+        self.test_dir = tempfile.mkdtemp()
+
+        Importing.setMainScriptDirectory(self.test_dir)
+        Importing._package_search_path_cache.clear()
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        sys.path[:] = self.original_sys_path
+
+        Importing.setMainScriptDirectory(self.original_main_path)
+
+        Importing._package_search_path_cache.clear()
+        Importing._package_search_path_cache.update(self.original_cache)
+
+        shutil.rmtree(self.test_dir)
+
+    def testCached(self):
+        result = Importing.getPackageSearchPath(None)
+        self.assertEqual(len(Importing._package_search_path_cache), 1)
+
+        self.assertEqual(Importing.getPackageSearchPath(None), result)
+        self.assertEqual(len(Importing._package_search_path_cache), 1)
+
+        # Callers may modify the result, without affecting the cache.
+        result.append("added")
+        self.assertNotIn("added", Importing.getPackageSearchPath(None))
+
+    def testSysPathChange(self):
+        result = Importing.getPackageSearchPath(None)
+
+        sys.path.append(self.test_dir)
+
+        self.assertEqual(Importing.getPackageSearchPath(None), result + [self.test_dir])
+        self.assertEqual(len(Importing._package_search_path_cache), 2)
+
+    def testCurrentDirectoryChange(self):
+        result = Importing.getPackageSearchPath(None)
+
+        os.chdir(self.test_dir)
+
+        changed = Importing.getPackageSearchPath(None)
+        self.assertEqual(changed[0], os.getcwd())
+        self.assertEqual(changed[1:], result[1:])
+
+    def testPackageName(self):
+        os.mkdir(os.path.join(self.test_dir, "pkg"))
+        with open(os.path.join(self.test_dir, "pkg", "__init__.py"), "w"):
+            pass
+
+        os.chdir(self.test_dir)
+
+        result = Importing.getPackageSearchPath(ModuleName("pkg"))
+        self.assertIn(os.path.join(os.getcwd(), "pkg"), result)
+
+        # Keys differ by package name.
+        self.assertNotEqual(Importing.getPackageSearchPath(None), result)
+        self.assertEqual(len(Importing._package_search_path_cache), 2)
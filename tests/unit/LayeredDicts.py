@@ -0,0 +1,287 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Unit tests for the dictionary with cheap snapshots used by trace collections. """
+
+import random
+import unittest
+
+from nuitka.containers import LayeredDict as LayeredDictModule
+from nuitka.containers.LayeredDict import LayeredDict, getDivergedValues
+
+
+def _makeLayered(values):
+    result = LayeredDict()
+
+    for key, value in values.items():
+        result[key] = value
+
+    return result
+
+
+def _getDepth(layered_dict):
+    return 0 if layered_dict.base is None else layered_dict.base.depth
+
+
+class LayeredDictTest(unittest.TestCase):
+    def testLookups(self):
+        layered_dict = _makeLayered({"a": 1, "b": 2})
+        layered_dict.snapshot()
+        layered_dict["c"] = 3
+
+        self.assertEqual(layered_dict["a"], 1)
+        self.assertEqual(layered_dict["c"], 3)
+        self.assertIn("b", layered_dict)
+
+        self.assertNotIn("d", layered_dict)
+        self.assertRaises(KeyError, lambda: layered_dict["d"])
+        self.assertEqual(layered_dict.get("d", 4), 4)
+
+        self.assertEqual(sorted(layered_dict.items()), [("a", 1), ("b", 2), ("c", 3)])
+        self.assertEqual(sorted(layered_dict.keys()), ["a", "b", "c"])
+
+    def testSnapshot(self):
+        layered_dict = _makeLayered({"a": 1})
+
+        copy = layered_dict.snapshot()
+        self.assertIs(copy.base, layered_dict.base)
+
+        layered_dict["a"] = 2
+        copy["b"] = 3
+
+        self.assertEqual(layered_dict["a"], 2)
+        self.assertNotIn("b", layered_dict)
+
+        self.assertEqual(copy["a"], 1)
+        self.assertEqual(copy["b"], 3)
+
+        # Without changes, no new layer is needed.
+        base = layered_dict.snapshot().base
+        self.assertIs(layered_dict.snapshot().base, base)
+
+    def testClear(self):
+        layered_dict = _makeLayered({"a": 1})
+        copy = layered_dict.snapshot()
+
+        copy.clear()
+
+        self.assertNotIn("a", copy)
+        self.assertEqual(copy.items(), [])
+        self.assertEqual(layered_dict["a"], 1)
+
+        # Cleared dictionaries share nothing anymore.
+        common, keys, (values1, values2) = getDivergedValues((layered_dict, copy))
+
+        self.assertIs(common, None)
+        self.assertEqual(keys, ["a"])
+        self.assertEqual(values1, {"a": 1})
+        self.assertEqual(values2, {})
+
+    def testUpdate(self):
+        layered_dict = _makeLayered({"a": 1, "b": 2})
+        copy = layered_dict.snapshot()
+        copy["b"] = 3
+        copy["c"] = 4
+
+        layered_dict.update(copy)
+
+        self.assertEqual(sorted(layered_dict.items()), [("a", 1), ("b", 3), ("c", 4)])
+
+
+class DivergedValuesTest(unittest.TestCase):
+    def testBranches(self):
+        layered_dict = _makeLayered({"a": 1, "b": 2, "c": 3})
+        layered_dict.snapshot()
+        layered_dict["d"] = 4
+
+        branch1 = layered_dict.snapshot()
+        branch2 = layered_dict.snapshot()
+
+        branch1["a"] = 10
+        branch1["e"] = 5
+        branch2["b"] = 20
+
+        common, keys, (values1, values2) = getDivergedValues((branch1, branch2))
+
+        self.assertIs(common, layered_dict.base)
+
+        # Keys not set in either branch, are not reported.
+        self.assertEqual(sorted(keys), ["a", "b", "e"])
+
+        # Values not set in a branch come from the shared layers, keys missing
+        # in these too, are missing.
+        self.assertEqual(values1, {"a": 10, "b": 2, "e": 5})
+        self.assertEqual(values2, {"a": 1, "b": 20})
+
+    def testNothingShared(self):
+        layered_dict1 = _makeLayered({"a": 1})
+        layered_dict2 = _makeLayered({"a": 1, "b": 2})
+
+        common, keys, (values1, values2) = getDivergedValues(
+            (layered_dict1, layered_dict2)
+        )
+
+        self.assertIs(common, None)
+        self.assertEqual(sorted(keys), ["a", "b"])
+        self.assertEqual(values1, {"a": 1})
+        self.assertEqual(values2, {"a": 1, "b": 2})
+
+
+class FlatteningTest(unittest.TestCase):
+    max_depth = LayeredDictModule._max_layer_depth
+
+    @staticmethod
+    def _deepen(layered_dict, prefix, amount):
+        for count in range(amount):
+            layered_dict["%s%d" % (prefix, count)] = count
+            layered_dict["shared"] = prefix, count
+            layered_dict.snapshot()
+
+    def testDepth(self):
+        layered_dict = LayeredDict()
+        self._deepen(layered_dict, "a", 3 * self.max_depth)
+
+        self.assertTrue(1 <= _getDepth(layered_dict) <= self.max_depth)
+
+        for count in range(3 * self.max_depth):
+            self.assertEqual(layered_dict["a%d" % count], count)
+
+        self.assertEqual(layered_dict["shared"], ("a", 3 * self.max_depth - 1))
+        self.assertEqual(len(layered_dict.items()), 3 * self.max_depth + 1)
+
+    def testSnapshotAfterFlattening(self):
+        layered_dict = LayeredDict()
+        self._deepen(layered_dict, "a", self.max_depth)
+
+        before = layered_dict.snapshot()
+        self._deepen(layered_dict, "b", 2)
+        after = layered_dict.snapshot()
+
+        # The flattened layer is not shared with the earlier snapshot.
+        self.assertEqual(_getDepth(before), self.max_depth)
+        self.assertEqual(_getDepth(after), 2)
+
+        self.assertNotIn("b0", before)
+        self.assertEqual(before["shared"], ("a", self.max_depth - 1))
+
+        self.assertEqual(after["a0"], 0)
+        self.assertEqual(after["b1"], 1)
+        self.assertEqual(after["shared"], ("b", 1))
+
+        after["c"] = 1
+        self.assertNotIn("c", layered_dict)
+
+    def testMergeAcrossFlattened(self):
+        layered_dict = _makeLayered({"x": 0, "y": 0})
+        layered_dict.snapshot()
+
+        branch1 = layered_dict.snapshot()
+        branch2 = layered_dict.snapshot()
+
+        self._deepen(branch1, "a", 2 * self.max_depth)
+        branch2["x"] = 2
+
+        common, keys, (values1, values2) = getDivergedValues((branch1, branch2))
+
+        # The flattened branch shares no layer anymore, but values still
+        # compare as if it did.
+        self.assertIs(common, None)
+
+        self.assertEqual(values1["x"], 0)
+        self.assertEqual(values2["x"], 2)
+        self.assertEqual(values1["y"], values2["y"])
+        self.assertEqual(values1["shared"], ("a", 2 * self.max_depth - 1))
+        self.assertNotIn("shared", values2)
+        self.assertNotIn("a0", values2)
+
+        self.assertEqual(set(keys), set(values1) | set(values2))
+
+    def testRandomAgainstDict(self):
+        rng = random.Random(42)
+
+        layered_dicts = [LayeredDict()]
+        plain_dicts = [{}]
+
+        # Count visits of chains deep enough to be flattened with new values.
+        at_max_depth = 0
+
+        for _count in range(2000):
+            index = rng.randrange(len(layered_dicts))
+
+            if _getDepth(layered_dicts[index]) == self.max_depth:
+                at_max_depth += 1
+
+            action = rng.random()
+
+            if action < 0.5:
+                key = rng.randrange(30)
+                value = rng.randrange(5)
+
+                layered_dicts[index][key] = value
+                plain_dicts[index][key] = value
+            elif action < 0.9:
+                copy = layered_dicts[index].snapshot()
+
+                # Replace others once there are enough, so chains get deep.
+                if len(layered_dicts) < 10:
+                    layered_dicts.append(copy)
+                    plain_dicts.append(dict(plain_dicts[index]))
+                else:
+                    other = rng.randrange(len(layered_dicts))
+
+                    layered_dicts[other] = copy
+                    plain_dicts[other] = dict(plain_dicts[index])
+            else:
+                other = rng.randrange(len(layered_dicts))
+
+                common, keys, all_values = getDivergedValues(
+                    (layered_dicts[index], layered_dicts[other])
+                )
+
+                # Like the trace collection merge, new values on top of the
+                # shared layer.
+                merged = LayeredDict(common)
+                merged_plain = {}
+
+                for key in set(plain_dicts[index]) | set(plain_dicts[other]):
+                    value = max(
+                        plain_dict.get(key, -1)
+                        for plain_dict in (plain_dicts[index], plain_dicts[other])
+                    )
+
+                    merged_plain[key] = value
+
+                    if key not in keys:
+                        self.assertEqual(
+                            plain_dicts[index].get(key), plain_dicts[other].get(key)
+                        )
+
+                for key in keys:
+                    merged[key] = max(values.get(key, -1) for values in all_values)
+
+                self.assertEqual(dict(merged.items()), merged_plain)
+
+                layered_dicts[index] = merged
+                plain_dicts[index] = merged_plain
+
+        self.assertTrue(at_max_depth > 0)
+
+        for layered_dict, plain_dict in zip(layered_dicts, plain_dicts):
+            self.assertEqual(dict(layered_dict.items()), plain_dict)
+            self.assertTrue(_getDepth(layered_dict) <= self.max_depth)
@@ -0,0 +1,85 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+""" Unit tests for hoisting of loop invariant operations. """
+
+import unittest
+
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    tshape_float,
+    tshape_int,
+    tshape_list,
+    tshape_str,
+    tshape_tuple,
+)
+from nuitka.nodes.shapes.StandardShapes import tshape_unknown
+from nuitka.optimizations import LoopInvariants
+from nuitka.optimizations.ValueTraces import (
+    ValueTraceAssign,
+    ValueTraceEscaped,
+)
+
+
+class FakeOperation(object):
+    def __init__(self, operator, type_shape):
+        self.operator = operator
+        self.type_shape = type_shape
+
+    def getTypeShape(self):
+        return self.type_shape
+
+
+class BoundedOperationTest(unittest.TestCase):
+    def _isBounded(self, operator, type_shape):
+        return LoopInvariants._isBoundedOperation(FakeOperation(operator, type_shape))
+
+    def testSequenceRepetition(self):
+        self.assertFalse(self._isBounded("Mult", tshape_str))
+        self.assertFalse(self._isBounded("Mult", tshape_tuple))
+
+    def testIntegerGrowth(self):
+        self.assertFalse(self._isBounded("Mult", tshape_int))
+        self.assertFalse(self._isBounded("Pow", tshape_int))
+        self.assertFalse(self._isBounded("LShift", tshape_int))
+
+    def testBounded(self):
+        self.assertTrue(self._isBounded("Add", tshape_int))
+        self.assertTrue(self._isBounded("Add", tshape_str))
+        self.assertTrue(self._isBounded("BitAnd", tshape_int))
+        self.assertTrue(self._isBounded("Mult", tshape_float))
+
+
+class EscapedTraceShapeTest(unittest.TestCase):
+    @staticmethod
+    def _getEscapedShape(type_shape):
+        previous = ValueTraceAssign(
+            owner=None,
+            assign_node=FakeOperation("Assign", type_shape),
+            previous=None,
+        )
+
+        return ValueTraceEscaped(owner=None, previous=previous).getTypeShape()
+
+    def testImmutableKept(self):
+        self.assertIs(self._getEscapedShape(tshape_int), tshape_int)
+        self.assertIs(self._getEscapedShape(tshape_str), tshape_str)
+
+    def testMutableLost(self):
+        self.assertIs(self._getEscapedShape(tshape_list), tshape_unknown)
+
+        # Tuples are not kept, their elements may be mutable.
+        self.assertIs(self._getEscapedShape(tshape_tuple), tshape_unknown)
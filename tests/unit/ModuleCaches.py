@@ -0,0 +1,171 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Unit tests for the indexes of modules in registry and import cache. """
+
+import os
+import unittest
+
+from nuitka import ModuleRegistry
+from nuitka.importing import ImportCache
+from nuitka.utils.ModuleNames import ModuleName
+
+
+class FakeModule(object):
+    def __init__(self, full_name, filename):
+        self.full_name = ModuleName(full_name)
+        self.filename = filename
+
+    def getFullName(self):
+        return self.full_name
+
+    def getFilename(self):
+        return self.filename
+
+    def getCompileTimeFilename(self):
+        return self.filename
+
+    @staticmethod
+    def isMainModule():
+        return False
+
+    @staticmethod
+    def isTechnical():
+        return False
+
+
+class UncompiledModulesIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.original_modules = set(ModuleRegistry.uncompiled_modules)
+        self.original_index = dict(ModuleRegistry.uncompiled_modules_index)
+
+        ModuleRegistry.uncompiled_modules.clear()
+        ModuleRegistry.uncompiled_modules_index.clear()
+
+    def tearDown(self):
+        ModuleRegistry.uncompiled_modules.clear()
+        ModuleRegistry.uncompiled_modules.update(self.original_modules)
+
+        ModuleRegistry.uncompiled_modules_index.clear()
+        ModuleRegistry.uncompiled_modules_index.update(self.original_index)
+
+    def testLookup(self):
+        module = FakeModule("a.b", os.path.join("pkg", "a", "b.py"))
+        ModuleRegistry.addUncompiledModule(module)
+
+        self.assertIs(
+            ModuleRegistry.getUncompiledModule("a.b", module.filename), module
+        )
+
+        # Paths are compared normalized.
+        self.assertIs(
+            ModuleRegistry.getUncompiledModule(
+                "a.b", os.path.join("pkg", "a", "..", "a", "b.py")
+            ),
+            module,
+        )
+
+        self.assertIs(ModuleRegistry.getUncompiledModule("a.c", module.filename), None)
+        self.assertIs(ModuleRegistry.getUncompiledModule("a.b", "other.py"), None)
+
+    def testRemove(self):
+        module = FakeModule("a", os.path.join("pkg", "a", "__init__.py"))
+        ModuleRegistry.addUncompiledModule(module)
+        ModuleRegistry.removeUncompiledModule(module)
+
+        self.assertIs(ModuleRegistry.getUncompiledModule("a", module.filename), None)
+        self.assertEqual(ModuleRegistry.uncompiled_modules_index, {})
+
+    def testRemoveSameKey(self):
+        module1 = FakeModule("a", "a.py")
+        module2 = FakeModule("a", "a.py")
+
+        ModuleRegistry.addUncompiledModule(module1)
+        ModuleRegistry.addUncompiledModule(module2)
+
+        ModuleRegistry.removeUncompiledModule(module1)
+        self.assertIs(ModuleRegistry.getUncompiledModule("a", "a.py"), module2)
+
+        ModuleRegistry.removeUncompiledModule(module2)
+        self.assertIs(ModuleRegistry.getUncompiledModule("a", "a.py"), None)
+        self.assertEqual(ModuleRegistry.uncompiled_modules, set())
+
+
+class ImportedByPathTest(unittest.TestCase):
+    def setUp(self):
+        self.originals = (
+            dict(ImportCache.imported_modules),
+            dict(ImportCache.imported_by_name),
+            dict(ImportCache.imported_by_path),
+        )
+
+        ImportCache.imported_modules.clear()
+        ImportCache.imported_by_name.clear()
+        ImportCache.imported_by_path.clear()
+
+    def tearDown(self):
+        for cache, original in zip(
+            (
+                ImportCache.imported_modules,
+                ImportCache.imported_by_name,
+                ImportCache.imported_by_path,
+            ),
+            self.originals,
+        ):
+            cache.clear()
+            cache.update(original)
+
+    def testPackageByPath(self):
+        path = os.path.join("pkg", "__init__.py")
+
+        package = FakeModule("pkg", path)
+        ImportCache.addImportedModule(package)
+
+        self.assertTrue(ImportCache.isImportedModuleByPath("pkg"))
+        self.assertIs(ImportCache.getImportedModuleByPath("pkg", None), package)
+        self.assertIs(ImportCache.getImportedModuleByNameAndPath("pkg", path), package)
+
+        # Adding again changes nothing.
+        ImportCache.addImportedModule(package)
+        self.assertEqual(ImportCache.imported_by_path["pkg"], [package])
+
+    def testSamePathOtherPackage(self):
+        path = os.path.join("pkg", "__init__.py")
+
+        package1 = FakeModule("pkg", path)
+        package2 = FakeModule("other.pkg", path)
+
+        ImportCache.addImportedModule(package1)
+        ImportCache.addImportedModule(package2)
+
+        self.assertEqual(ImportCache.imported_by_path["pkg"], [package1, package2])
+        self.assertIs(ImportCache.getImportedModuleByPath("pkg", None), package1)
+        self.assertIs(ImportCache.getImportedModuleByPath("pkg", "other"), package2)
+
+        self.assertRaises(KeyError, ImportCache.getImportedModuleByPath, "other", None)
+
+    def testReplace(self):
+        old = FakeModule("m", "m.py")
+        new = FakeModule("m", "m.py")
+
+        ImportCache.addImportedModule(old)
+        ImportCache.replaceImportedModule(old, new)
+
+        self.assertEqual(ImportCache.imported_by_path["m.py"], [new])
+        self.assertIs(ImportCache.getImportedModuleByName("m"), new)
@@ -0,0 +1,93 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Unit tests for runtime information queries and their cache files. """
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from nuitka.plugins import RuntimeInformation
+from nuitka.utils.FileOperations import getFileContents, putFileContentsAtomic
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "Helper needs fork")
+class HelperProcessTest(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        RuntimeInformation._stopHelperProcess()
+
+    @staticmethod
+    def _query(setup_code, *value_expressions):
+        return RuntimeInformation._queryHelperProcess(setup_code, value_expressions)
+
+    def testValues(self):
+        self.assertEqual(
+            self._query("import os", "os.sep", "1 + 1"), [repr(os.sep), "2"]
+        )
+
+    def testImportError(self):
+        self.assertIs(self._query("import nuitka_not_existing_module", "1"), None)
+
+    def testIsolated(self):
+        self.assertEqual(
+            self._query("import sys\nsys.nuitka_query_state = 1", "1"), ["1"]
+        )
+
+        self.assertEqual(
+            self._query("import sys", "hasattr(sys, 'nuitka_query_state')"),
+            ["False"],
+        )
+        self.assertEqual(
+            self._query("", "'json' in globals()"),
+            ["False"],
+        )
+
+    def testFailures(self):
+        self.assertIs(self._query("raise RuntimeError", "1"), False)
+        self.assertIs(self._query("import sys", "sys.exit(1)"), False)
+
+        # Even exiting the process only fails that query.
+        process = RuntimeInformation._getHelperProcess()
+        self.assertIs(self._query("import os", "os._exit(3)"), False)
+        self.assertIs(RuntimeInformation._getHelperProcess(), process)
+
+        self.assertEqual(self._query("", "3"), ["3"])
+
+
+class CacheContentsTest(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def testReplace(self):
+        filename = os.path.join(self.test_dir, "cache")
+
+        putFileContentsAtomic(filename, "first")
+        putFileContentsAtomic(filename, "second")
+        self.assertEqual(getFileContents(filename), "second")
+
+        putFileContentsAtomic(filename, b"\0binary", mode="wb")
+        self.assertEqual(getFileContents(filename, "rb"), b"\0binary")
+
+        # No temporary files remain.
+        self.assertEqual(os.listdir(self.test_dir), ["cache"])
@@ -0,0 +1,151 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Unit tests for copying files to the dist folder for standalone. """
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from nuitka.freezer import Standalone
+from nuitka.utils import FileOperations
+from nuitka.utils.Utils import getOS
+
+
+class CopyFileGroupTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        self.source_path = os.path.join(self.tmp_dir, "source.so")
+
+        with open(self.source_path, "wb") as output_file:
+            output_file.write(b"contents")
+
+        os.chmod(self.source_path, 0o751)
+
+        self.dest_paths = [
+            os.path.join(self.tmp_dir, "dest%d.so" % count) for count in range(3)
+        ]
+        self.copies = dict(
+            (dest_path, self.source_path) for dest_path in self.dest_paths
+        )
+
+        self.original_link = os.link
+
+    def tearDown(self):
+        os.link = self.original_link
+
+        shutil.rmtree(self.tmp_dir)
+
+    def _checkContents(self):
+        for dest_path in self.dest_paths:
+            with open(dest_path, "rb") as input_file:
+                self.assertEqual(input_file.read(), b"contents")
+
+    def _getMode(self, path):
+        return stat.S_IMODE(os.stat(path).st_mode)
+
+    def testHardLinks(self):
+        Standalone._copyFileGroup(
+            copies=self.copies, dest_paths=self.dest_paths, with_permissions=True
+        )
+
+        self._checkContents()
+
+        inodes = set(os.stat(dest_path).st_ino for dest_path in self.dest_paths)
+        self.assertEqual(len(inodes), 1)
+        self.assertNotEqual(inodes, set([os.stat(self.source_path).st_ino]))
+
+    def testLinkFailureFallback(self):
+        def failingLink(source, dest):
+            raise OSError("No hard links here")
+
+        os.link = failingLink
+
+        Standalone._copyFileGroup(
+            copies=self.copies, dest_paths=self.dest_paths, with_permissions=True
+        )
+
+        self._checkContents()
+
+        for dest_path in self.dest_paths:
+            self.assertEqual(self._getMode(dest_path), 0o751)
+
+        inodes = set(os.stat(dest_path).st_ino for dest_path in self.dest_paths)
+        self.assertEqual(len(inodes), len(self.dest_paths))
+
+
+@unittest.skipIf(getOS() != "Linux", "Cloning is only done on Linux")
+class CloneFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        self.source_path = os.path.join(self.tmp_dir, "source.so")
+        self.dest_path = os.path.join(self.tmp_dir, "dest.so")
+
+        with open(self.source_path, "wb") as output_file:
+            output_file.write(b"contents")
+
+        import fcntl
+
+        self.fcntl = fcntl
+        self.original_ioctl = fcntl.ioctl
+        self.original_copyfile = shutil.copyfile
+
+        self.ioctl_calls = []
+        self.copyfile_calls = []
+
+    def tearDown(self):
+        self.fcntl.ioctl = self.original_ioctl
+        shutil.copyfile = self.original_copyfile
+
+        shutil.rmtree(self.tmp_dir)
+
+    def _fakeCopyfile(self, source_path, dest_path):
+        self.copyfile_calls.append((source_path, dest_path))
+
+        return self.original_copyfile(source_path, dest_path)
+
+    def testClone(self):
+        def fakeIoctl(fd, request, arg):
+            self.ioctl_calls.append(request)
+
+        self.fcntl.ioctl = fakeIoctl
+        shutil.copyfile = self._fakeCopyfile
+
+        FileOperations.copyFile(self.source_path, self.dest_path)
+
+        self.assertEqual(self.ioctl_calls, [FileOperations._FICLONE])
+        self.assertEqual(self.copyfile_calls, [])
+
+    def testCloneFailure(self):
+        def failingIoctl(fd, request, arg):
+            raise IOError("Cloning not supported")
+
+        self.fcntl.ioctl = failingIoctl
+        shutil.copyfile = self._fakeCopyfile
+
+        FileOperations.copyFile(self.source_path, self.dest_path)
+
+        self.assertEqual(self.copyfile_calls, [(self.source_path, self.dest_path)])
+
+        with open(self.dest_path, "rb") as input_file:
+            self.assertEqual(input_file.read(), b"contents")
@@ -0,0 +1,87 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Unit tests for the detection of DLLs used on Linux with "ldd". """
+
+import unittest
+
+from nuitka.freezer import Standalone
+
+
+class DetectBinaryPathDLLsPosixTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.used_dlls = {}
+
+        self.original = Standalone._getBinaryPathDLLsPosix
+        Standalone._getBinaryPathDLLsPosix = self._fakeGetBinaryPathDLLsPosix
+
+        Standalone.ldd_result_cache.clear()
+
+    def tearDown(self):
+        Standalone._getBinaryPathDLLsPosix = self.original
+
+        Standalone.ldd_result_cache.clear()
+
+    def _fakeGetBinaryPathDLLsPosix(self, dll_filename, package_name, original_dir):
+        # Unused for the fake, pylint: disable=unused-argument
+        self.calls.append(dll_filename)
+
+        return set(self.used_dlls.get(dll_filename, ()))
+
+    def _detect(self, dll_filename):
+        return Standalone._detectBinaryPathDLLsPosix(
+            dll_filename=dll_filename, package_name=None, original_dir=None
+        )
+
+    def testCycle(self):
+        self.used_dlls = {
+            "binary": ("libA.so",),
+            "libA.so": ("libB.so",),
+            "libB.so": ("libA.so",),
+        }
+
+        self.assertEqual(self._detect("binary"), set(("libA.so", "libB.so")))
+        self.assertEqual(sorted(self.calls), ["binary", "libA.so", "libB.so"])
+
+    def testSelfCycle(self):
+        self.used_dlls = {"libA.so": ("libA.so", "libB.so")}
+
+        self.assertEqual(self._detect("libA.so"), set(("libA.so", "libB.so")))
+        self.assertEqual(sorted(self.calls), ["libA.so", "libB.so"])
+
+    def testLongChain(self):
+        # Like "ldd" does, every DLL reports all DLLs it uses indirectly too.
+        names = ["lib%d.so" % count for count in range(40)]
+
+        self.used_dlls = dict(
+            (name, names[count + 1 :]) for count, name in enumerate(names)
+        )
+
+        self.assertEqual(self._detect(names[0]), set(names[1:]))
+        self.assertEqual(len(self.calls), len(names))
+
+    def testCached(self):
+        self.used_dlls = {"binary": ("libA.so",), "libA.so": ("libB.so",)}
+
+        self._detect("binary")
+        self.calls = []
+
+        self.assertEqual(self._detect("binary"), set(("libA.so", "libB.so")))
+        self.assertEqual(self.calls, [])
@@ -0,0 +1,257 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Unit tests for plugins using records of training runs of the program. """
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from nuitka import Options
+from nuitka.plugins.standard.ImportTracePlugin import NuitkaPluginImportTrace
+from nuitka.plugins.standard.ModuleProfilePlugin import (
+    NuitkaPluginModuleProfile,
+)
+from nuitka.utils.ModuleNames import ModuleName
+
+
+class FakeModule(object):
+    def __init__(self, full_name):
+        self.full_name = ModuleName(full_name)
+
+    def getFullName(self):
+        return self.full_name
+
+
+class TrainingRunTestBase(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+
+        os.chdir(self.test_dir)
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+
+        shutil.rmtree(self.test_dir)
+
+    def _writeFile(self, filename, contents):
+        with open(os.path.join(self.test_dir, filename), "w") as output_file:
+            output_file.write(contents)
+
+    def _runTraining(self, plugin, main_code):
+        """Run the recording code of the plugin, with the main code after it.
+
+        This is done from another directory, like compiled programs are run
+        from anywhere.
+        """
+
+        record_code, _reason = plugin.createPreModuleLoadCode(FakeModule("__main__"))
+
+        self._writeFile("training_main.py", record_code + "\n" + main_code)
+
+        run_dir = os.path.join(self.test_dir, "run")
+        if not os.path.exists(run_dir):
+            os.mkdir(run_dir)
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = self.test_dir
+
+        subprocess.check_call(
+            [sys.executable, os.path.join(self.test_dir, "training_main.py")],
+            cwd=run_dir,
+            env=env,
+        )
+
+    def _checkOptionErrors(self, plugin_class, **other_args):
+        self.assertRaises(SystemExit, plugin_class, None, None, **other_args)
+        self.assertRaises(SystemExit, plugin_class, "record", "use", **other_args)
+
+        # Unreadable record files are reported too.
+        self.assertRaises(SystemExit, plugin_class, None, "missing", **other_args)
+
+
+class ModuleProfileTest(TrainingRunTestBase):
+    @staticmethod
+    def _makePlugin(record=None, use=None):
+        return NuitkaPluginModuleProfile(
+            module_profile_record=record,
+            module_profile_use=use,
+            min_calls=100,
+            min_import_ms=20,
+        )
+
+    def testOptions(self):
+        self._checkOptionErrors(NuitkaPluginModuleProfile, min_calls=1, min_import_ms=1)
+
+    def testRecordFilename(self):
+        plugin = self._makePlugin(record="profile.json")
+
+        # Compiled programs run from other directories, so the record
+        # filename must be absolute.
+        self.assertEqual(
+            plugin.record_filename, os.path.join(os.getcwd(), "profile.json")
+        )
+
+        self.assertIs(plugin.createPreModuleLoadCode(FakeModule("other")), None)
+
+        record_code, _reason = plugin.createPreModuleLoadCode(FakeModule("__main__"))
+        self.assertIn(repr(plugin.record_filename), record_code)
+
+        # Recording builds include everything else as bytecode.
+        self.assertEqual(
+            plugin.decideCompilation(ModuleName("some_module"), None), "bytecode"
+        )
+        self.assertIs(plugin.decideCompilation(ModuleName("__main__"), None), None)
+
+    def testProfile(self):
+        self._writeFile(
+            "called_module.py",
+            """\
+def f():
+    pass
+""",
+        )
+        self._writeFile(
+            "slow_module.py",
+            """\
+import time
+
+end = time.time() + 0.05
+while time.time() < end:
+    pass
+
+import cold_module
+""",
+        )
+        self._writeFile("cold_module.py", "")
+
+        main_code = """\
+import called_module, slow_module
+
+for _i in range(60):
+    called_module.f()
+"""
+
+        # Profiles of several runs add up.
+        plugin = self._makePlugin(record="profile.json")
+        self._runTraining(plugin, main_code)
+        self._runTraining(plugin, main_code)
+
+        with open("profile.json") as profile_file:
+            profile = json.load(profile_file)
+
+        self.assertEqual(profile["called_module"]["calls"], 120)
+        self.assertEqual(profile["called_module"]["imports"], 2)
+        self.assertEqual(profile["cold_module"]["imports"], 2)
+
+        # Nested imports do not count for the importing module.
+        self.assertTrue(profile["slow_module"]["import_time"] >= 0.1)
+        self.assertTrue(profile["cold_module"]["import_time"] < 0.1)
+
+        plugin = self._makePlugin(use="profile.json")
+
+        def decide(module_name):
+            return plugin.decideCompilation(ModuleName(module_name), None)
+
+        self.assertIs(decide("called_module"), None)
+        self.assertIs(decide("slow_module"), None)
+        self.assertEqual(decide("cold_module"), "bytecode")
+        self.assertEqual(decide("never_imported"), "bytecode")
+        self.assertIs(decide("__main__"), None)
+
+
+class FakeOptions(object):
+    follow_modules = []
+    include_modules = ["included_module"]
+    include_packages = ["included_package"]
+
+
+class ImportTraceTest(TrainingRunTestBase):
+    def setUp(self):
+        TrainingRunTestBase.setUp(self)
+
+        self.original_options = Options.options
+        Options.options = FakeOptions()
+
+    def tearDown(self):
+        Options.options = self.original_options
+
+        TrainingRunTestBase.tearDown(self)
+
+    def testOptions(self):
+        self._checkOptionErrors(NuitkaPluginImportTrace)
+
+    def testRecordFilename(self):
+        plugin = NuitkaPluginImportTrace(
+            import_trace_record="trace.json", import_trace_use=None
+        )
+
+        self.assertEqual(
+            plugin.record_filename, os.path.join(os.getcwd(), "trace.json")
+        )
+
+        record_code, _reason = plugin.createPreModuleLoadCode(FakeModule("__main__"))
+        self.assertIn(repr(plugin.record_filename), record_code)
+
+    def testTrace(self):
+        self._writeFile("imported_module.py", "")
+        self._writeFile("other_module.py", "")
+        self._writeFile("never_imported_module.py", "")
+
+        # Traces of several runs are merged.
+        plugin = NuitkaPluginImportTrace(
+            import_trace_record="trace.json", import_trace_use=None
+        )
+        self._runTraining(plugin, "import imported_module")
+        self._runTraining(plugin, "import other_module")
+
+        with open("trace.json") as trace_file:
+            trace = json.load(trace_file)
+
+        self.assertIn("imported_module", trace)
+        self.assertIn("other_module", trace)
+        self.assertNotIn("never_imported_module", trace)
+
+        plugin = NuitkaPluginImportTrace(
+            import_trace_record=None, import_trace_use="trace.json"
+        )
+
+        def encounter(module_name):
+            return plugin.onModuleEncounter(
+                module_filename=module_name + ".py",
+                module_name=ModuleName(module_name),
+                module_kind="py",
+            )
+
+        self.assertIs(encounter("imported_module"), None)
+        self.assertIs(encounter("other_module"), None)
+        self.assertEqual(encounter("never_imported_module")[0], False)
+
+        # Modules asked for explicitly are included anyway.
+        self.assertIs(encounter("included_module"), None)
+        self.assertIs(encounter("included_package.sub"), None)
+
+        self.assertEqual(
+            list(plugin.excluded_modules), [ModuleName("never_imported_module")]
+        )
@@ -0,0 +1,71 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+""" Unit tests for what names in trusted type annotations refer to. """
+
+import ast
+import sys
+import unittest
+
+from nuitka.tree import ReformulationFunctionStatements
+
+
+@unittest.skipIf(sys.version_info < (3,), "Annotations need Python3")
+class TrustedAnnotationNameTest(unittest.TestCase):
+    def _getTypeName(self, module_source, annotation):
+        bindings = ReformulationFunctionStatements._getModuleBindings(
+            ast.parse(module_source)
+        )
+
+        ReformulationFunctionStatements._module_bindings.append(bindings)
+
+        try:
+            return ReformulationFunctionStatements._getTrustedAnnotationTypeName(
+                ast.parse(annotation, mode="eval").body
+            )
+        finally:
+            ReformulationFunctionStatements._module_bindings.pop()
+
+    def testBuiltinNames(self):
+        self.assertEqual(self._getTypeName("", "int"), "int")
+        self.assertEqual(self._getTypeName("", "list[int]"), "list")
+        self.assertEqual(self._getTypeName("", "'str'"), "str")
+        self.assertIs(self._getTypeName("", "float"), None)
+
+    def testReboundBuiltinNames(self):
+        self.assertIs(self._getTypeName("int = bool", "int"), None)
+        self.assertIs(self._getTypeName("def f(list): pass", "list"), None)
+        self.assertIs(self._getTypeName("from os import *", "int"), None)
+
+    def testTypingNames(self):
+        self.assertEqual(self._getTypeName("import typing", "typing.List"), "list")
+        self.assertEqual(
+            self._getTypeName("from typing import Dict", "Dict[str, int]"), "dict"
+        )
+        self.assertEqual(
+            self._getTypeName("from typing import Set as S", "S[int]"), "set"
+        )
+
+    def testOtherNames(self):
+        self.assertIs(self._getTypeName("", "List"), None)
+        self.assertIs(
+            self._getTypeName("from collections import deque as List", "List"), None
+        )
+        self.assertIs(self._getTypeName("import os as typing", "typing.List"), None)
+        self.assertIs(
+            self._getTypeName("import typing\ntyping = None", "typing.List"), None
+        )
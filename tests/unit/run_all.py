@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+""" Runner for unit tests of Nuitka internals.
+
+These do not compile anything, but use parts of Nuitka directly with the
+Python running them, and fake what is expensive or depends on the system.
+
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import unittest
+
+# Find nuitka package relative to us.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+    ),
+)
+
+# isort:start
+
+import nuitka.Options
+
+# Nodes insist on options being parsed, and defaults will do.
+nuitka.Options.is_fullcompat = False
+
+
+def main():
+    test_dir = os.path.dirname(os.path.abspath(__file__))
+
+    sys.path.insert(0, test_dir)
+
+    suite = unittest.TestSuite()
+
+    for filename in sorted(os.listdir(test_dir)):
+        if not filename.endswith(".py") or filename == "run_all.py":
+            continue
+
+        if len(sys.argv) > 1 and filename[:-3] not in sys.argv[1:]:
+            continue
+
+        suite.addTests(unittest.defaultTestLoader.loadTestsFromName(filename[:-3]))
+
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+
+    sys.exit(0 if result.wasSuccessful() else 1)
+
+
+if __name__ == "__main__":
+    main()